@@ -0,0 +1,223 @@
+"""
+A small microbenchmark harness.
+
+Register variants of the same task with @benchmark_case, then run_benchmarks
+sweeps them over input sizes (1e3 to 1e8 by default):
+
+    @benchmark_case("double_plus_one", "list", setup=lambda n: (list(range(n)),))
+    def double_plus_one_list(values):
+        return [x * 2 + 1 for x in values]
+
+For every case and size the harness times with time.perf_counter_ns, after
+warmup calls, and repeats until the 95% confidence interval of the mean is
+within `rel_ci` of it (or the time budget runs out). Very fast calls are run
+in batches so every sample is long enough for the clock. The tracemalloc peak
+of one extra call is recorded separately, because tracing slows everything down.
+
+Sizes whose time or memory, extrapolated from the previous size, would blow the
+budget are skipped rather than run.
+"""
+
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_SIZES = [10 ** power for power in range(3, 9)]   # 1e3 ... 1e8
+
+# {"double_plus_one": {"list": {"run": fn, "setup": fn, "max_size": None}, "numpy": {...}}}
+benchmark_registry: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+# Two-sided 95% Student t quantiles by degrees of freedom (1.96 beyond 30)
+_T_95 = {1: 12.71, 2: 4.30, 3: 3.18, 4: 2.78, 5: 2.57, 6: 2.45, 7: 2.36, 8: 2.31, 9: 2.26,
+         10: 2.23, 12: 2.18, 15: 2.13, 20: 2.09, 25: 2.06, 30: 2.04}
+
+
+def benchmark_case(group: str, variant: str, setup: Callable[[int], tuple],
+                   max_size: Optional[int] = None) -> Callable:
+    """
+    Register the decorated function as `variant` of benchmark `group`.
+    setup(size) builds its arguments (not timed); max_size caps the sweep for slow variants.
+    """
+    def register(func):
+        benchmark_registry.setdefault(group, {})[variant] = {"run": func, "setup": setup, "max_size": max_size}
+        return func
+    return register
+
+
+def _t_quantile(degrees_of_freedom: int) -> float:
+    if degrees_of_freedom > 30:
+        return 1.96
+    # Round down to the nearest tabulated value: a slightly wider, safer interval
+    usable = [df for df in _T_95 if df <= degrees_of_freedom]
+    return _T_95[max(usable)] if usable else _T_95[1]
+
+
+def time_call(func: Callable, args: tuple, warmup: int = 3, min_repeats: int = 5, max_repeats: int = 200,
+              rel_ci: float = 0.05, max_seconds: float = 2.0, min_sample_ns: int = 200_000) -> Dict[str, Any]:
+    """Time func(*args): nanoseconds per call, with the 95% confidence interval of the mean"""
+    budget_end = time.perf_counter_ns() + int(max_seconds * 1e9)
+
+    # Warmup doubles as calibration: how many calls make one sample long enough?
+    single_ns = None
+    for _ in range(max(warmup, 1)):
+        start = time.perf_counter_ns()
+        func(*args)
+        elapsed = time.perf_counter_ns() - start
+        single_ns = elapsed if single_ns is None else min(single_ns, elapsed)
+        if time.perf_counter_ns() > budget_end - int(max_seconds * 0.8e9):
+            break   # Slow call: don't spend the whole budget warming up
+    loops = max(1, math.ceil(min_sample_ns / max(single_ns, 1)))
+
+    samples = []
+    while len(samples) < max_repeats:
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            func(*args)
+        samples.append((time.perf_counter_ns() - start) / loops)
+
+        if len(samples) >= min(min_repeats, max_repeats):
+            mean = statistics.fmean(samples)
+            half_width = _t_quantile(len(samples) - 1) * statistics.stdev(samples) / math.sqrt(len(samples))
+            if half_width <= rel_ci * mean:
+                break
+        if len(samples) >= 2 and time.perf_counter_ns() > budget_end:
+            break
+
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+    half_width = _t_quantile(len(samples) - 1) * stdev / math.sqrt(len(samples)) if len(samples) > 1 else math.inf
+    return {
+        "mean_ns": mean,
+        "median_ns": statistics.median(samples),
+        "min_ns": min(samples),
+        "stdev_ns": stdev,
+        "ci95_ns": half_width,
+        "repeats": len(samples),
+        "loops": loops,
+        "converged": half_width <= rel_ci * mean,
+    }
+
+
+def _traced_peak(func: Callable, *args) -> tuple:
+    """(result, bytes allocated at the peak of one call) - NumPy reports its buffers to tracemalloc too"""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = func(*args)
+        return result, tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+def run_benchmarks(groups: Optional[List[str]] = None, sizes: Optional[List[int]] = None,
+                   max_seconds: float = 2.0, max_memory_bytes: int = 2 * 1024 ** 3,
+                   rel_ci: float = 0.05, verbose: bool = True) -> Dict[str, Any]:
+    """Sweep every registered variant of `groups` (default: all) over `sizes`"""
+    sizes = sizes or DEFAULT_SIZES
+    results = []
+
+    for group in groups or list(benchmark_registry):
+        for variant, case in benchmark_registry[group].items():
+            previous = None
+            for size in sizes:
+                row = {"group": group, "variant": variant, "size": size}
+
+                skip_reason = None
+                if case["max_size"] is not None and size > case["max_size"]:
+                    skip_reason = f"above max_size {case['max_size']:,}"
+                elif previous is not None:
+                    growth = size / previous["size"]
+                    if previous["mean_ns"] * growth * 3 > max_seconds * 1e9:
+                        skip_reason = "over the time budget"
+                    elif (previous["setup_bytes"] + previous["peak_bytes"]) * growth > max_memory_bytes:
+                        skip_reason = "over the memory budget"
+                if skip_reason:
+                    results.append({**row, "skipped": skip_reason})
+                    if verbose:
+                        print(f"   ⏭️  {group}/{variant} @ {size:,}: skipped ({skip_reason})")
+                    continue
+
+                args, setup_bytes = _traced_peak(case["setup"], size)
+                _, peak_bytes = _traced_peak(case["run"], *args)
+                timing = time_call(case["run"], args, max_seconds=max_seconds, rel_ci=rel_ci)
+                del args
+
+                row.update(timing, setup_bytes=setup_bytes, peak_bytes=peak_bytes)
+                results.append(row)
+                previous = row
+                if verbose:
+                    print(f"   ⏱️  {group}/{variant} @ {size:,}: {_format_ns(timing['mean_ns'])} "
+                          f"± {_format_ns(timing['ci95_ns'])}")
+
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "rel_ci": rel_ci,
+        "results": results,
+        "speedups": _speedups(results),
+    }
+
+
+def _speedups(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """For each group and size: how many times faster each variant is than the slowest one"""
+    timed = {}
+    for row in results:
+        if "mean_ns" in row:
+            timed.setdefault((row["group"], row["size"]), {})[row["variant"]] = row["mean_ns"]
+
+    speedups = []
+    for (group, size), variants in timed.items():
+        if len(variants) < 2:
+            continue
+        slowest = max(variants.values())
+        for variant, mean_ns in variants.items():
+            speedups.append({"group": group, "size": size, "variant": variant, "speedup": slowest / mean_ns})
+    return speedups
+
+
+def _format_ns(nanoseconds: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if nanoseconds >= scale:
+            return f"{nanoseconds / scale:.2f} {unit}"
+    return f"{nanoseconds:.0f} ns"
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def print_benchmark_table(report: Dict[str, Any]) -> None:
+    print(f"\n{'Benchmark':<28}{'Size':>13}{'Mean':>12}{'± 95% CI':>12}{'Runs':>6}{'Peak mem':>11}{'Speedup':>9}")
+    print("-" * 91)
+    speedups = {(row["group"], row["size"], row["variant"]): row["speedup"] for row in report["speedups"]}
+    for row in report["results"]:
+        name = f"{row['group']}/{row['variant']}"
+        if "skipped" in row:
+            print(f"{name:<28}{row['size']:>13,}   skipped: {row['skipped']}")
+            continue
+        speedup = speedups.get((row["group"], row["size"], row["variant"]))
+        print(f"{name:<28}{row['size']:>13,}{_format_ns(row['mean_ns']):>12}"
+              f"{_format_ns(row['ci95_ns']):>12}{row['repeats']:>6}{_format_bytes(row['peak_bytes']):>11}"
+              f"{(f'{speedup:.1f}x' if speedup else ''):>9}{'' if row['converged'] else ' ~'}")
+    if any("converged" in row and not row["converged"] for row in report["results"]):
+        print("~ confidence interval still wider than requested when the time budget ran out")
+
+
+def save_benchmark_report(report: Dict[str, Any], filename: str) -> None:
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"💾 Benchmark report written to {filename}")
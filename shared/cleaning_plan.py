@@ -0,0 +1,224 @@
+"""
+Cleaning rules for DataFrame columns, applied in one pass per column.
+
+A step-by-step cleaning script - fillna, then .loc[mask] = value for each bad range,
+then replace, then pd.to_numeric - scans a column once per step and often copies it
+too. A cleaning plan lists every rule per column:
+
+    {"age": [{"rule": "fill", "value": "median"},
+             {"rule": "below", "limit": 16, "value": "median"},
+             {"rule": "above", "limit": 30, "value": "median"}],
+     "major": [{"rule": "map", "mapping": {"Bio": "Biology"}}]}
+
+apply_cleaning_plan then visits each column once:
+
+- numeric columns in cache-sized blocks: each block is read once, every rule is
+  applied to it in order, and it is written once. Fill values that are statistics
+  ("mean", "median" of the values no rule touched) are gathered in the same pass and
+  written afterwards, to just the rows that need them;
+- text columns are factorized once, the rules run on the distinct values only, and
+  the column is rebuilt with a single take. Categoricals only have their categories
+  rewritten.
+
+The frame itself is not copied: inplace=False works on a shallow copy, and under
+copy-on-write the cleaned columns replace the old ones without touching the
+original frame. Every rule reports how many values it changed.
+
+Rules, in the order given:
+    fill        missing values (and "" in text columns) -> value
+    to_numeric  text -> numbers, anything unparseable becomes missing (as pd.to_numeric(errors="coerce"))
+    below/above values below/above limit -> value
+    map         text values in mapping -> their replacements
+    require     text values not containing pattern -> value
+A numeric value may be "mean" or "median".
+"""
+
+from typing import Any, Dict, List, Optional
+
+from shared.lazy_imports import lazy_import
+
+np = lazy_import("numpy")   # Importing this module doesn't load NumPy yet
+
+BLOCK_SIZE = 64 * 1024   # Elements per block: 512 KB of float64 stays in cache
+RULES = {"fill", "to_numeric", "below", "above", "map", "require"}
+NUMERIC_RULES = {"to_numeric", "below", "above"}
+TEXT_RULES = {"map", "require"}
+STATISTICS = {"mean", "median"}
+
+
+def _label(rule: Dict[str, Any]) -> str:
+    if rule["rule"] in ("below", "above"):
+        return f"{rule['rule']} {rule['limit']}"
+    if rule["rule"] == "require":
+        return f"require '{rule['pattern']}'"
+    return rule["rule"]
+
+
+def compile_cleaning_plan(plan: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Check every rule of a plan and work out what kind of column each one needs"""
+    compiled = {}
+    for column, rules in plan.items():
+        kinds = {rule.get("rule") for rule in rules}
+        if not kinds <= RULES:
+            raise ValueError(f"Unknown cleaning rule(s) for {column}: {sorted(map(str, kinds - RULES))}")
+        if kinds & NUMERIC_RULES and kinds & TEXT_RULES:
+            raise ValueError(f"{column} mixes numeric and text rules")
+        for rule in rules:
+            if rule["rule"] in ("fill", "below", "above", "require") and "value" not in rule:
+                raise ValueError(f"{_label(rule)} on {column} needs a value")
+            if isinstance(rule.get("value"), str) and rule["value"] in STATISTICS and kinds & TEXT_RULES:
+                raise ValueError(f"{column}: {rule['value']} only fills numeric columns")
+            if isinstance(rule.get("value"), str) and rule["value"] not in STATISTICS and kinds & NUMERIC_RULES:
+                raise ValueError(f"{column}: a numeric value must be a number, 'mean' or 'median'")
+        compiled[column] = {"rules": [dict(rule, label=_label(rule)) for rule in rules],
+                            "numeric": bool(kinds & NUMERIC_RULES)}
+    return compiled
+
+
+def _block_reader(series):
+    """A function giving rows [start, stop) of a numeric column as float64 (NaN where missing)"""
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy(copy=False)
+        return lambda start, stop: values[start:stop]
+    array = series.array   # Nullable (masked) or Arrow-backed numbers
+    return lambda start, stop: array[start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _clean_numeric(series, rules: List[Dict[str, Any]], statistics: Dict[str, float],
+                   block_size: int) -> Dict[str, Any]:
+    pd = lazy_import("pandas")
+    counts = [0] * len(rules)
+    if any(rule["rule"] == "to_numeric" for rule in rules) and not pd.api.types.is_numeric_dtype(series.dtype):
+        missing_before = int(series.isna().sum())
+        series = pd.to_numeric(series, errors="coerce")
+        counts[[rule["rule"] for rule in rules].index("to_numeric")] = int(series.isna().sum()) - missing_before
+
+    # Statistics not given up front are gathered from the values no rule changes
+    wanted = {rule["value"] for rule in rules if isinstance(rule.get("value"), str)} - set(statistics)
+    total, valid_count, valid_blocks = 0.0, 0, []
+    deferred = {name: [] for name in wanted}
+
+    size = len(series)
+    read = _block_reader(series)
+    out = np.empty(size, dtype=np.float64)
+    low, high, missing = np.inf, -np.inf, 0
+    for start in range(0, size, block_size):
+        block = out[start:start + block_size]
+        np.copyto(block, read(start, start + block.size), casting="unsafe")
+        changed = np.zeros(block.size, dtype=bool)
+        for position, rule in enumerate(rules):
+            if rule["rule"] == "fill":
+                mask = np.isnan(block)
+            elif rule["rule"] == "below":
+                mask = block < rule["limit"]
+            elif rule["rule"] == "above":
+                mask = block > rule["limit"]
+            else:
+                continue
+            counts[position] += int(np.count_nonzero(mask))
+            changed |= mask
+            value = rule["value"]
+            if isinstance(value, str) and value not in statistics:
+                deferred[value].append(np.flatnonzero(mask) + start)
+                value = np.nan   # Written once the statistic is known; later rules skip it
+            else:
+                value = statistics.get(value, value)
+            block[mask] = value
+
+        if wanted:
+            valid = block[~changed]
+            valid = valid[~np.isnan(valid)]
+            total += float(valid.sum())
+            valid_count += valid.size
+            if "median" in wanted:
+                valid_blocks.append(valid)
+        missing += int(np.count_nonzero(np.isnan(block)))
+        if block.size:
+            low, high = min(low, float(np.fmin.reduce(block))), max(high, float(np.fmax.reduce(block)))
+
+    found = {}
+    if "mean" in wanted:
+        found["mean"] = total / valid_count if valid_count else np.nan
+    if "median" in wanted:
+        found["median"] = float(np.median(np.concatenate(valid_blocks))) if valid_count else np.nan
+    for name, positions in deferred.items():
+        positions = np.concatenate(positions) if positions else np.empty(0, dtype=np.intp)
+        out[positions] = found[name]
+        if positions.size and not np.isnan(found[name]):
+            missing -= positions.size
+            low, high = min(low, found[name]), max(high, found[name])
+
+    return {"values": out, "counts": counts, "statistics": {**statistics, **found}, "missing": missing,
+            "min": low if size - missing else np.nan, "max": high if size - missing else np.nan}
+
+
+def _clean_text(series, rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+    pd = lazy_import("pandas")
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    # The distinct values plus a last slot for missing ones, which code -1 picks out
+    current = pd.Series(np.append(np.asarray(uniques, dtype=object), None), dtype=object)
+    frequencies = np.bincount(codes + 1, minlength=len(uniques) + 1)
+    frequencies = np.append(frequencies[1:], frequencies[0])
+
+    counts = []
+    for rule in rules:
+        if rule["rule"] == "fill":
+            mask = current.isna() | (current == "")
+            current[mask] = rule["value"]
+        elif rule["rule"] == "map":
+            mask = current.isin(list(rule["mapping"]))
+            current[mask] = current[mask].map(rule["mapping"])
+        elif rule["rule"] == "require":
+            mask = ~current.str.contains(rule["pattern"], regex=False, na=False)
+            current[mask] = rule["value"]
+        counts.append(int(frequencies[mask.to_numpy()].sum()))
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Only the categories change; the codes are remapped in one take
+        lookup, categories = pd.factorize(current, use_na_sentinel=True)
+        values = pd.Categorical.from_codes(lookup[codes], categories=categories)
+    else:
+        values = pd.array(current.to_numpy(), dtype=series.dtype).take(codes)
+    return {"values": values, "counts": counts, "missing": int(frequencies[current.isna().to_numpy()].sum())}
+
+
+def apply_cleaning_plan(df, plan, statistics: Optional[Dict[str, Dict[str, float]]] = None,
+                        inplace: bool = False, block_size: int = BLOCK_SIZE):
+    """
+    Clean the columns of `plan` (raw or compiled), each in one pass. statistics={"age":
+    {"median": 20.0}} supplies fill values instead of computing them from this frame,
+    e.g. from quantile sketches of all chunks. Returns (cleaned frame, report), where
+    the report has each rule's count and each column's missing values, min and max.
+    """
+    if not all(isinstance(entry, dict) and "numeric" in entry for entry in plan.values()):
+        plan = compile_cleaning_plan(plan)
+    missing_columns = [column for column in plan if column not in df.columns]
+    if missing_columns:
+        raise KeyError(f"Columns not in the frame: {', '.join(missing_columns)}")
+
+    pd = lazy_import("pandas")
+    # A shallow copy shares every column with df; the cleaned ones are then swapped in
+    target = df if inplace else df.copy(deep=False)
+    report = {}
+    for column, entry in plan.items():
+        text_rules = any(rule["rule"] in TEXT_RULES for rule in entry["rules"])
+        if entry["numeric"] or (pd.api.types.is_numeric_dtype(df[column].dtype) and not text_rules):
+            result = _clean_numeric(df[column], entry["rules"], dict((statistics or {}).get(column, {})), block_size)
+        else:
+            result = _clean_text(df[column], entry["rules"])
+        target[column] = result.pop("values")
+        result["rules"] = {rule["label"]: count for rule, count in zip(entry["rules"], result.pop("counts"))}
+        report[column] = result
+    return target, report
+
+
+def print_cleaning_report(report: Dict[str, Dict[str, Any]]) -> None:
+    print("🧹 Cleaning plan results (one pass per column):")
+    for column, result in report.items():
+        rules = ", ".join(f"{label}: {count:,}" for label, count in result["rules"].items())
+        print(f"   {column:<14}{rules}")
+        filled = {name: value for name, value in result.get("statistics", {}).items() if value == value}
+        if filled:
+            print(f"   {'':<14}filled with " + ", ".join(f"{name} {value:.2f}" for name, value in filled.items()))
+    print(f"   Changed {sum(sum(result['rules'].values()) for result in report.values()):,} values "
+          f"in {len(report)} columns")
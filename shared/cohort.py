@@ -0,0 +1,117 @@
+"""
+Synthetic student cohorts of any size, reproducible chunk by chunk.
+
+np.random.seed + np.random.randint draw from one global stream, which can't be
+split across processes, and produce int64 scores (8 bytes for a number below 100).
+generate_cohort instead:
+
+- spawns one independent stream per chunk of students from a single SeedSequence,
+  so a chunk comes out the same whichever process makes it, in whatever order;
+- draws uint8 scores straight into .npy files opened as memory maps, one chunk at
+  a time, so a 100M-student cohort never has to fit in RAM.
+
+The same seed and chunk_size always give the same cohort, whatever max_workers is.
+"""
+
+import os
+import time
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
+from shared.lazy_imports import lazy_import
+
+np = lazy_import("numpy")   # Importing this module doesn't load NumPy yet
+
+TEST_SCORE_RANGE = (50, 100)        # [low, high), as in day 7's create_sample_data
+ASSIGNMENT_SCORE_RANGE = (60, 90)
+DEFAULT_CHUNK_STUDENTS = 1_000_000   # 5 MB of uint8 scores per chunk with 2 tests + 3 assignments
+COHORT_FILES = {"test_scores": "test_scores.npy", "assignment_scores": "assignment_scores.npy"}
+
+
+def plan_chunks(num_students: int, seed: int = 47,
+                chunk_size: int = DEFAULT_CHUNK_STUDENTS) -> List[Tuple[int, int, "np.random.SeedSequence"]]:
+    """(start, stop, seed sequence) for every chunk of students"""
+    starts = range(0, num_students, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    return [(start, min(start + chunk_size, num_students), chunk_seed) for start, chunk_seed in zip(starts, seeds)]
+
+
+def _fill_chunk(arrays: Dict[str, "np.ndarray"], start: int, stop: int, chunk_seed) -> None:
+    rng = np.random.default_rng(chunk_seed)
+    for name, (low, high) in (("test_scores", TEST_SCORE_RANGE), ("assignment_scores", ASSIGNMENT_SCORE_RANGE)):
+        rows = arrays[name][start:stop]
+        rows[...] = rng.integers(low, high, size=rows.shape, dtype=np.uint8)
+
+
+def load_cohort(directory: str, mode: str = "r") -> Dict[str, "np.memmap"]:
+    """Memory-map the score matrices of a cohort written by generate_cohort"""
+    return {name: np.load(os.path.join(directory, filename), mmap_mode=mode)
+            for name, filename in COHORT_FILES.items()}
+
+
+def _write_chunk(directory: str, start: int, stop: int, chunk_seed) -> int:
+    """Worker process: fill rows [start, stop) of the cohort files"""
+    arrays = load_cohort(directory, mode="r+")
+    _fill_chunk(arrays, start, stop, chunk_seed)
+    for array in arrays.values():
+        array.flush()
+    return stop - start
+
+
+def generate_cohort(num_students: int, num_tests: int = 2, num_assignments: int = 3, seed: int = 47,
+                    directory: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_STUDENTS,
+                    max_workers: Optional[int] = 1) -> Dict[str, "np.ndarray"]:
+    """
+    uint8 test and assignment score matrices for num_students students.
+    directory=None builds them in memory; otherwise they are written to
+    <directory>/test_scores.npy and assignment_scores.npy and returned as read-only
+    memory maps. max_workers > 1 (None = one per CPU) fills chunks in a process pool.
+    """
+    shapes = {"test_scores": (num_students, num_tests), "assignment_scores": (num_students, num_assignments)}
+    chunks = plan_chunks(num_students, seed, chunk_size)
+
+    if directory is None:
+        arrays = {name: np.empty(shape, dtype=np.uint8) for name, shape in shapes.items()}
+        for chunk in chunks:
+            _fill_chunk(arrays, *chunk)
+        return arrays
+
+    os.makedirs(directory, exist_ok=True)
+    for name, shape in shapes.items():
+        # Writes the .npy header and sizes the file; the scores are filled in below
+        np.lib.format.open_memmap(os.path.join(directory, COHORT_FILES[name]), mode="w+",
+                                  dtype=np.uint8, shape=shape).flush()
+
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+    if workers <= 1:
+        for start, stop, chunk_seed in chunks:
+            _write_chunk(directory, start, stop, chunk_seed)
+    else:
+        # Imported here: multiprocessing is slow to import and only this branch needs it
+        from concurrent.futures import ProcessPoolExecutor
+
+        starts, stops, seeds = zip(*chunks)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_write_chunk, repeat(directory), starts, stops, seeds))
+
+    return load_cohort(directory)
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python -m shared.cohort cohort_dir --students 100000000 [--seed 47] [--workers 8]
+    arguments = sys.argv[1:]
+    settings = {"--students": 1_000_000, "--seed": 47, "--workers": 1, "--chunk": DEFAULT_CHUNK_STUDENTS}
+    for flag in settings:
+        if flag in arguments:
+            position = arguments.index(flag)
+            settings[flag] = int(arguments[position + 1])
+            del arguments[position:position + 2]
+
+    start_time = time.perf_counter()
+    cohort = generate_cohort(settings["--students"], seed=settings["--seed"], directory=arguments[0],
+                             chunk_size=settings["--chunk"], max_workers=settings["--workers"] or None)
+    size = sum(array.nbytes for array in cohort.values())
+    print(f"🎲 {settings['--students']:,} students ({size / 1024 ** 2:,.1f} MB of uint8 scores) "
+          f"written to {arguments[0]} in {time.perf_counter() - start_time:.2f}s")
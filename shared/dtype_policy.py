@@ -0,0 +1,134 @@
+"""
+Compact dtypes for score arrays, with reductions that don't overflow.
+
+Grades from 0 to 100 fit in uint8 (1 byte) and averages of them in float32 (4 bytes),
+yet NumPy defaults to int64 and float64 (8 bytes each). The policy:
+
+- store whole-number scores as uint8 (a wider integer only if they don't fit) and
+  fractional ones - averages, final scores - as float32: compact_array;
+- accumulate in wide types: sums in int64/float64 (a uint8 sum wraps at 256, a
+  float32 one drifts once it passes 2**24), means and standard deviations in float64;
+- do element-wise arithmetic in a wide type too, then compact the result: score_add.
+
+memory_report shows what the compact arrays save against NumPy's defaults.
+
+DataFrame columns follow the same idea with pandas' own dtypes: nullable UInt8 /
+Float32 for scores with missing values (instead of float64 with NaN), categoricals
+for columns with few distinct values, and Arrow-backed strings for free text when
+pyarrow is installed (string_dtype). frame_memory_report compares two frames with
+memory_usage(deep=True), which counts every Python string object.
+"""
+
+import importlib.util
+from typing import Any, Dict
+
+from shared.lazy_imports import lazy_import
+
+np = lazy_import("numpy")   # Importing this module doesn't load NumPy yet
+
+SCORE_DTYPE = "uint8"          # Whole-number scores 0-255
+AVERAGE_DTYPE = "float32"      # Averages and other fractional scores (~7 significant digits)
+WIDE_INT_DTYPE = "int64"       # Integer accumulation
+WIDE_FLOAT_DTYPE = "float64"   # Floating-point accumulation
+
+
+def compact_dtype(values) -> "np.dtype":
+    """The dtype the policy stores `values` in"""
+    values = np.asarray(values)
+    if values.dtype.kind in "biu":
+        if values.size == 0:
+            return np.dtype(SCORE_DTYPE)
+        low, high = int(values.min()), int(values.max())
+        if 0 <= low and high <= 255:
+            return np.dtype(SCORE_DTYPE)
+        return np.result_type(np.min_scalar_type(low), np.min_scalar_type(high))
+    if values.dtype.kind == "f":
+        return np.dtype(AVERAGE_DTYPE)
+    return values.dtype
+
+
+def compact_array(values) -> "np.ndarray":
+    """`values` as a NumPy array in its compact dtype (no copy if it already is one)"""
+    values = np.asarray(values)
+    return values.astype(compact_dtype(values), copy=False)
+
+
+def wide_dtype(values) -> "np.dtype":
+    """The dtype to accumulate `values` in"""
+    return np.dtype(WIDE_INT_DTYPE if np.asarray(values).dtype.kind in "biu" else WIDE_FLOAT_DTYPE)
+
+
+def score_sum(values, axis=None):
+    return np.sum(values, axis=axis, dtype=wide_dtype(values))
+
+
+def score_mean(values, axis=None):
+    return np.mean(values, axis=axis, dtype=WIDE_FLOAT_DTYPE)
+
+
+def score_std(values, axis=None):
+    return np.std(values, axis=axis, dtype=WIDE_FLOAT_DTYPE)
+
+
+def score_add(values, amount) -> "np.ndarray":
+    """values + amount computed without wrapping around, then stored compactly again"""
+    values = np.asarray(values)
+    wide = wide_dtype(values) if float(amount).is_integer() else np.dtype(WIDE_FLOAT_DTYPE)
+    return compact_array(np.add(values, amount, dtype=wide))
+
+
+def string_dtype() -> str:
+    """pandas dtype for free text: Arrow-backed if pyarrow is installed, else pandas' own string dtype"""
+    return "string[pyarrow]" if importlib.util.find_spec("pyarrow") else "string"
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:,.0f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GB"
+
+
+def _totals(rows) -> Dict[str, Any]:
+    total = sum(row["bytes"] for row in rows)
+    default_total = sum(row["default_bytes"] for row in rows)
+    return {
+        "arrays": rows,
+        "bytes": total,
+        "default_bytes": default_total,
+        "saved_bytes": default_total - total,
+        "ratio": default_total / total if total else 1.0,
+    }
+
+
+def memory_report(arrays: Dict[str, Any]) -> Dict[str, Any]:
+    """Bytes of each array against the same data in NumPy's default int64/float64"""
+    rows = []
+    for name, array in arrays.items():
+        array = np.asarray(array)
+        if array.dtype.kind not in "biuf":
+            continue
+        default = np.dtype(WIDE_INT_DTYPE if array.dtype.kind in "biu" else WIDE_FLOAT_DTYPE)
+        rows.append({"name": name, "dtype": str(array.dtype), "bytes": int(array.nbytes),
+                     "default_dtype": str(default), "default_bytes": int(array.size * default.itemsize)})
+    return _totals(rows)
+
+
+def print_memory_report(report: Dict[str, Any]) -> None:
+    print(f"💾 Memory with compact dtypes:")
+    width = max([9] + [len(row["dtype"]) + 2 for row in report["arrays"]])
+    for row in report["arrays"]:
+        print(f"   {row['name']:<20}{row['dtype']:>{width}}{_format_bytes(row['bytes']):>12}"
+              f"   ({row['default_dtype']}: {_format_bytes(row['default_bytes'])})")
+    print(f"   Total: {_format_bytes(report['bytes'])} instead of {_format_bytes(report['default_bytes'])} - "
+          f"{report['ratio']:.1f}x smaller, {_format_bytes(report['saved_bytes'])} saved")
+
+
+def frame_memory_report(before, after) -> Dict[str, Any]:
+    """Deep memory of each column of two DataFrames with the same columns, e.g. before and after compacting"""
+    before_bytes, after_bytes = before.memory_usage(deep=True, index=False), after.memory_usage(deep=True, index=False)
+    rows = [{"name": name, "dtype": str(after[name].dtype), "bytes": int(after_bytes[name]),
+             "default_dtype": str(before[name].dtype), "default_bytes": int(before_bytes[name])}
+            for name in after.columns]
+    return _totals(rows)
@@ -0,0 +1,327 @@
+"""
+Fast, import-free answers to "what is installed here?".
+
+Libraries are located with importlib.util.find_spec and versioned from the
+installed package metadata, so nothing gets imported. Versions and whole
+environment reports are cached on disk per interpreter:
+
+- a cheap stat() of the site-packages folders tells us if anything changed;
+- if it did, the dist-info folder listing tells us *which* distributions
+  changed, and only libraries coming from those are looked up again.
+
+Run `python -m shared.environment --json` (from the repo root) for a JSON
+report that inventory jobs can consume; `--refresh` ignores the cache.
+"""
+
+import datetime
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache")
+# Both files can be moved with environment variables (e.g. onto a shared volume)
+VERSION_CACHE_FILE = os.environ.get("ML_VERSION_CACHE", os.path.join(CACHE_DIR, "ml_journey_versions.json"))
+REPORT_CACHE_FILE = os.environ.get("ML_ENV_REPORT_CACHE", os.path.join(CACHE_DIR, "ml_journey_env_report.json"))
+
+DEFAULT_REPORT_LIBRARIES = [
+    'os', 'sys', 'json', 'datetime', 'random',
+    'numpy', 'pandas', 'matplotlib', 'requests'
+]
+
+_top_level_distributions = None   # {"sklearn": ["scikit-learn"]}, built once per process
+
+
+def probe_library(library: str) -> Dict[str, Any]:
+    """Find out if a library could be imported, without actually importing it"""
+    try:
+        spec = importlib.util.find_spec(library)
+    except ModuleNotFoundError:
+        return {"status": "Not installed", "importable": False}
+    except (ImportError, ValueError) as e:
+        # find_spec imports parent packages for dotted names ("sklearn.linear_model"),
+        # so a broken parent shows up here
+        return {"status": f"Error: {e}", "importable": False}
+
+    if spec is None:
+        return {"status": "Not installed", "importable": False}
+    return {"status": "Available", "importable": True, "location": spec.origin or "Namespace package"}
+
+
+def deep_check_library(library: str, timeout: int = 60) -> Dict[str, Any]:
+    """Really import a library, but in a fresh Python process so our own process stays clean"""
+    try:
+        # The name goes in as an argument, never pasted into the code we run
+        completed = subprocess.run([sys.executable, "-c", "import importlib, sys; importlib.import_module(sys.argv[1])",
+                                    library],
+                                   capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"status": f"Error: import took longer than {timeout}s", "importable": False}
+
+    if completed.returncode == 0:
+        return {"status": "Available", "importable": True}
+
+    last_line = (completed.stderr.strip().splitlines() or ["unknown error"])[-1]
+    if last_line.startswith("ModuleNotFoundError"):
+        return {"status": "Not installed", "importable": False}
+    return {"status": f"Error: {last_line}", "importable": False}
+
+
+# Runs in the child process: baseline first, then time and measure the one import
+_IMPORT_COST_SCRIPT = """
+import importlib, os, sys, time
+
+def resident_bytes():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource   # Peak rather than current RSS, close enough for one import
+        except ImportError:
+            return None       # Windows
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+modules_before, rss_before = len(sys.modules), resident_bytes()
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - start
+rss_after = resident_bytes()
+modules_after = len(sys.modules)
+import json   # Only now, or measuring "json" would find it already loaded
+print(json.dumps({"seconds": seconds, "modules": modules_after - modules_before,
+                  "rss_bytes": None if rss_before is None else rss_after - rss_before}))
+"""
+
+
+def measure_import_cost(library: str, timeout: int = 60) -> Dict[str, Any]:
+    """
+    Import time, resident memory added and modules pulled in by importing `library`
+    in a fresh Python process (cold for the interpreter, not necessarily for the disk cache).
+    """
+    try:
+        completed = subprocess.run([sys.executable, "-c", _IMPORT_COST_SCRIPT, library],
+                                   capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"library": library, "ok": False, "error": f"import took longer than {timeout}s"}
+
+    if completed.returncode != 0:
+        last_line = (completed.stderr.strip().splitlines() or ["unknown error"])[-1]
+        return {"library": library, "ok": False, "error": last_line}
+
+    cost = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {"library": library, "ok": True, **cost}
+
+
+def measure_import_costs(libraries: List[str], max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """measure_import_cost for several libraries, one subprocess each, several at a time"""
+    # Threads only wait on the child processes, so the imports run in parallel
+    workers = max_workers or max(1, min(len(libraries), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(libraries, pool.map(measure_import_cost, libraries)))
+
+
+def _normalize(name: str) -> str:
+    """'Scikit-Learn' and 'scikit_learn' are the same distribution"""
+    return name.lower().replace("-", "_").replace(".", "_")
+
+
+def _site_folders() -> List[str]:
+    return [os.path.abspath(path) for path in sys.path
+            if os.path.basename(path) in ("site-packages", "dist-packages") and os.path.isdir(path)]
+
+
+def _site_mtimes() -> Dict[str, int]:
+    """Modification time of each site-packages folder; (un)installing a package changes it"""
+    return {path: os.stat(path).st_mtime_ns for path in _site_folders()}
+
+
+def installed_distributions() -> Dict[str, str]:
+    """{"scikit_learn": "scikit_learn-1.5.0.dist-info"} from a plain listing of site-packages"""
+    distributions = {}
+    for folder in _site_folders():
+        for entry in os.listdir(folder):
+            for suffix in (".dist-info", ".egg-info"):
+                if entry.endswith(suffix):
+                    # "zope.interface-6.0.dist-info" -> "zope_interface"
+                    distributions.setdefault(_normalize(entry[:-len(suffix)].split("-")[0]), entry)
+    return distributions
+
+
+def distributions_fingerprint(distributions: Dict[str, str]) -> str:
+    """One hash that changes whenever any distribution is added, removed or upgraded"""
+    digest = hashlib.sha256(sys.version.encode())
+    for entry in sorted(distributions.values()):
+        digest.update(entry.encode())
+    return digest.hexdigest()
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    """Write atomically so two runs (or two threads) at once can't leave half a file behind"""
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # One temp file per writer: threads of one process share the pid
+        temp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(temp_file, path)
+    except OSError as e:
+        # stderr, so `--json` output on stdout stays parseable
+        print(f"⚠️  Could not save cache {path}: {e}", file=sys.stderr)
+
+
+def _refresh_version_entry(entry: Dict[str, Any]) -> None:
+    """Forget only the versions that came from distributions that changed since last time"""
+    global _top_level_distributions
+
+    versions, sources = entry.setdefault("versions", {}), entry.setdefault("sources", {})
+    site_mtimes = _site_mtimes()
+    if entry.get("site_mtimes") == site_mtimes:
+        return
+
+    old = entry.get("distributions", {})
+    new = installed_distributions()
+    changed = {name for name in set(old) | set(new) if old.get(name) != new.get(name)}
+
+    for library in list(versions):
+        # Missing libraries are looked up again too: they may have just been installed
+        if versions[library] is None or sources.get(library) in changed:
+            versions.pop(library)
+            sources.pop(library, None)
+
+    entry["site_mtimes"], entry["distributions"] = site_mtimes, new
+    if changed:
+        _top_level_distributions = None
+
+
+def _resolve_version(library: str) -> Tuple[Optional[str], Optional[str]]:
+    """(version, distribution it came from) from the package metadata, without importing"""
+    global _top_level_distributions
+
+    top_level = library.split('.')[0]
+    if top_level in sys.stdlib_module_names or top_level in sys.builtin_module_names:
+        return "Built-in", None
+
+    # Import names and pip names differ (sklearn -> scikit-learn), so map one to the other
+    if _top_level_distributions is None:
+        _top_level_distributions = importlib.metadata.packages_distributions()
+
+    for distribution in _top_level_distributions.get(top_level, []) + [library]:
+        try:
+            return importlib.metadata.version(distribution), _normalize(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None, None
+
+
+def _cached_versions(library_list: List[str]) -> Tuple[Dict[str, Optional[str]], Set[str]]:
+    """Versions for library_list plus the set of libraries that had to be looked up again"""
+    cache = _read_json(VERSION_CACHE_FILE)
+    entry = cache.get(sys.executable)
+    if not isinstance(entry, dict):
+        entry = cache[sys.executable] = {}
+    before = entry.get("site_mtimes")
+    _refresh_version_entry(entry)
+
+    versions, sources = entry["versions"], entry["sources"]
+    resolved = {library for library in library_list if library not in versions}
+    for library in resolved:
+        versions[library], sources[library] = _resolve_version(library)
+
+    if resolved or entry["site_mtimes"] != before:
+        _write_json(VERSION_CACHE_FILE, cache)
+    return {library: versions[library] for library in library_list}, resolved
+
+
+def library_versions(library_list: List[str]) -> Dict[str, Optional[str]]:
+    """Versions for many libraries at once: {"numpy": "2.1.0", "json": "Built-in", "nope": None}"""
+    return _cached_versions(library_list)[0]
+
+
+def build_environment_report(library_list: List[str] = None, refresh: bool = False) -> Dict[str, Any]:
+    """
+    Environment report as a plain dict (JSON-ready), served from the report cache when
+    the interpreter, its prefix and the installed distributions are all unchanged.
+    """
+    library_list = list(library_list or DEFAULT_REPORT_LIBRARIES)
+    key = {"executable": sys.executable, "prefix": sys.prefix, "site_mtimes": _site_mtimes()}
+    cache = _read_json(REPORT_CACHE_FILE)
+    previous = cache.get(sys.executable, {}) if not refresh else {}
+    previous_report = previous.get("report", {})
+
+    # Cheapest check first: nothing in site-packages was touched at all
+    if previous.get("key") == key and previous_report.get("checked") == library_list:
+        return {**previous_report, "from_cache": True}
+
+    distributions = installed_distributions()
+    fingerprint = distributions_fingerprint(distributions)
+    if previous_report.get("fingerprint") == fingerprint and previous_report.get("checked") == library_list \
+            and previous.get("key", {}).get("prefix") == sys.prefix:
+        cache[sys.executable] = {"key": key, "report": previous_report}
+        _write_json(REPORT_CACHE_FILE, cache)
+        return {**previous_report, "from_cache": True}
+
+    # Something changed: only libraries whose version had to be looked up again get re-probed
+    versions, resolved = _cached_versions(library_list)
+    old_libraries = previous_report.get("libraries", {})
+    libraries = {}
+    for library in library_list:
+        if library in old_libraries and library not in resolved and not refresh:
+            libraries[library] = old_libraries[library]
+            continue
+        probe = probe_library(library)
+        libraries[library] = {"available": probe["importable"], "version": versions[library],
+                              "location": probe.get("location")}
+
+    available = sum(1 for info in libraries.values() if info["available"])
+    report = {
+        "python_version": sys.version.split()[0],
+        "executable": sys.executable,
+        "prefix": sys.prefix,
+        "os": os.name,
+        "platform": sys.platform,
+        "fingerprint": fingerprint,
+        "distributions": len(distributions),
+        "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "checked": library_list,
+        "libraries": libraries,
+        "total": len(library_list),
+        "available": available,
+        "missing": len(library_list) - available,
+    }
+    cache[sys.executable] = {"key": key, "report": report}
+    _write_json(REPORT_CACHE_FILE, cache)
+    return {**report, "from_cache": False}
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    refresh = "--refresh" in arguments
+    libraries = [arg for arg in arguments if not arg.startswith("--")] or None
+    report = build_environment_report(libraries, refresh=refresh)
+
+    if "--json" in arguments:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Python {report['python_version']} ({report['executable']})")
+        for name, info in report["libraries"].items():
+            version = info['version'] or 'Version not available' if info['available'] else 'Not installed'
+            print(f"   {'✅' if info['available'] else '❌'} {name}: {version}")
+        print(f"{report['available']}/{report['total']} available"
+              f"{' (cached)' if report['from_cache'] else ''}")
@@ -0,0 +1,205 @@
+"""
+Fused element-wise expressions over large arrays, evaluated block by block.
+
+`np.round(scores / 10) * 10` is three passes over memory. Each step reads a full
+array and writes a new full-size temporary, so on 1e8 scores most of the time goes
+to moving 800 MB temporaries rather than to the arithmetic. evaluate_expression
+takes the same chain as a string:
+
+    evaluate_expression("round(x / 10) * 10", x=scores)
+
+It compiles the string once into a list of ufunc calls, each writing into a scratch
+buffer through `out=`. A buffer is reused as soon as the value in it is no longer
+needed. The calls then run over cache-sized blocks of the inputs, so every input is
+read once and the result written once, whatever the length of the chain.
+
+Arithmetic is done in float64 on each block, as NumPy does for these operations on
+integer scores. The result is float64 (bool for comparisons) unless `dtype` or `out`
+asks for something else, e.g. uint8 for whole-number scores.
+"""
+
+import ast
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from shared.lazy_imports import lazy_import
+
+np = lazy_import("numpy")   # Importing this module doesn't load NumPy yet
+
+BLOCK_SIZE = 64 * 1024   # Elements per block: a few 512 KB float64 scratch buffers stay in cache
+
+BINARY_OPERATORS = {ast.Add: "add", ast.Sub: "subtract", ast.Mult: "multiply", ast.Div: "divide",
+                    ast.FloorDiv: "floor_divide", ast.Mod: "remainder", ast.Pow: "power",
+                    ast.BitAnd: "logical_and", ast.BitOr: "logical_or"}
+COMPARISONS = {ast.Lt: "less", ast.LtE: "less_equal", ast.Gt: "greater", ast.GtE: "greater_equal",
+               ast.Eq: "equal", ast.NotEq: "not_equal"}
+FUNCTIONS = {"sqrt": "sqrt", "log": "log", "log10": "log10", "exp": "exp", "abs": "absolute",
+             "floor": "floor", "ceil": "ceil", "round": "round", "minimum": "minimum",
+             "maximum": "maximum", "clip": "clip", "where": "where"}
+BOOLEAN_RESULTS = {"less", "less_equal", "greater", "greater_equal", "equal", "not_equal",
+                   "logical_and", "logical_or", "logical_not"}
+
+# An operand is ("const", value), ("reg", register) or, before allocation, ("tmp", temporary)
+Operand = Tuple[str, Any]
+
+
+class _Compiler:
+    """Turns an expression's syntax tree into ufunc steps on numbered temporaries"""
+
+    def __init__(self, constants: Dict[str, float]):
+        self.constants = constants
+        self.steps: List[Dict[str, Any]] = []
+        self.loads: Dict[str, Operand] = {}
+
+    def emit(self, function: str, args: List[Operand], boolean: bool = False) -> Operand:
+        if all(kind == "const" for kind, _ in args):
+            # Nothing varies per element: work it out now
+            return ("const", _call(function, [value for _, value in args], None).item())
+        self.steps.append({"function": function, "args": args, "out": len(self.steps),
+                           "boolean": boolean or function in BOOLEAN_RESULTS})
+        return ("tmp", self.steps[-1]["out"])
+
+    def visit(self, node: ast.AST) -> Operand:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, bool)):
+            return ("const", node.value)
+        if isinstance(node, ast.Name):
+            if node.id in self.constants:
+                return ("const", self.constants[node.id])
+            if node.id not in self.loads:
+                self.loads[node.id] = self.emit("load", [("var", node.id)])
+            return self.loads[node.id]
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+            return self.emit(BINARY_OPERATORS[type(node.op)], [self.visit(node.left), self.visit(node.right)])
+        if isinstance(node, ast.BoolOp):
+            result = self.visit(node.values[0])
+            for value in node.values[1:]:
+                result = self.emit("logical_and" if isinstance(node.op, ast.And) else "logical_or",
+                                   [result, self.visit(value)])
+            return result
+        if isinstance(node, ast.UnaryOp):
+            operand = self.visit(node.operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            return self.emit("negative" if isinstance(node.op, ast.USub) else "logical_not", [operand])
+        if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in COMPARISONS:
+            return self.emit(COMPARISONS[type(node.ops[0])], [self.visit(node.left), self.visit(node.comparators[0])])
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS
+                and not node.keywords):
+            args = [self.visit(arg) for arg in node.args]
+            if node.func.id == "round" and len(args) == 2 and args[1][0] != "const":
+                raise ValueError("round()'s number of decimals must be a constant")
+            return self.emit(FUNCTIONS[node.func.id], args)
+        raise ValueError(f"Unsupported syntax in expression: {ast.unparse(node)}")
+
+
+def _allocate(steps: List[Dict[str, Any]]) -> List[bool]:
+    """Map temporaries onto as few scratch buffers as possible; returns each buffer's kind (True: bool)"""
+    last_use = {}
+    for position, step in enumerate(steps):
+        for kind, value in step["args"]:
+            if kind == "tmp":
+                last_use[value] = position
+    free: Dict[bool, List[int]] = {False: [], True: []}
+    registers, kinds = {}, []
+
+    for position, step in enumerate(steps):
+        # Once each: x * x uses one temporary twice, but its buffer must be freed only once
+        dying = list(dict.fromkeys(value for kind, value in step["args"]
+                                   if kind == "tmp" and last_use[value] == position))
+        # where() copies its "else" value into the output before the "then" value is read,
+        # so only the "else" buffer may be overwritten
+        early = dying if step["function"] != "where" else [value for value in dying if ("tmp", value) == step["args"][2]]
+        for value in early:
+            free[kinds[registers[value]]].append(registers[value])
+        if free[step["boolean"]]:
+            registers[step["out"]] = free[step["boolean"]].pop()
+        else:
+            registers[step["out"]] = len(kinds)
+            kinds.append(step["boolean"])
+        for value in dying:
+            if value not in early:
+                free[kinds[registers[value]]].append(registers[value])
+        step["args"] = [("reg", registers[value]) if kind == "tmp" else (kind, value) for kind, value in step["args"]]
+        step["out"] = registers[step["out"]]
+    return kinds
+
+
+@lru_cache(maxsize=128)
+def compile_expression(expression: str, constants: Tuple[Tuple[str, float], ...] = ()) -> Dict[str, Any]:
+    """
+    The steps of `expression` (names are arrays, except those in `constants`), the
+    scratch buffers they need and which operand holds the result. Cached per expression.
+    """
+    compiler = _Compiler(dict(constants))
+    result = compiler.visit(ast.parse(expression, mode="eval").body)
+    if result[0] == "tmp" and compiler.steps[result[1]]["function"] == "load":
+        result = compiler.emit("positive", [result])   # A bare name: copy it through the float64 buffer
+    boolean = result[0] == "tmp" and compiler.steps[result[1]]["boolean"]
+    registers = _allocate(compiler.steps)
+    if result[0] == "tmp":
+        result = ("reg", compiler.steps[result[1]]["out"])
+    return {"steps": compiler.steps, "registers": registers, "result": result,
+            "variables": list(compiler.loads), "boolean": boolean}
+
+
+def _call(function: str, args: List[Any], out) -> "np.ndarray":
+    if function == "round":
+        return np.round(args[0], int(args[1]) if len(args) > 1 else 0, out=out)
+    if function == "clip":
+        return np.clip(*args, out=out)
+    if function == "where":
+        if out is None:
+            return np.where(*args)
+        np.copyto(out, args[2])
+        np.copyto(out, args[1], where=np.asarray(args[0], dtype=bool))
+        return out
+    return getattr(np, function)(*args, out=out)
+
+
+def evaluate_expression(expression: str, out=None, dtype=None, block_size: int = BLOCK_SIZE,
+                        **variables) -> "np.ndarray":
+    """
+    Evaluate `expression` element-wise over the arrays (and scalars) given as keywords,
+    one block at a time: evaluate_expression("round(x / 10) * 10", x=scores).
+    Writes into `out` (e.g. a np.memmap) if given.
+    """
+    arrays = {name: np.asarray(value) for name, value in variables.items() if np.ndim(value) > 0}
+    constants = tuple(sorted((name, value.item() if hasattr(value, "item") else value)
+                             for name, value in variables.items() if name not in arrays))
+    program = compile_expression(expression, constants)
+    missing = [name for name in program["variables"] if name not in arrays]
+    if missing:
+        raise ValueError(f"No value given for {', '.join(missing)}")
+    if not program["variables"]:
+        raise ValueError("The expression needs at least one array")
+
+    shape = arrays[program["variables"][0]].shape
+    if any(arrays[name].shape != shape for name in program["variables"]):
+        raise ValueError("Every array in the expression must have the same shape")
+    inputs = {name: arrays[name].reshape(-1) for name in program["variables"]}
+    if out is None:
+        out = np.empty(shape, dtype=dtype or (np.bool_ if program["boolean"] else np.float64))
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+    elif not out.flags.c_contiguous:
+        # reshape(-1) would give a copy, and the result would never reach out
+        raise ValueError("out must be C-contiguous")
+    flat_out = out.reshape(-1)
+
+    size = flat_out.size
+    block_size = max(1, min(block_size, size))
+    scratch = [np.empty(block_size, dtype=np.bool_ if boolean else np.float64) for boolean in program["registers"]]
+
+    for start in range(0, size, block_size):
+        stop = min(start + block_size, size)
+        buffers = [buffer[:stop - start] for buffer in scratch]
+        for step in program["steps"]:
+            target = buffers[step["out"]]
+            if step["function"] == "load":
+                np.copyto(target, inputs[step["args"][0][1]][start:stop], casting="unsafe")
+                continue
+            args = [buffers[value] if kind == "reg" else value for kind, value in step["args"]]
+            _call(step["function"], args, target)
+        kind, value = program["result"]
+        flat_out[start:stop] = buffers[value] if kind == "reg" else value
+    return out
@@ -0,0 +1,29 @@
+"""
+Deferred imports for heavy libraries.
+
+`np = lazy_import("numpy")` checks that NumPy is installed (raising ImportError
+like a normal import if it is not) but only runs NumPy's own import the first
+time an attribute such as np.array is used. Scripts can then import each other
+for their functions without paying for pandas/NumPy until they actually need them.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return the module `name`, loading it on first attribute access"""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,101 @@
+"""
+Reductions over large score arrays, split across a thread pool.
+
+NumPy releases the GIL inside its loops, so threads reducing different chunks of
+one array run on different cores. reduce_scores cuts a 1-D array into cache-sized
+chunks and reduces each chunk in one task: count, sum, squared deviations, min,
+max, argmin/argmax and how many scores reach each band boundary. It then combines
+the partial results. Squared deviations are merged with Chan's formula
+(merge_moments) instead of adding up raw squares, which loses precision on
+large arrays.
+
+The thread count is the `threads` argument, else the ML_THREADS environment
+variable, else 1 (no pool).
+"""
+
+import math
+import os
+from typing import Any, Dict, Iterable, Optional
+
+from shared.lazy_imports import lazy_import
+from shared.score_stats import boundary_thresholds, merge_moments
+
+np = lazy_import("numpy")   # Importing this module doesn't load NumPy yet
+
+CHUNK_SIZE = 256 * 1024          # Elements per task: 2 MB of float64 fits a core's L2 cache
+PARALLEL_MIN_SIZE = 1024 * 1024  # Smaller arrays are reduced on the calling thread
+
+
+def resolve_threads(threads: Optional[int] = None) -> int:
+    """threads, else ML_THREADS, else 1"""
+    if threads:
+        return max(int(threads), 1)
+    setting = os.environ.get("ML_THREADS", "").strip()
+    return max(int(setting), 1) if setting.isdigit() else 1
+
+
+def _reduce_chunk(values: "np.ndarray", thresholds) -> Dict[str, Any]:
+    total = float(values.sum(dtype=np.float64))
+    deviations = np.subtract(values, total / values.size, dtype=np.float64)
+    return {
+        "count": int(values.size),
+        "sum": total,
+        "mean": total / values.size,
+        "m2": float(np.dot(deviations, deviations)),
+        "argmin": int(values.argmin()),
+        "argmax": int(values.argmax()),
+        # "Not below" rather than ">=": NaN reaches every boundary, as in band_scores and np.digitize
+        "at_least": [0 if threshold is None else values.size - int(np.count_nonzero(values < threshold))
+                     for threshold in thresholds],
+    }
+
+
+def reduce_scores(scores, boundaries: Iterable[float] = (), threads: Optional[int] = None,
+                  chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    count, sum, mean, std, min, max, argmin, argmax (first occurrence, like NumPy) and
+    band_counts (below boundaries[0], ..., at least boundaries[-1]) of a 1-D array.
+    """
+    values = np.asarray(scores).ravel()
+    if values.size == 0:
+        raise ValueError("reduce_scores needs at least one score")
+    boundaries = [float(boundary) for boundary in boundaries]
+    thresholds = boundary_thresholds(boundaries, values.dtype)
+    starts = range(0, values.size, chunk_size)
+
+    def reduce_chunk(start):
+        return _reduce_chunk(values[start:start + chunk_size], thresholds)
+
+    threads = resolve_threads(threads)
+    if threads <= 1 or values.size < PARALLEL_MIN_SIZE:
+        parts = [reduce_chunk(start) for start in starts]
+    else:
+        # Imported here: concurrent.futures is slow to import and only this branch needs it
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            parts = list(pool.map(reduce_chunk, starts))
+
+    moments = {"count": 0, "mean": 0.0, "m2": 0.0}
+    for part in parts:
+        moments = merge_moments(moments, part)
+    argmin = argmax = 0
+    for start, part in zip(starts, parts):
+        # Strict comparisons: on ties the earliest chunk wins, as the first occurrence does in NumPy
+        if values[start + part["argmin"]] < values[argmin]:
+            argmin = start + part["argmin"]
+        if values[start + part["argmax"]] > values[argmax]:
+            argmax = start + part["argmax"]
+    at_least = [sum(part["at_least"][position] for part in parts) for position in range(len(boundaries))]
+
+    return {
+        "count": moments["count"],
+        "sum": math.fsum(part["sum"] for part in parts),
+        "mean": moments["mean"],
+        "std": math.sqrt(moments["m2"] / moments["count"]),
+        "min": values[argmin].item(),
+        "max": values[argmax].item(),
+        "argmin": argmin,
+        "argmax": argmax,
+        "band_counts": [earlier - later for earlier, later in zip([moments["count"]] + at_least, at_least + [0])],
+    }
@@ -0,0 +1,145 @@
+"""
+Opt-in profiling for the pipeline functions.
+
+Set ML_PROFILE=1 before running a script and every function wrapped with
+@profiled (or block wrapped in `with profiled("name"):`) records wall time,
+CPU time, call counts and tracemalloc peak memory. At exit a report is printed
+and collapsed stacks are written to ML_PROFILE_OUTPUT (default: profile.folded),
+which flamegraph.pl, speedscope and inferno can read directly.
+
+With ML_PROFILE unset the decorator returns the original function untouched,
+so there is no overhead at all.
+"""
+
+import atexit
+import contextlib
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+PROFILE_ENABLED = os.environ.get("ML_PROFILE", "").strip().lower() not in ("", "0", "false", "no")
+PROFILE_OUTPUT = os.environ.get("ML_PROFILE_OUTPUT", "profile.folded")
+
+# {"safe_csv_reader": {"calls": 3, "wall": 1.2, "cpu": 1.1, "peak_bytes": 524288}}
+profile_stats: Dict[str, Dict[str, float]] = {}
+# {"comprehensive_data_pipeline;safe_csv_reader": 1200000}  (self time in microseconds)
+collapsed_stacks: Dict[str, int] = {}
+
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+@contextlib.contextmanager
+def _profile_block(name: str):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    stack = _stack()
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        # reset_peak() below wipes the parent's peak, so remember it first
+        stack[-1]["peak_seen"] = max(stack[-1]["peak_seen"], peak)
+    tracemalloc.reset_peak()
+
+    frame = {
+        "name": name,
+        "path": ";".join([f["name"] for f in stack] + [name]),
+        "start_memory": current,
+        "peak_seen": current,
+        "child_wall": 0.0,
+    }
+    stack.append(frame)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        absolute_peak = max(frame["peak_seen"], tracemalloc.get_traced_memory()[1])
+        stack.pop()
+        if stack:
+            stack[-1]["peak_seen"] = max(stack[-1]["peak_seen"], absolute_peak)
+            stack[-1]["child_wall"] += wall
+
+        with _lock:
+            stats = profile_stats.setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0, "peak_bytes": 0})
+            stats["calls"] += 1
+            stats["wall"] += wall
+            stats["cpu"] += cpu
+            stats["peak_bytes"] = max(stats["peak_bytes"], absolute_peak - frame["start_memory"])
+
+            self_us = int(max(wall - frame["child_wall"], 0.0) * 1_000_000)
+            collapsed_stacks[frame["path"]] = collapsed_stacks.get(frame["path"], 0) + self_us
+
+
+def profiled(target: Any = None, name: Optional[str] = None) -> Any:
+    """
+    Profile a function or a block of code.
+
+        @profiled
+        def safe_csv_reader(...): ...
+
+        with profiled("load step"):
+            ...
+    """
+    if isinstance(target, str):
+        return _profile_block(target) if PROFILE_ENABLED else contextlib.nullcontext()
+
+    if target is None:
+        return functools.partial(profiled, name=name)
+
+    func: Callable = target
+    if not PROFILE_ENABLED:
+        return func
+
+    label = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _profile_block(label):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def write_collapsed_stacks(filename: str = PROFILE_OUTPUT) -> None:
+    """Write `frame;frame;frame self_microseconds` lines for flame graph tools"""
+    with _lock:
+        lines = [f"{path} {value}\n" for path, value in sorted(collapsed_stacks.items()) if value > 0]
+    with open(filename, "w") as file:
+        file.writelines(lines)
+    print(f"🔥 Flame graph data written to {filename} ({len(lines)} stacks)")
+
+
+def print_profile_report() -> None:
+    """Show one line per profiled function, slowest first"""
+    with _lock:
+        rows = sorted(profile_stats.items(), key=lambda item: -item[1]["wall"])
+
+    print("\n⏱️  PROFILE REPORT")
+    print("=" * 78)
+    print(f"{'Function':<36}{'Calls':>7}{'Wall (s)':>11}{'CPU (s)':>11}{'Peak MB':>11}")
+    print("-" * 78)
+    for func_name, stats in rows:
+        print(f"{func_name[:35]:<36}{stats['calls']:>7}{stats['wall']:>11.4f}"
+              f"{stats['cpu']:>11.4f}{stats['peak_bytes'] / 1_048_576:>11.2f}")
+
+
+def _report_at_exit():
+    if profile_stats:
+        print_profile_report()
+        write_collapsed_stacks()
+
+
+if PROFILE_ENABLED:
+    atexit.register(_report_at_exit)
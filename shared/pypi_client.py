@@ -0,0 +1,250 @@
+"""
+A small PyPI metadata client: pooled, cached, concurrent, and usable offline.
+
+- One requests.Session per client, so connections to pypi.org are reused
+  (its pool is as large as the number of worker threads).
+- Every response is kept on disk with its ETag/Last-Modified headers. Fresh
+  entries (younger than max_age) are served without any request, older ones
+  are revalidated with If-None-Match/If-Modified-Since (a 304 costs no body).
+- fetch_many_packages fetches with at most max_workers requests in flight.
+- index="some/folder" swaps pypi.org for a folder of <name>.json files in the
+  same format (write_local_index builds one from the installed packages), so
+  everything works and can be tested without a network - or without requests.
+- Package names are checked and normalized (PEP 503: "Scikit_Learn" becomes
+  "scikit-learn") before they go into a URL or a file path.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+PYPI_URL = "https://pypi.org/pypi/{name}/json"
+PYPI_CACHE_DIR = os.environ.get(
+    "ML_PYPI_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "ml_journey_pypi"))
+NORMALIZED_NAME = re.compile(r"[a-z0-9]+(-[a-z0-9]+)*")   # PEP 503 normalized project name
+
+
+def normalize_package_name(name: str) -> Optional[str]:
+    """PEP 503 form of a project name ("Scikit_Learn" -> "scikit-learn"), or None if it isn't one"""
+    if not isinstance(name, str):
+        return None
+    normalized = re.sub(r"[-_.]+", "-", name).lower()
+    return normalized if NORMALIZED_NAME.fullmatch(normalized) else None
+
+
+def create_pypi_client(index: str = None, cache_dir: str = PYPI_CACHE_DIR, max_workers: int = 8,
+                       max_age: float = 300, timeout: float = 5, session=None) -> Dict[str, Any]:
+    """
+    Settings and connection pool for fetch_package_info / fetch_many_packages.
+    index=None talks to pypi.org, a folder path reads <name>.json files from it.
+    session: anything with requests.Session's get() (say a stub in tests) to use
+    instead of a new pooled Session.
+    """
+    client = {
+        "index": index,
+        "cache_dir": cache_dir,
+        "max_workers": max_workers,
+        "max_age": max_age,          # Seconds a cached answer is used without asking again
+        "timeout": timeout,
+        "session": session,
+        "stats": {"requests": 0, "not_modified": 0, "fresh_cache": 0, "errors": 0},
+        "lock": threading.Lock(),    # Worker threads share the stats counters
+    }
+
+    if index is None and session is None:
+        import requests   # Only the network mode needs it
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        session.mount("https://", adapter)
+        session.headers["Accept"] = "application/json"
+        client["session"] = session
+
+    return client
+
+
+def close_pypi_client(client: Dict[str, Any]) -> None:
+    if client["session"] is not None:
+        client["session"].close()
+
+
+def _count(client: Dict[str, Any], stat: str) -> None:
+    with client["lock"]:
+        client["stats"][stat] += 1
+
+
+def _cache_path(client: Dict[str, Any], name: str) -> Optional[str]:
+    if not client["cache_dir"]:
+        return None
+    # pypi.org and each local index get their own folder so answers never mix
+    source = "pypi" if client["index"] is None else \
+        "index_" + hashlib.sha1(os.path.abspath(client["index"]).encode()).hexdigest()[:12]
+    return os.path.join(client["cache_dir"], source, f"{name}.json")
+
+
+def _read_cache(client: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+    path = _cache_path(client, name)
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (TypeError, OSError, ValueError):
+        return None
+
+
+def _write_cache(client: Dict[str, Any], name: str, entry: Dict[str, Any]) -> None:
+    path = _cache_path(client, name)
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_file = f"{path}.{os.getpid()}.{id(entry)}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(entry, file)
+        os.replace(temp_file, path)
+    except OSError as e:
+        print(f"⚠️  Could not cache PyPI response for {name}: {e}")
+
+
+def _summarize(name: str, data: Dict[str, Any], source: str) -> Dict[str, Any]:
+    info = data.get("info", {})
+    return {
+        "name": info.get("name", name),
+        "version": info.get("version"),
+        "summary": info.get("summary") or "",
+        "author": info.get("author") or "",
+        "source": source,            # "network", "not_modified", "cache", "stale_cache" or "index"
+        "error": None,
+    }
+
+
+def _fetch_from_index(client: Dict[str, Any], name: str, cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The offline stand-in: file mtime plays the role of Last-Modified"""
+    path = os.path.join(client["index"], f"{name}.json")
+    try:
+        modified = os.stat(path).st_mtime_ns
+    except OSError:
+        return {"name": name, "source": "index", "error": "Package not found in local index"}
+
+    if cached and cached.get("index_mtime") == modified:
+        _count(client, "not_modified")
+        return _summarize(name, cached["data"], "not_modified")
+
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError) as e:
+        _count(client, "errors")
+        return {"name": name, "source": "index", "error": f"Bad index file: {e}"}
+
+    _count(client, "requests")
+    _write_cache(client, name, {"index_mtime": modified, "fetched_at": time.time(), "data": data})
+    return _summarize(name, data, "index")
+
+
+def _fetch_from_pypi(client: Dict[str, Any], name: str, cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        _count(client, "requests")
+        response = client["session"].get(PYPI_URL.format(name=name), headers=headers, timeout=client["timeout"])
+
+        if response.status_code == 304 and cached:
+            _count(client, "not_modified")
+            cached["fetched_at"] = time.time()
+            _write_cache(client, name, cached)
+            return _summarize(name, cached["data"], "not_modified")
+
+        if response.status_code == 404:
+            return {"name": name, "source": "network", "error": "Package not found on PyPI"}
+        response.raise_for_status()
+
+        data = response.json()
+        _write_cache(client, name, {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "data": data,
+        })
+        return _summarize(name, data, "network")
+
+    # requests' exceptions are OSErrors (and its JSON errors ValueErrors), so this
+    # catches them without importing requests
+    except (OSError, ValueError) as e:
+        _count(client, "errors")
+        if cached:
+            # Offline or PyPI having a bad moment: an old answer beats no answer
+            return _summarize(name, cached["data"], "stale_cache")
+        return {"name": name, "source": "network", "error": f"Request failed: {e}"}
+
+
+def fetch_package_info(client: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """{"name", "version", "summary", "author", "source", "error"} for one package"""
+    normalized = normalize_package_name(name)
+    if normalized is None:
+        return {"name": name, "source": "network" if client["index"] is None else "index",
+                "error": "Not a valid package name"}
+    name = normalized   # Safe in the URL and in file names from here on
+
+    cached = _read_cache(client, name)
+    if cached and client["index"] is None and time.time() - cached.get("fetched_at", 0) < client["max_age"]:
+        _count(client, "fresh_cache")
+        return _summarize(name, cached["data"], "cache")
+
+    if client["index"] is not None:
+        return _fetch_from_index(client, name, cached)
+    return _fetch_from_pypi(client, name, cached)
+
+
+def fetch_many_packages(client: Dict[str, Any], names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch several packages at once, never more than client["max_workers"] in flight"""
+    workers = max(1, min(client["max_workers"], len(names)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda name: fetch_package_info(client, name), names))
+    return dict(zip(names, results))
+
+
+def write_local_index(index_dir: str, distributions: List[str], overwrite: bool = False) -> List[str]:
+    """
+    Build an offline index from what is installed here: one PyPI-style <name>.json
+    per distribution (PEP 503 name), filled from its metadata. Returns the names
+    that were written.
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    written = []
+    for distribution in distributions:
+        normalized = normalize_package_name(distribution)
+        if normalized is None:
+            continue
+        path = os.path.join(index_dir, f"{normalized}.json")
+        if os.path.exists(path) and not overwrite:
+            continue
+        try:
+            metadata = importlib.metadata.metadata(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+
+        data = {
+            "info": {
+                "name": metadata["Name"],
+                "version": metadata["Version"],
+                "summary": metadata["Summary"],
+                "author": metadata["Author"] or metadata["Author-email"],
+                "home_page": metadata["Home-page"],
+            },
+        }
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2)
+        written.append(distribution)
+    return written
@@ -0,0 +1,158 @@
+"""
+A mergeable quantile sketch for data that is streamed or split across processes.
+
+np.percentile, Series.quantile and Series.median need the whole column in memory.
+This sketch (a stack of KLL-style compactors) keeps at most k sorted samples per
+level, where a sample on level h stands for 2**h values. A level that outgrows k
+keeps every other sample (odd or even ones, at random) and hands them up a level.
+Updates take whole NumPy arrays (one sort, then slicing), and sketches built in
+different processes merge level by level.
+
+Error bound: compacting a level of weight w shifts the rank of any value by at
+most w. The sketch adds these up in "rank_error", so a quantile it returns has a
+true rank within rank_error of the one asked for - sketch_error_bound() is that
+as a fraction of all values (roughly levels / k: about 0.1% for 1e8 values at
+the default k). The random offsets make typical errors far smaller. Until the first
+compaction everything is kept and the quantiles are exact, as np.percentile's.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+from shared.lazy_imports import lazy_import
+
+np = lazy_import("numpy")   # Importing this module doesn't load NumPy yet
+
+DEFAULT_K = 4096   # Samples per level: 32 KB each
+
+
+def create_quantile_sketch(k: int = DEFAULT_K, seed: Optional[int] = None) -> Dict[str, Any]:
+    return {"k": k, "count": 0, "min": math.inf, "max": -math.inf, "rank_error": 0,
+            "levels": [], "rng": np.random.default_rng(seed)}
+
+
+def _merge_sorted(first: "np.ndarray", second: "np.ndarray") -> "np.ndarray":
+    if first.size < second.size:
+        first, second = second, first
+    if second.size == 0:
+        return first
+    return np.insert(first, np.searchsorted(first, second), second)
+
+
+def _compact(sketch: Dict[str, Any]) -> None:
+    levels, k = sketch["levels"], sketch["k"]
+    height = 0
+    while height < len(levels):
+        level = levels[height]
+        if level.size > k:
+            paired = level.size - level.size % 2   # An odd sample out waits on this level
+            promoted = level[int(sketch["rng"].integers(2)):paired:2]
+            levels[height] = level[paired:].copy()
+            if height + 1 == len(levels):
+                levels.append(promoted.copy())
+            else:
+                levels[height + 1] = _merge_sorted(levels[height + 1], promoted)
+            sketch["rank_error"] += 2 ** height
+        height += 1
+
+
+def sketch_update(sketch: Dict[str, Any], values) -> Dict[str, Any]:
+    """Add an array of values (NaNs are skipped, as Series.quantile does)"""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    values = np.sort(values[~np.isnan(values)])
+    if values.size == 0:
+        return sketch
+    sketch["count"] += int(values.size)
+    sketch["min"] = min(sketch["min"], float(values[0]))
+    sketch["max"] = max(sketch["max"], float(values[-1]))
+    if sketch["levels"]:
+        sketch["levels"][0] = _merge_sorted(sketch["levels"][0], values)
+    else:
+        sketch["levels"].append(values)
+    _compact(sketch)
+    return sketch
+
+
+def merge_quantile_sketches(target: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold `other` into `target` (same k), e.g. sketches of partitions built in worker processes"""
+    if target["k"] != other["k"]:
+        raise ValueError("Only sketches with the same k can be merged")
+    for height, level in enumerate(other["levels"]):
+        if height == len(target["levels"]):
+            target["levels"].append(level.copy())
+        else:
+            target["levels"][height] = _merge_sorted(target["levels"][height], level)
+    target["count"] += other["count"]
+    target["rank_error"] += other["rank_error"]
+    target["min"] = min(target["min"], other["min"])
+    target["max"] = max(target["max"], other["max"])
+    _compact(target)
+    return target
+
+
+def sketch_quantiles(sketch: Dict[str, Any], quantiles):
+    """Values at the given quantiles (0-1), like Series.quantile; a scalar for a scalar"""
+    if sketch["count"] == 0:
+        raise ValueError("The sketch is empty")
+    requested = np.asarray(quantiles, dtype=np.float64)
+    if sketch["rank_error"] == 0:
+        # Nothing compacted yet: every value is still here
+        result = np.percentile(sketch["levels"][0], requested * 100)
+        return float(result) if result.ndim == 0 else result
+
+    samples = np.concatenate(sketch["levels"])
+    weights = np.concatenate([np.full(level.size, 2 ** height, dtype=np.int64)
+                              for height, level in enumerate(sketch["levels"])])
+    order = np.argsort(samples)
+    samples, cumulative = samples[order], np.cumsum(weights[order])
+    # The sample covering rank q * (count - 1), counting ranks from 0
+    positions = np.searchsorted(cumulative, requested * (sketch["count"] - 1), side="right")
+    result = samples[np.minimum(positions, samples.size - 1)]
+    result = np.where(requested <= 0, sketch["min"], np.where(requested >= 1, sketch["max"], result))
+    return float(result) if result.ndim == 0 else result
+
+
+def sketch_error_bound(sketch: Dict[str, Any]) -> float:
+    """Largest possible rank error of sketch_quantiles, as a fraction of the values seen"""
+    return sketch["rank_error"] / sketch["count"] if sketch["count"] else 0.0
+
+
+def sketch_from_chunks(chunks: Iterable, k: int = DEFAULT_K, seed: Optional[int] = None) -> Dict[str, Any]:
+    """A sketch of a stream of arrays, e.g. the chunks of a memory-mapped file"""
+    sketch = create_quantile_sketch(k, seed)
+    for chunk in chunks:
+        sketch_update(sketch, chunk)
+    return sketch
+
+
+def _sketch_partition(values, k: int, seed) -> Dict[str, Any]:
+    return sketch_update(create_quantile_sketch(k, seed), values)
+
+
+def sketch_partitions(partitions: List, k: int = DEFAULT_K, seed: Optional[int] = None,
+                      max_workers: Optional[int] = 1) -> Dict[str, Any]:
+    """
+    One sketch per partition (max_workers > 1, or None for one per CPU: in a process pool),
+    merged into one. Each partition gets its own random stream spawned from `seed`.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(partitions))
+    merged = create_quantile_sketch(k, seed)
+    if (max_workers or 2) <= 1 or len(partitions) <= 1:
+        for values, partition_seed in zip(partitions, seeds):
+            merge_quantile_sketches(merged, _sketch_partition(values, k, partition_seed))
+        return merged
+
+    # Imported here: multiprocessing is slow to import and only this branch needs it
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for sketch in pool.map(_sketch_partition, partitions, [k] * len(partitions), seeds):
+            merge_quantile_sketches(merged, sketch)
+    return merged
+
+
+def sketch_columns(partitions: List, columns: List[str], k: int = DEFAULT_K, seed: Optional[int] = None,
+                   max_workers: Optional[int] = 1) -> Dict[str, Dict[str, Any]]:
+    """{column: merged sketch} over DataFrame partitions (or chunks read with chunksize=)"""
+    return {column: sketch_partitions([partition[column] for partition in partitions], k, seed, max_workers)
+            for column in columns}
@@ -0,0 +1,393 @@
+"""
+Descriptive statistics for large score arrays in as few passes as possible.
+
+np.mean, np.median, np.std, np.min, np.max and np.percentile each walk the whole
+array, and median/percentile each copy and partition it. describe_scores instead:
+
+- partitions one copy once, on every index any order statistic needs
+  (min, max, median, percentiles), and reads them all off that;
+- gets mean and standard deviation from a single blocked pass: each cache-sized
+  block contributes its count, mean and squared deviations, merged with Chan's
+  formula (numerically stable, unlike sum of squares minus squared sum).
+
+Results match NumPy's defaults (linear percentiles, population std).
+
+describe_score_chunks gives the same summary for data that doesn't fit in memory
+(memory-mapped files, generated chunks), reading it a chunk at a time.
+"""
+
+import math
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypedDict
+
+from shared.lazy_imports import lazy_import
+from shared.quantile_sketch import create_quantile_sketch, sketch_quantiles, sketch_update
+
+np = lazy_import("numpy")   # Importing this module doesn't load NumPy yet
+
+BLOCK_SIZE = 64 * 1024   # Elements per block: 512 KB of float64 stays in cache
+COMPARISON_BANDING_LIMIT = 16   # More boundaries than this: np.digitize's binary search wins
+HISTOGRAM_BINS = 4096            # Bins per narrowing pass of describe_score_chunks
+MAX_CANDIDATES = 1 << 20         # Scores describe_score_chunks may hold to pick out one rank
+
+ScoreSummary = TypedDict("ScoreSummary", {
+    "count": int,
+    "mean": float,
+    "std": float,
+    "min": float,
+    "max": float,
+    "median": float,
+    "percentiles": Dict[float, float],
+})
+
+
+def merge_moments(first: Dict[str, float], second: Dict[str, float]) -> Dict[str, float]:
+    """Combine {"count", "mean", "m2"} of two parts (m2 = sum of squared deviations from the mean)"""
+    count = first["count"] + second["count"]
+    if count == 0:
+        return {"count": 0, "mean": 0.0, "m2": 0.0}
+    delta = second["mean"] - first["mean"]
+    return {
+        "count": count,
+        "mean": first["mean"] + delta * second["count"] / count,
+        "m2": first["m2"] + second["m2"] + delta * delta * first["count"] * second["count"] / count,
+    }
+
+
+def block_moments(values: "np.ndarray", block_size: int = BLOCK_SIZE) -> Dict[str, float]:
+    """Count, mean and m2 of a 1-D array, one cache-sized block at a time"""
+    moments = {"count": 0, "mean": 0.0, "m2": 0.0}
+    for start in range(0, values.size, block_size):
+        block = values[start:start + block_size]
+        block_mean = block.mean(dtype=np.float64)
+        # In float64 even for float32 scores: squaring in float32 loses digits on big arrays
+        deviations = np.subtract(block, block_mean, dtype=np.float64)
+        moments = merge_moments(moments, {"count": block.size, "mean": float(block_mean),
+                                          "m2": float(np.dot(deviations, deviations))})
+    return moments
+
+
+def select_ranks(values: "np.ndarray", ranks, low: int = 0, high: int = None) -> None:
+    """
+    Partition values in place so that each index in `ranks` (sorted) holds its sorted value.
+    One np.partition per rank on ever smaller slices - much faster than passing all ranks
+    to np.partition at once, which re-partitions nearly the whole array for each of them.
+    """
+    if not ranks:
+        return
+    high = values.size if high is None else high
+    middle = len(ranks) // 2
+    rank = ranks[middle]
+    values[low:high].partition(rank - low)
+    select_ranks(values, ranks[:middle], low, rank)
+    select_ranks(values, ranks[middle + 1:], rank + 1, high)
+
+
+def describe_scores(scores, percentiles: Iterable[float] = (25, 75),
+                    overwrite_input: bool = False) -> ScoreSummary:
+    """
+    count, mean, std, min, max, median and the given percentiles of `scores`.
+    overwrite_input=True partitions `scores` itself instead of a copy (saves memory,
+    scrambles the order of the caller's array).
+    """
+    values = np.asarray(scores).ravel()
+    if values.size == 0:
+        raise ValueError("describe_scores needs at least one score")
+    if values.dtype.kind not in "iuf":
+        values = values.astype(np.float64)
+
+    moments = block_moments(values)
+    return {
+        "count": int(values.size),
+        "mean": moments["mean"],
+        "std": float(np.sqrt(moments["m2"] / values.size)),
+        **order_statistics(values, percentiles, overwrite_input),
+    }
+
+
+def order_statistics(scores, percentiles: Iterable[float] = (25, 75), overwrite_input: bool = False) -> Dict[str, object]:
+    """min, max, median and percentiles of `scores` from one nested partition (see describe_scores)"""
+    percentiles = tuple(float(p) for p in percentiles)
+    values = np.asarray(scores).ravel()
+    if values.size == 0:
+        raise ValueError("order_statistics needs at least one score")
+
+    # Linear interpolation between the two ranks around each percentile, like np.percentile
+    last = values.size - 1
+    positions = {p: last * p / 100 for p in set(percentiles) | {50.0}}
+    selected = sorted({int(np.floor(position)) for position in positions.values()})
+
+    ordered = values if overwrite_input else values.copy()
+    select_ranks(ordered, selected)
+
+    def value_at(rank):
+        if rank in selected:
+            return float(ordered[rank])
+        # Everything between two selected ranks lies between their values, so the
+        # rank right after a selected one is the smallest value up to the next one
+        following = [other for other in selected if other > rank]
+        return float(ordered[rank:following[0] + 1 if following else None].min())
+
+    def order_statistic(p):
+        position = positions[p]
+        low = int(np.floor(position))
+        low_value = value_at(low)
+        if position == low:
+            return low_value
+        return low_value + (position - low) * (value_at(low + 1) - low_value)
+
+    return {
+        "min": float(ordered[:selected[0] + 1].min()),
+        "max": float(ordered[selected[-1]:].max()),
+        "median": order_statistic(50.0),
+        "percentiles": {p: order_statistic(p) for p in percentiles},
+    }
+
+
+def band_labels(boundaries) -> list:
+    """["<70", "70-80", "80-90", "≥90"] for boundaries [70, 80, 90]"""
+    edges = [f"{boundary:g}" for boundary in boundaries]
+    return [f"<{edges[0]}"] + [f"{low}-{high}" for low, high in zip(edges, edges[1:])] + [f"≥{edges[-1]}"]
+
+
+def boundary_thresholds(boundaries, dtype) -> list:
+    """
+    Each boundary as a scalar of `dtype` that the same scores reach (score >= threshold), or
+    None if no score of that dtype can. Comparing against these keeps compact arrays (uint8,
+    float32) from being upcast to float64 one comparison at a time.
+    """
+    dtype = np.dtype(dtype)
+    thresholds = []
+    for boundary in boundaries:
+        boundary = float(boundary)
+        if dtype.kind in "iu":
+            info = np.iinfo(dtype)
+            lowest = math.ceil(boundary)
+            thresholds.append(None if lowest > info.max else dtype.type(max(lowest, info.min)))
+        elif dtype.kind == "f":
+            threshold = dtype.type(boundary)
+            if threshold < boundary:   # Rounded down: the next value up is the first that reaches it
+                threshold = np.nextafter(threshold, dtype.type(math.inf))
+            thresholds.append(threshold)
+        else:
+            thresholds.append(boundary)
+    return thresholds
+
+
+def _assign_bands(values, boundaries, band_dtype, block_size: int = BLOCK_SIZE):
+    """(band number of every value, count per band), one cache-sized block at a time"""
+    bands = np.empty(values.size, dtype=band_dtype)
+    if boundaries.size > COMPARISON_BANDING_LIMIT:
+        for start in range(0, values.size, block_size):
+            bands[start:start + block_size] = np.digitize(values[start:start + block_size], boundaries)
+        return bands, np.bincount(bands, minlength=boundaries.size + 1)
+
+    # Band number = how many boundaries the score reaches. A few vectorized comparisons on
+    # a block already in cache beat digitize's binary search per score, and counting the
+    # True flags per boundary gives the band counts for free. "Reaches" is "is not below",
+    # so NaN reaches every boundary and lands in the last band, as it does with digitize
+    at_least = np.zeros(boundaries.size, dtype=np.int64)
+    thresholds = [threshold for threshold in boundary_thresholds(boundaries, values.dtype) if threshold is not None]
+    flags = np.empty(min(block_size, values.size), dtype=bool)
+    for start in range(0, values.size, block_size):
+        block = values[start:start + block_size]
+        block_bands = bands[start:start + block_size]
+        block_flags = flags[:block.size]
+        block_bands.fill(len(thresholds))
+        for position, threshold in enumerate(thresholds):
+            np.less(block, threshold, out=block_flags)
+            at_least[position] += block.size - np.count_nonzero(block_flags)
+            block_bands -= block_flags
+    counts = -np.diff(np.concatenate(([values.size], at_least, [0])))
+    return bands, counts
+
+
+def band_scores(scores, boundaries, return_indices: bool = False) -> Dict[str, object]:
+    """
+    Put every score in a band in one pass: band 0 is below boundaries[0], band i holds
+    boundaries[i-1] <= score < boundaries[i], the last band is ≥ boundaries[-1] (as np.digitize,
+    NaN included: it goes in the last band).
+    With return_indices=True the positions of the scores in each band come from one
+    stable sort of the band numbers, not from a mask per band.
+    """
+    boundaries = np.asarray(boundaries, dtype=np.float64)
+    if boundaries.ndim != 1 or boundaries.size == 0 or np.any(np.diff(boundaries) <= 0):
+        raise ValueError("boundaries must be a non-empty, strictly increasing list")
+
+    values = np.asarray(scores).ravel()
+    band_count = boundaries.size + 1
+    # Small band numbers: uint8 keeps the array 8x smaller than digitize's int64 and lets
+    # the stable argsort below use radix sort, which is linear
+    band_dtype = np.uint8 if band_count <= 256 else np.uint16 if band_count <= 65536 else np.intp
+    bands, counts = _assign_bands(values, boundaries, band_dtype)
+
+    result = {
+        "boundaries": boundaries.tolist(),
+        "labels": band_labels(boundaries.tolist()),
+        "counts": counts,
+        "bands": bands,
+    }
+    if return_indices:
+        order = np.argsort(bands, kind="stable")
+        result["indices"] = np.split(order, np.cumsum(counts)[:-1])
+    return result
+
+
+# =============================================================================
+# OUT-OF-CORE: SCORES READ ONE CHUNK AT A TIME
+# =============================================================================
+
+def _bin_numbers(values: "np.ndarray", edges: "np.ndarray") -> "np.ndarray":
+    """i with edges[i] <= value < edges[i + 1]: arithmetic on (nearly) even edges, then fixed up against them"""
+    last_bin = edges.size - 2
+    numbers = ((values - edges[0]) * ((last_bin + 1) / (edges[-1] - edges[0]))).astype(np.intp)
+    np.clip(numbers, 0, last_bin, out=numbers)
+    while True:   # Rounding puts a few values one bin off; a couple of rounds settle them
+        too_high = values < edges[numbers]
+        too_low = values >= edges[numbers + 1]
+        if not (too_high.any() or too_low.any()):
+            return numbers
+        numbers -= too_high
+        numbers += too_low
+
+
+def _window_values(chunk) -> "np.ndarray":
+    """
+    A chunk as float64 for the window tests. NumPy compares a float32 chunk with a Python
+    float in float32, where the bounds round: nextafter(max) falls back onto the max itself
+    and the top score would drop out of every window.
+    """
+    return np.asarray(chunk, dtype=np.float64).ravel()
+
+
+def _window_histograms(make_chunks, windows, bins: int) -> List[Dict[str, object]]:
+    """One pass: histogram, min and max of the scores inside each [low, high) window"""
+    plans = []
+    for low, high in windows:
+        edges = np.unique(np.linspace(low, high, bins + 1))
+        plans.append({"low": low, "high": high, "edges": edges, "counts": np.zeros(edges.size - 1, dtype=np.int64),
+                      "min": math.inf, "max": -math.inf})
+
+    for chunk in make_chunks():
+        chunk = _window_values(chunk)
+        for plan in plans:
+            inside = chunk[(chunk >= plan["low"]) & (chunk < plan["high"])]
+            if inside.size:
+                plan["counts"] += np.bincount(_bin_numbers(inside, plan["edges"]), minlength=plan["counts"].size)
+                plan["min"] = min(plan["min"], float(inside.min()))
+                plan["max"] = max(plan["max"], float(inside.max()))
+    return plans
+
+
+def _collect_windows(make_chunks, windows) -> List["np.ndarray"]:
+    """One pass: every score inside each [low, high) window"""
+    collected = [[] for _ in windows]
+    for chunk in make_chunks():
+        chunk = _window_values(chunk)
+        for parts, (low, high) in zip(collected, windows):
+            parts.append(chunk[(chunk >= low) & (chunk < high)])
+    return [np.concatenate(parts) for parts in collected]
+
+
+def select_ranks_in_chunks(make_chunks: Callable[[], Iterator["np.ndarray"]], ranks, low: float, high: float,
+                           bins: int = HISTOGRAM_BINS, max_candidates: int = MAX_CANDIDATES) -> Dict[int, float]:
+    """
+    {rank: value} of the sorted scores, given their min (low) and max (high), without sorting them.
+    Each pass histograms the window still holding a rank and narrows it to one bin; once a bin
+    holds at most max_candidates scores they are collected and partitioned.
+    """
+    if low == high:
+        return {rank: float(low) for rank in ranks}
+
+    values = {}
+    # Each rank's window [low, high) and how many scores lie below it
+    pending = {rank: (float(low), float(np.nextafter(high, math.inf)), 0) for rank in ranks}
+    while pending:
+        windows = sorted({(window_low, window_high) for window_low, window_high, _ in pending.values()})
+        plans = dict(zip(windows, _window_histograms(make_chunks, windows, bins)))
+
+        narrowed, to_collect = {}, {}
+        for rank, (window_low, window_high, below) in pending.items():
+            plan = plans[(window_low, window_high)]
+            if plan["min"] == plan["max"]:
+                values[rank] = plan["min"]   # Every score left in the window is the same
+                continue
+            cumulative = np.cumsum(plan["counts"])
+            local_rank = rank - below
+            position = int(np.searchsorted(cumulative, local_rank, side="right"))
+            before = int(cumulative[position - 1]) if position else 0
+            bin_low, bin_high = float(plan["edges"][position]), float(plan["edges"][position + 1])
+            if plan["counts"][position] <= max_candidates:
+                to_collect[rank] = ((bin_low, bin_high), local_rank - before)
+            else:
+                narrowed[rank] = (bin_low, bin_high, below + before)
+
+        if to_collect:
+            windows = sorted({window for window, _ in to_collect.values()})
+            candidates = dict(zip(windows, _collect_windows(make_chunks, windows)))
+            for rank, (window, local_rank) in to_collect.items():
+                values[rank] = float(np.partition(candidates[window], local_rank)[local_rank])
+        pending = narrowed
+
+    return values
+
+
+def describe_score_chunks(make_chunks: Callable[[], Iterator["np.ndarray"]], percentiles: Iterable[float] = (25, 75),
+                          approximate: bool = False, bins: int = HISTOGRAM_BINS, max_candidates: int = MAX_CANDIDATES,
+                          on_chunk: Optional[Callable[[int, "np.ndarray"], None]] = None) -> ScoreSummary:
+    """
+    describe_scores for scores read one chunk at a time; make_chunks() must return a fresh
+    iterator over 1-D chunks, as it is called once per pass. Count, mean, std, min and max come
+    from the first pass, by merging block moments. The median and percentiles are exact after a
+    few more passes (see select_ranks_in_chunks). approximate=True reads them from a quantile
+    sketch filled during the first pass instead: one pass in all, rank error within
+    sketch_error_bound. Memory stays at about one chunk plus max_candidates scores.
+    NaN or inf scores raise ValueError (the histogram passes can't place them).
+    on_chunk(offset, chunk) sees every chunk of the first pass, for callers that need more
+    from the same read.
+    """
+    percentiles = tuple(float(p) for p in percentiles)
+    moments = {"count": 0, "mean": 0.0, "m2": 0.0}
+    low, high = math.inf, -math.inf
+    sketch = create_quantile_sketch() if approximate else None
+    for chunk in make_chunks():
+        chunk = np.asarray(chunk).ravel()
+        if chunk.size == 0:
+            continue
+        if on_chunk is not None:
+            on_chunk(moments["count"], chunk)
+        chunk_low, chunk_high = float(chunk.min()), float(chunk.max())
+        if not (math.isfinite(chunk_low) and math.isfinite(chunk_high)):
+            # min/max are NaN if any score is, so this catches NaN and inf at no extra cost
+            raise ValueError(f"describe_score_chunks needs finite scores; the chunk at offset "
+                             f"{moments['count']} holds NaN or inf")
+        moments = merge_moments(moments, block_moments(chunk))
+        low, high = min(low, chunk_low), max(high, chunk_high)
+        if sketch is not None:
+            sketch_update(sketch, chunk)
+    if moments["count"] == 0:
+        raise ValueError("describe_score_chunks needs at least one score")
+
+    last = moments["count"] - 1
+    positions = {p: last * p / 100 for p in set(percentiles) | {50.0}}
+    ranks = sorted({min(int(math.floor(position)) + step, last) for position in positions.values() for step in (0, 1)})
+    if sketch is not None:
+        values = dict(zip(ranks, sketch_quantiles(sketch, np.array(ranks) / max(last, 1)).tolist()))
+    else:
+        values = select_ranks_in_chunks(make_chunks, ranks, low, high, bins, max_candidates)
+
+    def order_statistic(p):
+        position = positions[p]
+        rank = int(math.floor(position))
+        if position == rank:
+            return values[rank]
+        return values[rank] + (position - rank) * (values[rank + 1] - values[rank])
+
+    return {
+        "count": moments["count"],
+        "mean": moments["mean"],
+        "std": math.sqrt(moments["m2"] / moments["count"]),
+        "min": low,
+        "max": high,
+        "median": order_statistic(50.0),
+        "percentiles": {p: order_statistic(p) for p in percentiles},
+    }
@@ -0,0 +1,79 @@
+"""
+Weighted final scores for many cohorts at once.
+
+A final score is a weighted sum of a student's components (tests, assignments, ...).
+Day 7's create_sample_data used to average the tests, average the assignments and
+average those two - the weight vector [1/4, 1/4, 1/6, 1/6, 1/6] for two tests and
+three assignments. weighted_scores takes every section of every course as one
+(cohorts x students x components) array with a weight vector per cohort. It then
+scores each chunk of cohorts with a single np.matmul.
+
+Scores stay compact (uint8) in the input. Only the chunk being scored is widened to
+float64, so memory stays bounded and sums land exactly on grade boundaries such as 70.0.
+The results are float32, as the dtype policy stores averages.
+"""
+
+from typing import Optional
+
+from shared.dtype_policy import AVERAGE_DTYPE, WIDE_FLOAT_DTYPE
+from shared.lazy_imports import lazy_import
+
+np = lazy_import("numpy")   # Importing this module doesn't load NumPy yet
+
+CHUNK_BYTES = 64 * 1024 * 1024   # Size of the float64 working copy of one chunk of scores
+
+
+def component_weights(num_tests: int = 2, num_assignments: int = 3, test_share: float = 0.5) -> "np.ndarray":
+    """Tests get test_share of the final score and assignments the rest, split evenly (day 7: 0.5)"""
+    if not 0 <= test_share <= 1:
+        raise ValueError("test_share must be between 0 and 1")
+    return np.concatenate([np.full(num_tests, test_share / num_tests),
+                           np.full(num_assignments, (1 - test_share) / num_assignments)])
+
+
+def normalize_weights(weights, num_cohorts: int, num_components: int) -> "np.ndarray":
+    """(cohorts x components) float64 weights summing to 1 per cohort; one vector is shared by all cohorts"""
+    weights = np.asarray(weights, dtype=WIDE_FLOAT_DTYPE)
+    if weights.ndim == 1:
+        weights = np.broadcast_to(weights, (num_cohorts, weights.size))
+    if weights.shape != (num_cohorts, num_components):
+        raise ValueError(f"Expected {num_components} weights per cohort for {num_cohorts} cohort(s), "
+                         f"got shape {weights.shape}")
+    totals = weights.sum(axis=1, keepdims=True)
+    if np.any(weights < 0) or np.any(totals <= 0):
+        raise ValueError("Weights must be non-negative with a positive total per cohort")
+    return weights / totals
+
+
+def weighted_scores(scores, weights, cohorts_per_chunk: Optional[int] = None, out=None) -> "np.ndarray":
+    """
+    Final scores of a (cohorts x students x components) array - or of one cohort's
+    (students x components) - as float32 (cohorts x students). Weights are one vector
+    for every cohort or one row per cohort; they are normalized to sum to 1.
+    Chunks of cohorts_per_chunk cohorts (default: about CHUNK_BYTES of float64) are
+    scored one at a time, into `out` if given (e.g. a np.memmap).
+    """
+    scores = np.asarray(scores)
+    single_cohort = scores.ndim == 2
+    if single_cohort:
+        scores = scores[np.newaxis]
+    if scores.ndim != 3:
+        raise ValueError("scores must be (students x components) or (cohorts x students x components)")
+    num_cohorts, num_students, num_components = scores.shape
+    weights = normalize_weights(weights, num_cohorts, num_components)
+
+    # A chunk holds whole cohorts, or a slice of one cohort's students if a single cohort is too big
+    rows_per_chunk = max(1, CHUNK_BYTES // (num_components * np.dtype(WIDE_FLOAT_DTYPE).itemsize))
+    if cohorts_per_chunk is None:
+        cohorts_per_chunk = max(1, rows_per_chunk // max(num_students, 1))
+    students_per_chunk = max(1, num_students if cohorts_per_chunk > 1 else min(num_students, rows_per_chunk))
+
+    if out is None:
+        out = np.empty((num_cohorts, num_students), dtype=AVERAGE_DTYPE)
+    for cohort in range(0, num_cohorts, cohorts_per_chunk):
+        cohorts = slice(cohort, cohort + cohorts_per_chunk)
+        for student in range(0, num_students, students_per_chunk):
+            students = slice(student, student + students_per_chunk)
+            block = scores[cohorts, students].astype(WIDE_FLOAT_DTYPE)
+            out[cohorts, students] = np.matmul(block, weights[cohorts, :, np.newaxis])[..., 0]
+    return out[0] if single_cohort else out
@@ -0,0 +1,155 @@
+"""
+Import-time benchmark for the day scripts.
+
+Every script should be cheap to import (demos live behind `__main__`, pandas and
+NumPy load lazily), so other tools can reuse its functions. This loads each
+script in a fresh interpreter with `python -X importtime`, reports how long the
+import took and which imports were slowest, and fails when a script goes over
+the budget:
+
+    python -m shared.startup_benchmark                    # all week*/day*.py
+    python -m shared.startup_benchmark --budget-ms 150 week02-python/day8_pandas_fundamentals.py
+    python -m shared.startup_benchmark --json
+
+Scripts are loaded by path, so names like day09-pandas-revise.py work too.
+"""
+
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_MS = 250.0
+
+# Runs in the child interpreter: load the script as a module and time only that.
+# Imports logged before the marker belong to interpreter startup, not the script.
+_MARKER = "startup-benchmark: loading script"
+_LOAD_SCRIPT = """
+import importlib.util, json, os, sys, time
+path, marker = sys.argv[1], sys.argv[2]
+name = os.path.splitext(os.path.basename(path))[0].replace("-", "_")
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location(name, path)
+module = importlib.util.module_from_spec(spec)
+sys.modules[name] = module
+print(marker, file=sys.stderr, flush=True)
+spec.loader.exec_module(module)
+elapsed = time.perf_counter() - start
+print(json.dumps({"import_ms": elapsed * 1000, "modules": len(sys.modules)}))
+"""
+
+
+def find_day_scripts() -> List[str]:
+    """All week*/day*.py scripts in the repository, in course order"""
+    def course_order(path):
+        # day7 < day8 < day09 < day10, whatever the zero padding
+        return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)]
+
+    return sorted(glob.glob(os.path.join(REPO_ROOT, "week*", "day*.py")), key=course_order)
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Turn `-X importtime` output into [{"module", "self_us", "cumulative_us", "depth"}]"""
+    if _MARKER in stderr:
+        stderr = stderr.split(_MARKER, 1)[1]
+
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue   # the header line
+        name = fields[2].rstrip()
+        imports.append({
+            "module": name.strip(),
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+            # importtime indents nested imports by two spaces per level
+            "depth": (len(name) - len(name.lstrip())) // 2,
+        })
+    return imports
+
+
+def measure_script(path: str, repeat: int = 3, top: int = 5) -> Dict:
+    """Import `path` in `repeat` fresh interpreters and keep the fastest run"""
+    best = None
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", _LOAD_SCRIPT, path, _MARKER],
+                                   capture_output=True, text=True)
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()
+            return {"script": path, "ok": False, "error": error[-1] if error else "import failed"}
+
+        timing = json.loads(completed.stdout.strip().splitlines()[-1])
+        if best is None or timing["import_ms"] < best["import_ms"]:
+            best = {**timing, "imports": parse_importtime(completed.stderr)}
+
+    # Depth 0 entries are the script's own imports (with everything they pull in)
+    top_level = [entry for entry in best["imports"] if entry["depth"] == 0]
+    slowest = sorted(top_level, key=lambda entry: entry["cumulative_us"], reverse=True)[:top]
+    return {
+        "script": path,
+        "ok": True,
+        "import_ms": round(best["import_ms"], 2),
+        "modules_loaded": best["modules"],
+        "slowest_imports": [{"module": entry["module"], "ms": round(entry["cumulative_us"] / 1000, 2)}
+                            for entry in slowest],
+    }
+
+
+def run_startup_benchmark(scripts: Optional[List[str]] = None, budget_ms: float = DEFAULT_BUDGET_MS,
+                          repeat: int = 3) -> Dict:
+    """Measure every script and check it against the import-time budget"""
+    results = []
+    for path in scripts or find_day_scripts():
+        result = measure_script(os.path.abspath(path), repeat=repeat)
+        result["within_budget"] = result["ok"] and result["import_ms"] <= budget_ms
+        results.append(result)
+
+    return {
+        "budget_ms": budget_ms,
+        "results": results,
+        "over_budget": [result["script"] for result in results if not result["within_budget"]],
+    }
+
+
+def print_startup_report(report: Dict):
+    print(f"⏱️  Import times (budget {report['budget_ms']:.0f} ms)")
+    print("=" * 60)
+    for result in report["results"]:
+        name = os.path.relpath(result["script"], REPO_ROOT)
+        if not result["ok"]:
+            print(f"❌ {name}: {result['error']}")
+            continue
+
+        status = "✅" if result["within_budget"] else "❌"
+        print(f"{status} {name}: {result['import_ms']:.1f} ms, {result['modules_loaded']} modules")
+        for entry in result["slowest_imports"]:
+            print(f"      {entry['ms']:8.2f} ms  {entry['module']}")
+
+    if report["over_budget"]:
+        print(f"\n❌ {len(report['over_budget'])} script(s) over budget")
+    else:
+        print("\n🎉 Every script imports within budget!")
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    budget = DEFAULT_BUDGET_MS
+    if "--budget-ms" in arguments:
+        position = arguments.index("--budget-ms")
+        budget = float(arguments[position + 1])
+        del arguments[position:position + 2]
+
+    report = run_startup_benchmark([arg for arg in arguments if not arg.startswith("--")] or None,
+                                   budget_ms=budget)
+    if "--json" in arguments:
+        print(json.dumps(report, indent=2))
+    else:
+        print_startup_report(report)
+    sys.exit(1 if report["over_budget"] else 0)
@@ -0,0 +1,332 @@
+"""
+Schema-driven CSV parsing straight into typed NumPy columns.
+
+The day4/day5 loaders read every field as a string through csv.DictReader and
+then call int()/float() cell by cell. Here the file is read in large binary
+blocks and split into fields with NumPy (one pass to find the commas and
+newlines), so no Python object is created per cell. Numeric columns are parsed
+in one NumPy call each and text columns become fixed-width string arrays.
+
+Blocks that contain quoted fields fall back to the csv module for that block
+only. Columns that contain bad cells fall back to a per-cell scan,
+and those cells go to a rejects table with their row numbers instead of
+stopping the load.
+"""
+
+import csv
+import io
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Column name -> rules. "dtype" is the NumPy type of the parsed column,
+# "required" rejects empty strings, "min"/"max" reject out-of-range values.
+STUDENT_SCHEMA: Dict[str, Dict[str, Any]] = {
+    "Name": {"dtype": str, "required": True},
+    "Age": {"dtype": np.int16, "min": 16, "max": 100},
+    "Major": {"dtype": str, "required": True},
+    "GPA": {"dtype": np.float64},
+    "Credits": {"dtype": np.int32, "min": 0},
+    "Graduation_Year": {"dtype": np.int16},
+}
+
+COMMA = ord(",")
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+# A parsed column is either {"cells": [str, ...]} (csv-module path) or
+# {"buf": uint8 array, "starts": ..., "ends": ...} byte offsets (fast path).
+
+
+def _column_subset(column: Dict[str, Any], index) -> Dict[str, Any]:
+    """The same column restricted to a slice, boolean mask or index array"""
+    if "cells" in column:
+        return {"cells": list(np.asarray(column["cells"], dtype=object)[index])}
+    return {"buf": column["buf"], "starts": column["starts"][index], "ends": column["ends"][index]}
+
+
+def _column_cells(column: Dict[str, Any]) -> List[str]:
+    """Materialise cells as Python strings (only for rejected or suspicious cells)"""
+    if "cells" in column:
+        return column["cells"]
+    buf = column["buf"]
+    return [buf[start:end].tobytes().decode("utf-8").strip()
+            for start, end in zip(column["starts"].tolist(), column["ends"].tolist())]
+
+
+def _column_number_text(column: Dict[str, Any]) -> bytes:
+    """All cells of a column joined with commas, ready for np.fromstring"""
+    if "cells" in column:
+        return ",".join(column["cells"]).encode("utf-8")
+
+    buf, starts, ends = column["buf"], column["starts"], column["ends"]
+    lengths = ends - starts + 1                      # each field plus the byte after it
+    total = int(lengths.sum())
+    row_offsets = np.cumsum(lengths) - lengths
+    positions = np.repeat(starts - row_offsets, lengths) + np.arange(total)
+    text = buf[positions]
+    text[row_offsets + lengths - 1] = COMMA          # the byte after each field becomes a comma
+    return text.tobytes()
+
+
+def _column_strings(column: Dict[str, Any]) -> np.ndarray:
+    """A stripped fixed-width unicode array of the column's cells"""
+    if "cells" in column:
+        return np.char.strip(np.array(column["cells"], dtype=str))
+
+    buf, starts, ends = column["buf"], column["starts"], column["ends"]
+    width = int((ends - starts).max()) if len(starts) else 0
+    if width == 0:
+        return np.full(len(starts), "", dtype="U1")
+
+    positions = starts[:, None] + np.arange(width)
+    inside = positions < ends[:, None]
+    chars = np.where(inside, buf[np.minimum(positions, len(buf) - 1)], 0).astype(np.uint8)
+    if (chars < 128).all():
+        # ASCII bytes are already unicode code points: widen them in place, no decoding
+        values = chars.astype(np.uint32).view(f"U{width}").ravel()
+    else:
+        values = np.char.decode(chars.view(f"S{width}").ravel(), "utf-8")
+    return np.char.strip(values)
+
+
+def _parse_numbers(text: bytes, count: int, parse_type) -> np.ndarray:
+    """Parse comma-separated numbers with NumPy's C parser; ValueError if any cell is bad"""
+    parsed = np.fromstring(text, dtype=parse_type, sep=",")
+    if len(parsed) != count:
+        raise ValueError("column contains empty or unparseable cells")
+    return parsed
+
+
+def _cells_without_digits(column: Dict[str, Any]) -> np.ndarray:
+    """Cells with no digit at all ("-", " "), which np.fromstring quietly reads as 0 or -1"""
+    if "cells" in column:
+        return np.array([not any(char.isdigit() for char in cell) for cell in column["cells"]], dtype=bool)
+    digits_before = np.concatenate(([0], np.cumsum((column["buf"] >= ord("0")) & (column["buf"] <= ord("9")))))
+    return digits_before[column["ends"]] == digits_before[column["starts"]]
+
+
+def _parse_cells(cells: List[str], parse_type) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse cell by cell with the same C parser as the bulk path; returns (values, bad mask)"""
+    values = np.zeros(len(cells), dtype=parse_type)
+    bad = np.zeros(len(cells), dtype=bool)
+    for index, text in enumerate(cells):
+        try:
+            parsed = np.fromstring(text.encode("utf-8"), dtype=parse_type, sep=",")
+        except ValueError:
+            parsed = ()
+        if len(parsed) == 1 and any(char.isdigit() for char in text):
+            values[index] = parsed[0]
+        else:
+            bad[index] = True
+    return values, bad
+
+
+def _find_bad_cells(column: Dict[str, Any], count: int, parse_type) -> np.ndarray:
+    """Slow path: bisect a column that failed bulk parsing down to its bad cells"""
+    bad = np.zeros(count, dtype=bool)
+    pending = [(0, count)]
+    while pending:
+        lo, hi = pending.pop()
+        part = _column_subset(column, slice(lo, hi))
+        if hi - lo <= 64:
+            bad[lo:hi] = _parse_cells(_column_cells(part), parse_type)[1]
+            continue
+        try:
+            _parse_numbers(_column_number_text(part), hi - lo, parse_type)
+        except ValueError:
+            mid = (lo + hi) // 2
+            pending.extend([(lo, mid), (mid, hi)])
+    return bad
+
+
+def _convert_column(name: str, column: Dict[str, Any], count: int, rules: Dict[str, Any],
+                    row_numbers: np.ndarray, rejects: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert one column in bulk; returns (typed array, mask of rejected rows)"""
+    dtype = rules["dtype"]
+    reasons = {}
+
+    if dtype is str:
+        typed = _column_strings(column)
+        bad = np.zeros(count, dtype=bool)
+        if rules.get("required"):
+            bad = typed == ""
+            reasons["empty"] = bad
+    else:
+        is_int = np.issubdtype(dtype, np.integer)
+        parse_type = np.int64 if is_int else np.float64
+        no_digits = _cells_without_digits(column)
+        try:
+            parsed = _parse_numbers(_column_number_text(column), count, parse_type)
+            bad = no_digits
+        except ValueError:
+            bad = _find_bad_cells(column, count, parse_type) | no_digits
+            parsed = np.zeros(count, dtype=parse_type)
+            if not bad.all():
+                good = np.flatnonzero(~bad)
+                try:
+                    parsed[good] = _parse_numbers(_column_number_text(_column_subset(column, good)),
+                                                  len(good), parse_type)
+                except ValueError:
+                    # The bulk and per-cell parses disagree somewhere: trust the cell by cell one
+                    parsed[good], still_bad = _parse_cells(_column_cells(_column_subset(column, good)), parse_type)
+                    bad[good[still_bad]] = True
+        if bad.any():
+            reasons["not a valid number"] = bad.copy()
+
+        if is_int:
+            limits = np.iinfo(dtype)
+            out_of_type = ((parsed < limits.min) | (parsed > limits.max)) & ~bad
+            reasons[f"does not fit in {np.dtype(dtype).name}"] = out_of_type
+        else:
+            out_of_type = ~np.isfinite(parsed) & ~bad
+            reasons["not a finite number"] = out_of_type
+        bad = bad | out_of_type
+
+        if "min" in rules:
+            too_low = (parsed < rules["min"]) & ~bad
+            reasons[f"below minimum {rules['min']}"] = too_low
+            bad |= too_low
+        if "max" in rules:
+            too_high = (parsed > rules["max"]) & ~bad
+            reasons[f"above maximum {rules['max']}"] = too_high
+            bad |= too_high
+
+        typed = np.where(bad, 0, parsed).astype(dtype)
+
+    for reason, mask in reasons.items():
+        indices = np.flatnonzero(mask)
+        for idx, value in zip(indices, _column_cells(_column_subset(column, indices))):
+            rejects.append({"row": int(row_numbers[idx]), "column": name,
+                            "value": value, "reason": reason})
+    return typed, bad
+
+
+def _split_block_fast(block: bytes, width: int, first_row: int, rejects: List[Dict[str, Any]]):
+    """Find every field's byte offsets with NumPy; rows with the wrong field count are rejected"""
+    buf = np.frombuffer(block, dtype=np.uint8)
+    separators = np.flatnonzero((buf == COMMA) | (buf == NEWLINE))
+    newlines = separators[buf[separators] == NEWLINE]
+    line_count = len(newlines)
+
+    if len(separators) == line_count * width and (buf[separators[width - 1::width]] == NEWLINE).all():
+        # Every line has exactly `width` fields: the common case
+        ends = separators.reshape(line_count, width)
+        row_numbers = np.arange(first_row, first_row + line_count)
+        record_count = line_count
+    else:
+        line_of = np.searchsorted(newlines, separators)
+        fields_per_line = np.bincount(line_of, minlength=line_count)
+        line_starts = np.concatenate(([0], newlines[:-1] + 1))
+        # csv skips blank lines (including a lone "\r") without counting them
+        blank = (newlines == line_starts) | ((newlines == line_starts + 1) & (buf[newlines - 1] == CARRIAGE_RETURN))
+        good = (fields_per_line == width) & ~blank
+
+        numbered = np.flatnonzero(~blank)
+        row_of_line = np.zeros(line_count, dtype=np.int64)
+        row_of_line[numbered] = first_row + np.arange(len(numbered))
+        for line in np.flatnonzero(~good & ~blank):
+            text = buf[line_starts[line]:newlines[line]].tobytes().decode("utf-8").rstrip("\r")
+            rejects.append({"row": int(row_of_line[line]), "column": None, "value": text,
+                            "reason": f"expected {width} fields, got {fields_per_line[line]}"})
+
+        ends = separators[good[line_of]].reshape(-1, width)
+        row_numbers = row_of_line[good]
+        record_count = len(numbered)
+
+    starts = np.empty_like(ends)
+    starts[:, 1:] = ends[:, :-1] + 1
+    if len(ends):
+        # Each row starts right after the newline that ends the previous line
+        line_index = np.searchsorted(newlines, ends[:, -1])
+        starts[:, 0] = np.concatenate(([0], newlines[:-1] + 1))[line_index]
+        # Windows line endings: keep the "\r" out of the last field
+        ends[:, -1] -= buf[ends[:, -1] - 1] == CARRIAGE_RETURN
+    columns = [{"buf": buf, "starts": starts[:, i], "ends": ends[:, i]} for i in range(width)]
+    return columns, row_numbers, record_count
+
+
+def _split_block_slow(block: bytes, width: int, first_row: int, rejects: List[Dict[str, Any]]):
+    """csv-module fallback for blocks with quoted fields"""
+    text = block.decode("utf-8")
+    records = [record for record in csv.reader(io.StringIO(text, newline="")) if record]
+
+    good = []
+    for offset, record in enumerate(records):
+        if len(record) == width:
+            good.append(offset)
+        else:
+            rejects.append({"row": first_row + offset, "column": None, "value": ",".join(record),
+                            "reason": f"expected {width} fields, got {len(record)}"})
+    row_numbers = first_row + np.array(good, dtype=np.int64)
+    cells = [list(column) for column in zip(*(records[i] for i in good))] or [[] for _ in range(width)]
+    return [{"cells": column} for column in cells], row_numbers, len(records)
+
+
+def parse_csv_with_schema(filename: str, schema: Dict[str, Dict[str, Any]] = STUDENT_SCHEMA,
+                          block_size: int = 32 * 1024 * 1024) -> Dict[str, Any]:
+    """
+    Parse a CSV file into {"columns": {name: ndarray}, "rejects": [...], ...}.
+
+    The file is read in blocks of roughly block_size bytes. Rows with any
+    rejected cell are left out of every column, so all columns stay aligned.
+    Row numbers match safe_csv_reader (the header is row 1).
+    """
+    rejects: List[Dict[str, Any]] = []
+    column_blocks: Dict[str, List[np.ndarray]] = {name: [] for name in schema}
+    total_rows = 0
+
+    with open(filename, "rb") as file:
+        header = next(csv.reader([file.readline().decode("utf-8")]), [])
+        header = [column.strip() for column in header]
+        missing = [name for name in schema if name not in header]
+        if missing:
+            raise ValueError(f"CSV missing columns: {missing}")
+        positions = {name: header.index(name) for name in schema}
+        width = len(header)
+
+        while True:
+            block = file.read(block_size)
+            if not block:
+                break
+            # Finish the last line, and keep going while a quoted field is still open
+            block += file.readline()
+            while block.count(b'"') % 2:
+                more = file.readline()
+                if not more:
+                    break
+                block += more
+            if not block.endswith(b"\n"):
+                block += b"\n"
+
+            split_block = _split_block_slow if b'"' in block else _split_block_fast
+            columns, row_numbers, record_count = split_block(block, width, total_rows + 2, rejects)
+            total_rows += record_count
+            if len(row_numbers) == 0:
+                continue
+
+            block_bad = np.zeros(len(row_numbers), dtype=bool)
+            typed_block = {}
+            for name, rules in schema.items():
+                typed, bad = _convert_column(name, columns[positions[name]], len(row_numbers),
+                                             rules, row_numbers, rejects)
+                typed_block[name] = typed
+                block_bad |= bad
+
+            for name, typed in typed_block.items():
+                column_blocks[name].append(typed[~block_bad] if block_bad.any() else typed)
+
+    columns = {}
+    for name, rules in schema.items():
+        if column_blocks[name]:
+            columns[name] = np.concatenate(column_blocks[name])
+        else:
+            columns[name] = np.array([], dtype=str if rules["dtype"] is str else rules["dtype"])
+
+    rejects.sort(key=lambda reject: reject["row"])
+    return {
+        "columns": columns,
+        "rejects": rejects,
+        "total_rows": total_rows,
+        "valid_rows": len(next(iter(columns.values()))) if columns else 0,
+    }
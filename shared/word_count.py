@@ -0,0 +1,272 @@
+"""
+Map-reduce word counting for large text files.
+
+collections.Counter(text.split()) needs the whole text in memory and one core.
+count_words instead:
+
+- cuts every file into byte-range shards (cut points are moved to the next
+  whitespace, so no word - and no UTF-8 character - is split between shards),
+- streams each shard chunk by chunk through the tokenizer in a process pool,
+- merges the partial Counters as shards finish.
+
+With max_keys set, each worker keeps at most max_keys exact counts. Everything
+is also added to a count-min sketch (a fixed-size table of counters), so rare
+words can be dropped and the top words still get a count - an estimate that
+can only be too high, by at most about e / sketch_width of all words.
+"""
+
+import collections
+import hashlib
+import heapq
+import os
+import re
+import time
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Words are letters/digits, with inner apostrophes kept: "don't", "student's"
+WORD_PATTERN = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+# Shards are cut at ASCII whitespace, which never appears inside a UTF-8 character
+WHITESPACE = re.compile(rb"[ \t\n\r\x0b\x0c]")
+WHITESPACE_BYTES = b" \t\n\r\x0b\x0c"
+
+DEFAULT_SHARD_BYTES = 64 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased words of a piece of text"""
+    return WORD_PATTERN.findall(text.lower())
+
+
+def _last_whitespace(buffer: bytes) -> int:
+    return max(buffer.rfind(byte) for byte in WHITESPACE_BYTES)
+
+
+def iter_token_batches(path: str, start: int = 0, end: Optional[int] = None,
+                       chunk_size: int = DEFAULT_CHUNK_BYTES) -> Iterator[List[str]]:
+    """
+    Stream the words that start inside bytes [start, end) of a file, one list per chunk.
+    A word straddling `start` belongs to the previous range, one straddling `end` to this one,
+    so consecutive ranges count every word exactly once.
+    """
+    with open(path, "rb") as handle:
+        if end is None:
+            end = os.fstat(handle.fileno()).st_size
+        # Read from one byte early to see whether `start` falls inside a word
+        position = max(start - 1, 0)      # File offset of buffer[0]
+        skip_partial_word = start > 0
+        handle.seek(position)
+        buffer = b""
+
+        while True:
+            # Read no further than needed to reach `end`, then just enough to finish the last word
+            remaining = end - position - len(buffer)
+            chunk = handle.read(min(chunk_size, remaining + 1) if remaining >= 0 else min(chunk_size, 256))
+            buffer += chunk
+
+            if skip_partial_word:
+                match = WHITESPACE.search(buffer)
+                if match is None:
+                    if not chunk:
+                        return
+                    position += len(buffer)
+                    buffer = b""
+                    continue
+                position += match.start()
+                buffer = buffer[match.start():]
+                skip_partial_word = False
+
+            if position >= end:
+                return
+            if not chunk:
+                yield tokenize(buffer.decode("utf-8", errors="replace"))
+                return
+
+            if position + len(buffer) > end:
+                # Stop at the first whitespace from end - 1 on: a word starting exactly at `end`
+                # follows whitespace at end - 1 and is left for the next range
+                match = WHITESPACE.search(buffer, end - position - 1)
+                if match is not None:
+                    yield tokenize(buffer[:match.start()].decode("utf-8", errors="replace"))
+                    return
+                continue   # The last word runs on into the next chunk
+
+            cut = _last_whitespace(buffer)
+            if cut <= 0:
+                continue   # One long word so far, keep reading
+            yield tokenize(buffer[:cut].decode("utf-8", errors="replace"))
+            position += cut
+            buffer = buffer[cut:]
+
+
+def iter_tokens(path: str, start: int = 0, end: Optional[int] = None,
+                chunk_size: int = DEFAULT_CHUNK_BYTES) -> Iterator[str]:
+    """Stream the words of a file (or of bytes [start, end) of it) one at a time"""
+    for batch in iter_token_batches(path, start, end, chunk_size):
+        yield from batch
+
+
+def plan_shards(paths: List[str], shard_bytes: int = DEFAULT_SHARD_BYTES) -> List[Tuple[str, int, int]]:
+    """Split files into (path, start, end) byte ranges of at most shard_bytes"""
+    shards = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, size, shard_bytes):
+            shards.append((path, start, min(start + shard_bytes, size)))
+    return shards
+
+
+# =============================================================================
+# COUNT-MIN SKETCH
+# =============================================================================
+
+def create_sketch(width: int = 2 ** 18, depth: int = 4) -> Dict[str, Any]:
+    """depth rows of width counters; memory is width * depth * 8 bytes"""
+    return {"width": width, "depth": depth, "rows": [array("q", bytes(8 * width)) for _ in range(depth)]}
+
+
+def _sketch_columns(word: str, width: int, depth: int) -> List[int]:
+    # blake2b rather than hash(): the columns must agree between processes
+    digest = int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=16).digest(), "little")
+    first, step = digest & 0xFFFFFFFFFFFFFFFF, (digest >> 64) | 1
+    return [(first + row * step) % width for row in range(depth)]
+
+
+def sketch_add(sketch: Dict[str, Any], counts: Dict[str, int]) -> None:
+    width, depth, rows = sketch["width"], sketch["depth"], sketch["rows"]
+    for word, count in counts.items():
+        for row, column in zip(rows, _sketch_columns(word, width, depth)):
+            row[column] += count
+
+
+def sketch_estimate(sketch: Dict[str, Any], word: str) -> int:
+    """Upper bound on how often `word` was added"""
+    columns = _sketch_columns(word, sketch["width"], sketch["depth"])
+    return min(row[column] for row, column in zip(sketch["rows"], columns))
+
+
+def merge_sketches(target: Dict[str, Any], other: Dict[str, Any]) -> None:
+    if (target["width"], target["depth"]) != (other["width"], other["depth"]):
+        raise ValueError("Only sketches of the same width and depth can be merged")
+    for row, other_row in zip(target["rows"], other["rows"]):
+        for column, count in enumerate(other_row):
+            if count:
+                row[column] += count
+
+
+# =============================================================================
+# MAP AND REDUCE
+# =============================================================================
+
+def _prune_candidates(counts, sketch, candidates, max_keys):
+    """Move exact counts into the sketch and keep the max_keys most frequent words as candidates"""
+    sketch_add(sketch, counts)
+    candidates.update(counts.keys())
+    counts.clear()
+    if len(candidates) > max_keys:
+        estimates = {word: sketch_estimate(sketch, word) for word in candidates}
+        kept = heapq.nlargest(max_keys, estimates, key=estimates.get)
+        candidates.clear()
+        candidates.update(kept)
+
+
+def count_shard(shard: Tuple[str, int, int], max_keys: Optional[int] = None, sketch_width: int = 2 ** 18,
+                sketch_depth: int = 4, chunk_size: int = DEFAULT_CHUNK_BYTES) -> Dict[str, Any]:
+    """Map step: word counts of one (path, start, end) shard"""
+    path, start, end = shard
+    counts = collections.Counter()
+    sketch = create_sketch(sketch_width, sketch_depth) if max_keys else None
+    candidates = set()
+    total = 0
+
+    for batch in iter_token_batches(path, start, end, chunk_size):
+        total += len(batch)
+        counts.update(batch)
+        if max_keys and len(counts) > max_keys:
+            _prune_candidates(counts, sketch, candidates, max_keys)
+
+    if max_keys:
+        _prune_candidates(counts, sketch, candidates, max_keys)
+        return {"total": total, "sketch": sketch, "candidates": candidates}
+    return {"total": total, "counts": counts}
+
+
+def count_words(paths: List[str], top_k: int = 20, shard_bytes: int = DEFAULT_SHARD_BYTES,
+                max_workers: Optional[int] = None, max_keys: Optional[int] = None,
+                sketch_width: int = 2 ** 18, sketch_depth: int = 4) -> Dict[str, Any]:
+    """
+    Word frequencies across text files, counted shard by shard in a process pool.
+    max_keys=None counts every word exactly; a number bounds memory per worker and
+    makes the top_k counts count-min sketch estimates.
+    """
+    start_time = time.perf_counter()
+    shards = plan_shards(paths, shard_bytes)
+    options = {"max_keys": max_keys, "sketch_width": sketch_width, "sketch_depth": sketch_depth}
+
+    total = 0
+    counts = collections.Counter()
+    sketch = create_sketch(sketch_width, sketch_depth) if max_keys else None
+    candidates = set()
+
+    def reduce(result):
+        nonlocal total
+        total += result["total"]
+        if max_keys:
+            merge_sketches(sketch, result["sketch"])
+            candidates.update(result["candidates"])
+        else:
+            counts.update(result["counts"])
+
+    workers = min(max_workers or os.cpu_count() or 1, len(shards))
+    if workers <= 1:
+        # Not worth starting processes for a single shard or worker
+        for shard in shards:
+            reduce(count_shard(shard, **options))
+    else:
+        # Imported here: multiprocessing is slow to import and only this branch needs it
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(count_shard, shard, **options) for shard in shards]
+            for future in as_completed(futures):
+                reduce(future.result())
+
+    if max_keys:
+        estimates = {word: sketch_estimate(sketch, word) for word in candidates}
+        top = heapq.nlargest(top_k, estimates.items(), key=lambda item: item[1])
+    else:
+        top = counts.most_common(top_k)
+
+    return {
+        "top": top,
+        "total_words": total,
+        "distinct_words": len(counts) if not max_keys else None,   # Unknown once words are dropped
+        "exact": not max_keys,
+        "files": len(paths),
+        "shards": len(shards),
+        "workers": max(workers, 1),
+        "seconds": time.perf_counter() - start_time,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python -m shared.word_count feedback/*.txt [--top 20] [--workers 8] [--max-keys 100000]
+    arguments = sys.argv[1:]
+    settings = {"--top": 20, "--workers": None, "--max-keys": None}
+    for flag in settings:
+        if flag in arguments:
+            position = arguments.index(flag)
+            settings[flag] = int(arguments[position + 1])
+            del arguments[position:position + 2]
+
+    result = count_words(arguments, top_k=settings["--top"], max_workers=settings["--workers"],
+                         max_keys=settings["--max-keys"])
+    print(f"📊 {result['total_words']:,} words in {result['files']} file(s), "
+          f"{result['shards']} shard(s) on {result['workers']} worker(s) in {result['seconds']:.2f}s")
+    for word, count in result["top"]:
+        print(f"   {count:>12,}{'' if result['exact'] else '*'}  {word}")
+    if not result["exact"]:
+        print("   * count-min sketch estimate (never too low)")
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from shared.expressions import evaluate_expression
+
+X = np.array([1, 2, 3, 85, 90, 78], dtype=np.uint8)
+Y = np.array([10, 20, 30, 40, 50, 60], dtype=np.uint8)
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("x*x + y", lambda x, y: x * x + y),
+    ("sqrt(x) * sqrt(x) - x", lambda x, y: np.sqrt(x) * np.sqrt(x) - x),
+    ("(x + y) * (x + y) / (x + y)", lambda x, y: (x + y) * (x + y) / (x + y)),
+    ("where(x > 50, x * x, y * y) + x", lambda x, y: np.where(x > 50, x * x, y * y) + x),
+    ("round(x / 10) * 10", lambda x, y: np.round(x / 10) * 10),
+])
+def test_matches_numpy_with_repeated_operands(expression, expected):
+    x, y = X.astype(np.float64), Y.astype(np.float64)
+    for block_size in (1, 4, 1024):
+        result = evaluate_expression(expression, x=X, y=Y, block_size=block_size)
+        np.testing.assert_allclose(result, expected(x, y))
+
+
+def test_rejects_non_contiguous_out():
+    out = np.empty((2, 3)).T
+    with pytest.raises(ValueError):
+        evaluate_expression("x + 1", x=np.ones((3, 2)), out=out)
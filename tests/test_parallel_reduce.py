@@ -0,0 +1,22 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from shared import parallel_reduce
+from shared.parallel_reduce import reduce_scores
+from shared.score_stats import band_scores
+
+BOUNDARIES = [60, 90]
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_nan_lands_in_the_same_band_on_every_path(monkeypatch, dtype):
+    monkeypatch.setattr(parallel_reduce, "PARALLEL_MIN_SIZE", 0)   # Let tiny arrays use the thread pool
+    scores = np.array([50, 70, 95, np.nan, 60, 90, np.nan], dtype=dtype)
+    expected = band_scores(scores, BOUNDARIES)["counts"].tolist()
+    assert expected == np.bincount(np.digitize(scores, BOUNDARIES), minlength=3).tolist()
+    for threads in (1, 2):
+        assert reduce_scores(scores, BOUNDARIES, threads=threads, chunk_size=2)["band_counts"] == expected
@@ -0,0 +1,112 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from shared.pypi_client import (create_pypi_client, fetch_package_info, normalize_package_name,
+                                write_local_index)
+
+PACKAGE = {"info": {"name": "demo-pkg", "version": "1.0", "summary": "A demo", "author": "Ada"}}
+
+
+class StubResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self.data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise OSError(f"HTTP {self.status_code}")
+
+
+class StubSession:
+    """Hands out the queued responses (or raises queued exceptions) and records every request"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append({"url": url, "headers": dict(headers or {})})
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _client(tmp_path, session, max_age=300):
+    return create_pypi_client(cache_dir=str(tmp_path / "cache"), max_age=max_age, session=session)
+
+
+def test_fresh_cache_is_served_without_a_request(tmp_path):
+    client = _client(tmp_path, StubSession(StubResponse(200, PACKAGE, {"ETag": '"v1"'})))
+    assert fetch_package_info(client, "demo-pkg")["source"] == "network"
+    second = fetch_package_info(client, "demo-pkg")
+    assert second["source"] == "cache" and second["version"] == "1.0"
+    assert len(client["session"].calls) == 1
+    assert client["stats"]["fresh_cache"] == 1
+
+
+def test_stale_entry_is_revalidated_with_its_etag(tmp_path):
+    session = StubSession(StubResponse(200, PACKAGE, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+                          StubResponse(304))
+    client = _client(tmp_path, session, max_age=0)
+    fetch_package_info(client, "demo-pkg")
+    result = fetch_package_info(client, "demo-pkg")
+    assert result["source"] == "not_modified" and result["version"] == "1.0"
+    assert session.calls[1]["headers"] == {"If-None-Match": '"v1"',
+                                           "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert "If-None-Match" not in session.calls[0]["headers"]
+    assert client["stats"]["not_modified"] == 1
+
+
+def test_failed_request_falls_back_to_the_stale_cache(tmp_path):
+    session = StubSession(StubResponse(200, PACKAGE, {"ETag": '"v1"'}), ConnectionError("offline"))
+    client = _client(tmp_path, session, max_age=0)
+    fetch_package_info(client, "demo-pkg")
+    assert fetch_package_info(client, "demo-pkg")["source"] == "stale_cache"
+    assert client["stats"]["errors"] == 1
+
+
+def test_local_index_is_read_and_revalidated_by_mtime(tmp_path):
+    index = tmp_path / "index"
+    index.mkdir()
+    (index / "demo-pkg.json").write_text(json.dumps(PACKAGE))
+    client = create_pypi_client(index=str(index), cache_dir=str(tmp_path / "cache"))
+    assert fetch_package_info(client, "Demo_Pkg")["source"] == "index"
+    assert fetch_package_info(client, "demo-pkg")["source"] == "not_modified"
+
+    os.utime(index / "demo-pkg.json", ns=(0, 1))
+    assert fetch_package_info(client, "demo-pkg")["source"] == "index"
+    assert fetch_package_info(client, "missing-pkg")["error"] == "Package not found in local index"
+
+
+def test_write_local_index_uses_normalized_names(tmp_path):
+    index = tmp_path / "index"
+    assert write_local_index(str(index), ["pytest", "../escape"]) == ["pytest"]
+    assert os.listdir(index) == ["pytest.json"]
+    client = create_pypi_client(index=str(index), cache_dir=None)
+    assert fetch_package_info(client, "PyTest")["source"] == "index"
+
+
+@pytest.mark.parametrize("name", ["../etc/passwd", "a/b", "", "-demo", "demo-", "demo pkg", None])
+def test_invalid_names_never_reach_the_url_or_the_disk(tmp_path, name):
+    session = StubSession()
+    client = _client(tmp_path, session)
+    assert fetch_package_info(client, name)["error"] == "Not a valid package name"
+    assert session.calls == []
+    assert not (tmp_path / "cache").exists()
+
+
+def test_names_are_normalized_for_the_url():
+    session = StubSession(StubResponse(200, PACKAGE))
+    client = create_pypi_client(cache_dir=None, session=session)
+    fetch_package_info(client, "Demo_.Pkg")
+    assert session.calls[0]["url"] == "https://pypi.org/pypi/demo-pkg/json"
+    assert normalize_package_name("Scikit_Learn") == "scikit-learn"
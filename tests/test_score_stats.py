@@ -0,0 +1,41 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from shared.score_stats import describe_score_chunks
+
+
+def _chunked(scores, size):
+    return lambda: iter([scores[start:start + size] for start in range(0, scores.size, size)])
+
+
+def _check(summary, scores):
+    as_float64 = scores.astype(np.float64)
+    assert summary["min"] == as_float64.min() and summary["max"] == as_float64.max()
+    assert summary["median"] == pytest.approx(np.median(as_float64))
+    for p, value in summary["percentiles"].items():
+        assert value == pytest.approx(np.percentile(as_float64, p))
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_ties_at_the_maximum(dtype):
+    scores = np.array([60, 70, 80, 95.5, 95.5, 95.5, 95.5, 95.5], dtype=dtype)
+    _check(describe_score_chunks(_chunked(scores, 4), percentiles=(25, 75, 90)), scores)
+
+
+@pytest.mark.parametrize("max_candidates", [4, 64, 1 << 20])
+def test_float32_scores_match_numpy(max_candidates):
+    scores = np.random.default_rng(7).uniform(40, 100, 10_001).astype(np.float32)
+    scores[::97] = scores.max()
+    summary = describe_score_chunks(_chunked(scores, 1_000), percentiles=(1, 25, 75, 99),
+                                    bins=16, max_candidates=max_candidates)
+    _check(summary, scores)
+
+
+def test_rejects_nan():
+    scores = np.array([60.0, np.nan, 80.0])
+    with pytest.raises(ValueError):
+        describe_score_chunks(_chunked(scores, 2))
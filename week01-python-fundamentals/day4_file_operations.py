@@ -2,9 +2,6 @@
 # PART 1: WORKING WITH TEXT FILES (8 minutes)
 # =============================================================================
 
-print("PART 1: Basic Text File Operations")
-print("=" * 40)
-
 # Writing to a text file
 def create_sample_file():
     with open('students.txt', 'w') as file:
@@ -30,17 +27,11 @@ def read_student_file():
     except FileNotFoundError:
         print("❌ File not found! Create the file first.")
 
-# Create and read the file
-create_sample_file()
-read_student_file()
 
 # =============================================================================
 # PART 2: WORKING WITH CSV FILES (10 minutes)
 # =============================================================================
 
-print("\n\nPART 2: CSV Files - The Backbone of Data Science")
-print("=" * 50)
-
 import csv
 
 def create_csv_data():
@@ -93,17 +84,11 @@ def read_and_analyze_csv():
     except FileNotFoundError:
         print("❌ CSV file not found!")
 
-# Create and analyze CSV data
-create_csv_data()
-read_and_analyze_csv()
 
 # =============================================================================
 # PART 3: WORKING WITH JSON FILES (7 minutes)  
 # =============================================================================
 
-print("\n\nPART 3: JSON Files - Structured Data Storage")
-print("=" * 45)
-
 import json  # Built-in library for JSON handling
 
 def create_json_data():
@@ -172,17 +157,11 @@ def read_and_explore_json():
     except FileNotFoundError:
         print("❌ JSON file not found!")
 
-# Create and explore JSON data
-create_json_data()
-read_and_explore_json()
 
 # =============================================================================
 # TODAY'S CHALLENGE: BUILD A STUDENT MANAGEMENT SYSTEM (Complete this!)
 # =============================================================================
 
-print("\n\n🎯 TODAY'S CHALLENGE: Student Data Manager")
-print("=" * 50)
-
 """
 YOUR TASK: Create functions that can:
 1. Add new students to the CSV file
@@ -267,8 +246,6 @@ def export_students_to_json():
         print(f"Error during export: {e}")
 
 
-
-
 def calculate_class_statistics():
     try:
         # Read all student data
@@ -327,22 +304,47 @@ def calculate_class_statistics():
     except Exception as e:
         print(f"❌ Error calculating statistics: {e}")
 
-# Test your functions here:
-print("\n🧪 Testing Your Functions:")
-print("(Implement the functions above, then test them here)")
 
+def main():
+    print("PART 1: Basic Text File Operations")
+    print("=" * 40)
+
+    # Create and read the file
+    create_sample_file()
+    read_student_file()
+
+    print("\n\nPART 2: CSV Files - The Backbone of Data Science")
+    print("=" * 50)
+
+    # Create and analyze CSV data
+    create_csv_data()
+    read_and_analyze_csv()
+
+    print("\n\nPART 3: JSON Files - Structured Data Storage")
+    print("=" * 45)
+
+    # Create and explore JSON data
+    create_json_data()
+    read_and_explore_json()
 
-add_student_to_csv("John Doe", 21, "Engineering", 3.5, 80, 2025)
+    print("\n\n🎯 TODAY'S CHALLENGE: Student Data Manager")
+    print("=" * 50)
 
-add_student_to_csv("Alice Johnson", 20, "Computer Science", 3.8, 60, 2025)
+    # Test your functions here:
+    print("\n🧪 Testing Your Functions:")
+    print("(Implement the functions above, then test them here)")
 
-print("\nStudents in Computer Science:")
-search_students_by_major("Computer Science")
+    add_student_to_csv("John Doe", 21, "Engineering", 3.5, 80, 2025)
 
-export_students_to_json()
+    add_student_to_csv("Alice Johnson", 20, "Computer Science", 3.8, 60, 2025)
 
-calculate_class_statistics()
+    print("\nStudents in Computer Science:")
+    search_students_by_major("Computer Science")
 
+    export_students_to_json()
 
+    calculate_class_statistics()
 
 
+if __name__ == "__main__":
+    main()
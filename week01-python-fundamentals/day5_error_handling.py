@@ -1,9 +1,3 @@
-
-print("=== DAY 5: ERROR HANDLING AND DEBUGGING ===\n")
-
-print("PART 1: Common Error Types You'll Encounter")
-print("=" * 50)
-
 def demonstrate_common_errors():
     print("🔍 Common Errors in Data Processing:\n")
     print("1. FileNotFoundError Example:")
@@ -45,15 +39,18 @@ def demonstrate_common_errors():
         print(f"   ❌ Caught IndexError: {e}")
         print("   💡 Solution: Check list length or use safer access methods\n")
 
-demonstrate_common_errors()
-
-print("PART 2: Professional Error Handling Patterns")
-print("=" * 50)
 
 import csv
 import json
+import os
+import sys
+from collections.abc import Mapping
 from typing import Optional, List, Dict, Any
 
+# Shared helpers live one folder up (run with ML_PROFILE=1 to turn profiling on)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from shared.profiling import profiled
+
 def safe_file_reader(filename: str) -> Optional[str]:
     try:
         with open(filename, 'r', encoding='utf-8') as file:
@@ -76,11 +73,86 @@ def safe_file_reader(filename: str) -> Optional[str]:
         print(f"❌ Unexpected error reading {filename}: {e}")
         return None
 
-def safe_csv_reader(filename: str) -> List[Dict[str, str]]:
+def load_checkpoint(checkpoint_file: str, filename: str) -> Optional[Dict[str, Any]]:
+    """Read a saved checkpoint, ignoring it if it belongs to a different CSV file"""
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as file:
+            checkpoint = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"⚠️  Ignoring unreadable checkpoint {checkpoint_file}: {e}")
+        return None
+    
+    if checkpoint.get("filename") != os.path.abspath(filename):
+        print(f"⚠️  Checkpoint {checkpoint_file} is for {checkpoint.get('filename')}, starting fresh")
+        return None
+    if checkpoint.get("file_size", 0) > os.path.getsize(filename):
+        print(f"⚠️  {filename} is smaller than when the checkpoint was taken, starting fresh")
+        return None
+    return checkpoint
+
+
+def save_checkpoint(checkpoint_file: str, checkpoint: Dict[str, Any]) -> None:
+    """Write the checkpoint atomically so a crash mid-write never leaves a broken file"""
+    temp_file = checkpoint_file + ".tmp"
+    with open(temp_file, 'w', encoding='utf-8') as file:
+        json.dump(checkpoint, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_file, checkpoint_file)
+
+
+@profiled
+def safe_csv_reader(filename: str, checkpoint_file: str = None,
+                    checkpoint_every: int = 10000) -> List[Dict[str, str]]:
+    """
+    Read and validate student rows. With checkpoint_file set, progress (byte offset,
+    row number and validated rows so far) is saved every checkpoint_every rows and a
+    later run with the same checkpoint_file continues from the last checkpoint.
+    """
     try:
         students = []
-        with open(filename, 'r', newline='') as file:
-            reader = csv.DictReader(file)
+        checkpoint = load_checkpoint(checkpoint_file, filename) if checkpoint_file else None
+        rows_file = checkpoint_file + ".rows" if checkpoint_file else None
+        saved_count = 0  # How many of `students` are already in rows_file
+        
+        if checkpoint and (not os.path.exists(rows_file)
+                           or os.path.getsize(rows_file) < checkpoint.get("rows_bytes", 0)):
+            # The saved rows are gone or cut short: the checkpoint can't be resumed
+            print(f"⚠️  Rows saved with checkpoint {checkpoint_file} are missing, starting fresh")
+            os.remove(checkpoint_file)
+            checkpoint = None
+        
+        if checkpoint:
+            # Drop anything written after the last good checkpoint, then reload the rest
+            with open(rows_file, 'r+', encoding='utf-8') as file:
+                file.truncate(checkpoint["rows_bytes"])
+            with open(rows_file, 'r', encoding='utf-8') as file:
+                students = [json.loads(line) for line in file]
+            saved_count = len(students)
+            print(f"🔁 Resuming {filename} from row {checkpoint['row_num'] + 1} "
+                  f"({saved_count} valid records already loaded)")
+        elif checkpoint_file and os.path.exists(rows_file):
+            os.remove(rows_file)
+        
+        with open(filename, 'rb') as file:
+            # Decode lines ourselves so we always know the byte offset of the next row
+            position = {"offset": 0}
+            
+            def text_lines():
+                for raw_line in file:
+                    position["offset"] += len(raw_line)
+                    yield raw_line.decode('utf-8')
+            
+            if checkpoint:
+                file.seek(checkpoint["offset"])
+                position["offset"] = checkpoint["offset"]
+                reader = csv.DictReader(text_lines(), fieldnames=checkpoint["fieldnames"])
+                start_row = checkpoint["row_num"] + 1
+            else:
+                reader = csv.DictReader(text_lines())
+                start_row = 2  # Start at 2 (after header)
             
             # Validate that we have the expected columns
             expected_columns = {'Name', 'Age', 'Major', 'GPA', 'Credits', 'Graduation_Year'}
@@ -91,7 +163,7 @@ def safe_csv_reader(filename: str) -> List[Dict[str, str]]:
                 print(f"⚠️  Warning: CSV missing columns: {missing}")
                 print(f"   Available columns: {actual_columns}")
             
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
+            for row_num, row in enumerate(reader, start=start_row):
                 try:
                     # Validate individual row data
                     validated_row = validate_student_data(row, row_num)
@@ -100,7 +172,27 @@ def safe_csv_reader(filename: str) -> List[Dict[str, str]]:
                         
                 except Exception as e:
                     print(f"⚠️  Skipping row {row_num} due to error: {e}")
-                    continue
+                
+                if checkpoint_file and (row_num - 1) % checkpoint_every == 0:
+                    with open(rows_file, 'a', encoding='utf-8') as out:
+                        for student in students[saved_count:]:
+                            out.write(json.dumps(student) + "\n")
+                        rows_bytes = out.tell()
+                    saved_count = len(students)
+                    save_checkpoint(checkpoint_file, {
+                        "filename": os.path.abspath(filename),
+                        "file_size": os.path.getsize(filename),
+                        "fieldnames": reader.fieldnames,
+                        "offset": position["offset"],
+                        "row_num": row_num,
+                        "rows_bytes": rows_bytes,
+                    })
+            
+            # Finished cleanly, so the next run should start from the beginning
+            if checkpoint_file:
+                for leftover in (checkpoint_file, rows_file):
+                    if os.path.exists(leftover):
+                        os.remove(leftover)
             
             print(f"✅ Successfully loaded {len(students)} valid student records")
             return students
@@ -108,6 +200,9 @@ def safe_csv_reader(filename: str) -> List[Dict[str, str]]:
     except FileNotFoundError:
         print(f"❌ CSV file not found: {filename}")
         return []
+    except UnicodeDecodeError:
+        print(f"❌ File encoding issue: {filename}")
+        return []
     except csv.Error as e:
         print(f"❌ CSV parsing error: {e}")
         return []
@@ -177,6 +272,36 @@ def validate_student_data(row: Dict[str, str], row_num: int) -> Optional[Dict[st
         print(f"⚠️  Row {row_num} unexpected error: {e}")
         return None
 
+@profiled
+def typed_csv_reader(filename: str) -> Optional[Dict[str, Any]]:
+    """
+    Fast path for big files: parse the student CSV straight into typed NumPy
+    columns using STUDENT_SCHEMA. Bad cells land in result["rejects"] with row numbers.
+    """
+    try:
+        from shared.typed_csv import parse_csv_with_schema, STUDENT_SCHEMA
+    except ImportError:
+        print("❌ NumPy not installed. Run: pip install numpy")
+        return None
+    
+    try:
+        result = parse_csv_with_schema(filename, STUDENT_SCHEMA)
+    except FileNotFoundError:
+        print(f"❌ CSV file not found: {filename}")
+        return None
+    except (ValueError, csv.Error, UnicodeDecodeError) as e:
+        print(f"❌ Could not parse {filename}: {e}")
+        return None
+    
+    print(f"✅ Parsed {result['valid_rows']} of {result['total_rows']} rows into typed columns")
+    for column, values in result["columns"].items():
+        print(f"   {column}: {values.dtype}")
+    for reject in result["rejects"][:5]:
+        print(f"   ⚠️  Row {reject['row']} {reject['column']}: '{reject['value']}' {reject['reason']}")
+    if len(result["rejects"]) > 5:
+        print(f"   ... and {len(result['rejects']) - 5} more rejected cells")
+    return result
+
 def safe_calculation(numbers: List[float], operation: str = "average") -> Optional[float]:
     try:
         if not numbers:
@@ -214,32 +339,11 @@ def safe_calculation(numbers: List[float], operation: str = "average") -> Option
         print(f"❌ Calculation error: {e}")
         return None
 
-# Demonstrate the robust functions
-print("\n🛡️  Testing Robust Error Handling:")
-
-# Test file reading
-print("\n1. Testing safe file reading:")
-content = safe_file_reader("nonexistent.txt")
-print(f"   Result: {content}")
-
-# Test CSV reading with validation
-print("\n2. Testing CSV reading (will work if student_data.csv exists):")
-students = safe_csv_reader("student_data.csv")
-print(f"   Loaded {len(students)} students")
-
-# Test safe calculations
-print("\n3. Testing safe calculations:")
-test_numbers = [3.8, 3.9, 3.2, "invalid", None, 4.0]
-avg = safe_calculation(test_numbers, "average")
-print(f"   Average of {test_numbers}: {avg}")
 
 # =============================================================================
 # PART 4: DEBUGGING TECHNIQUES AND TOOLS
 # =============================================================================
 
-print("\n\nPART 3: Systematic Debugging Approaches")
-print("=" * 45)
-
 def debug_problematic_function():
     print("🐛 Debugging Example: Finding Issues Systematically\n")
     
@@ -365,10 +469,19 @@ def demonstrate_debugging_tools():
         print(f"   ✅ INFO: Processing complete")
     
     process_with_logging(["item1", "item2", "item3", "item4"])
+    
+    # 4. Profiling instead of guessing where the time goes
+    print(f"\n4. Profiling Slow Code:")
+    print("   Print debugging tells you WHAT happened, profiling tells you WHERE time went")
+    print("   Functions marked with @profiled are measured when ML_PROFILE=1 is set:")
+    print("      ML_PROFILE=1 python day5_error_handling.py")
+    print("   At exit you get wall time, CPU time, calls and peak memory per function,")
+    print("   plus profile.folded for flame graph tools (flamegraph.pl, speedscope)")
+    
+    with profiled("demo: summing 100,000 numbers"):
+        total = sum(range(100_000))
+    print(f"   ✅ Profiled block finished (total = {total:,})")
 
-# Run debugging demonstrations
-debug_problematic_function()
-demonstrate_debugging_tools()
 
 # =============================================================================
 # TODAY'S CHALLENGE: BUILD A ROBUST DATA PROCESSOR
@@ -376,8 +489,13 @@ demonstrate_debugging_tools()
 
 import csv
 import json
-from typing import Dict, Any
+import queue
+import random
+import threading
+import time
+from typing import Dict, Any, Iterator
 
+@profiled
 def robust_data_loader(csv_file: str, json_file: str = None) -> Dict[str, Any]:
     result= {"csv_data":[], "json_data":None, "errors":[]}
 
@@ -414,226 +532,618 @@ def robust_data_loader(csv_file: str, json_file: str = None) -> Dict[str, Any]:
     return result
 
 
-def data_validator_and_cleaner(raw_data: List[Dict]) -> Dict[str, Any]:
+def create_error_report(sample_size: int = 5, quarantine_file: str = None,
+                        batch_size: int = 1000) -> Dict[str, Any]:
+    """Create a bounded error report: per-rule counters plus a few example rows per rule"""
+    return {
+        "valid": 0,
+        "invalid": 0,
+        "total": 0,
+        "rules": {},              # {"age_range": 1532, "empty_name": 12}
+        "samples": {},            # {"age_range": [{"row": 7, "message": ..., "data": {...}}]}
+        "sample_size": sample_size,
+        "quarantine_file": quarantine_file,
+        "quarantined": 0,
+        "batch_size": batch_size,
+        "_pending": [],           # Rejected raw rows waiting to be written to disk
+    }
+
+
+def _row_data(raw_row) -> Dict[str, Any]:
+    """A copy of a rejected row to keep, whatever shape the row arrived in"""
+    return dict(raw_row) if isinstance(raw_row, Mapping) else {"raw": repr(raw_row)}
+
+
+def record_validation_error(report: Dict[str, Any], rule: str, row_num: int,
+                            message: str, raw_row: Dict) -> None:
+    """Count one rejected row and keep it only if it wins a spot in the rule's sample"""
+    report["invalid"] += 1
+    seen = report["rules"].get(rule, 0) + 1
+    report["rules"][rule] = seen
+
+    # Reservoir sampling: every bad row has the same chance of being kept,
+    # but we never hold more than sample_size examples per rule
+    samples = report["samples"].setdefault(rule, [])
+    example = {"row": row_num, "message": message, "data": _row_data(raw_row)}
+    if len(samples) < report["sample_size"]:
+        samples.append(example)
+    else:
+        slot = random.randrange(seen)
+        if slot < report["sample_size"]:
+            samples[slot] = example
+
+    if report["quarantine_file"]:
+        report["_pending"].append({"_row": row_num, "_rule": rule, **_row_data(raw_row)})
+        if len(report["_pending"]) >= report["batch_size"]:
+            flush_quarantine(report)
+
+
+def flush_quarantine(report: Dict[str, Any]) -> None:
+    """Append pending rejected rows to the quarantine CSV in one batch"""
+    pending = report["_pending"]
+    if not pending or not report["quarantine_file"]:
+        return
+
+    try:
+        write_header = report["quarantined"] == 0
+        if write_header:
+            # Columns are fixed by the first batch so later batches line up with the header
+            report["_fieldnames"] = []
+            for row in pending:
+                for key in row:
+                    if key not in report["_fieldnames"]:
+                        report["_fieldnames"].append(key)
+
+        with open(report["quarantine_file"], 'w' if write_header else 'a', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=report["_fieldnames"], extrasaction='ignore')
+            if write_header:
+                writer.writeheader()
+            writer.writerows(pending)
+
+        report["quarantined"] += len(pending)
+    except OSError as e:
+        print(f"⚠️  Could not write quarantine file {report['quarantine_file']}: {e}")
+    finally:
+        pending.clear()
+
+
+def finish_error_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Write the last quarantine batch and drop the report's private bookkeeping before handing it out"""
+    flush_quarantine(report)
+    report.pop("_pending", None)
+    report.pop("_fieldnames", None)
+    return report
+
+
+def clean_student_record(student: Dict, row_num: int, reject) -> Optional[Dict[str, Any]]:
+    """Validate one raw CSV row; call reject(rule, row_num, message, student) and return None if it fails"""
+    try:
+        # Name validation
+        name = student.get('Name', '').strip()
+        if not name:
+            reject("empty_name", row_num, f"Row {row_num}: Empty name found", student)
+            return None
+        
+        # Age validation
+        try:
+            age = int(student.get('Age', '0'))
+            if not (16 <= age <= 80):
+                reject("age_range", row_num, f"Row {row_num}: Age {age} outside valid range (16-80)", student)
+                return None
+        except ValueError:
+            reject("age_not_number", row_num, f"Row {row_num}: Age '{student.get('Age', '')}' is not a valid number", student)
+            return None
+        
+        # GPA validation
+        try:
+            gpa = float(student.get('GPA', '0.0'))
+            if not (0.0 <= gpa <= 4.0):
+                reject("gpa_range", row_num, f"Row {row_num}: GPA {gpa} outside valid range (0.0-4.0)", student)
+                return None
+        except ValueError:
+            reject("gpa_not_number", row_num, f"Row {row_num}: GPA '{student.get('GPA', '')}' is not a valid number", student)
+            return None
+        
+        # Major validation
+        major = student.get('Major', '').strip()
+        if not major:
+            reject("empty_major", row_num, f"Row {row_num}: Major cannot be empty", student)
+            return None
+        
+        # Credits validation (your code!)
+        try:
+            credits = int(student.get('Credits', '0'))
+            if credits < 0:  
+                reject("credits_negative", row_num, f"Row {row_num}: Credits cannot be negative", student)
+                return None
+        except ValueError:
+            reject("credits_not_number", row_num, f"Row {row_num}: Credits '{student.get('Credits', '')}' is not a valid number", student)
+            return None
+        
+        # If we get here, all validations passed!
+        return {
+            "Name": name,        # String
+            "Age": age,          # Integer
+            "GPA": gpa,          # Float
+            "Major": major,      # String
+            "Credits": credits,  # Integer
+        }
+        
+    except Exception as e:
+        reject("unexpected_error", row_num, f"Row {row_num}: Unexpected error - {e}", student)
+        return None
+
+
+@profiled
+def data_validator_and_cleaner(raw_data: List[Dict], sample_size: int = 5,
+                               quarantine_file: str = None, max_warnings: int = 20) -> Dict[str, Any]:
     result = {
         "clean_data": [],
-        "error_report": {"valid": 0, "invalid": 0, "total": len(raw_data)},
-        "warnings": []
+        "error_report": create_error_report(sample_size, quarantine_file),
+        "warnings": []            # Only the first max_warnings messages, counters hold the rest
     }
     
-    for i, student in enumerate(raw_data):
-        try:
-            # Name validation
-            name = student.get('Name', '').strip()
-            if not name:
-                result["warnings"].append(f"Row {i+1}: Empty name found")
-                result["error_report"]["invalid"] += 1
-                continue
-            
-            # Age validation
-            try:
-                age = int(student.get('Age', '0'))
-                if not (16 <= age <= 80):
-                    result["warnings"].append(f"Row {i+1}: Age {age} outside valid range (16-80)")
-                    result["error_report"]["invalid"] += 1
-                    continue
-            except ValueError:
-                result["warnings"].append(f"Row {i+1}: Age '{student.get('Age', '')}' is not a valid number")
-                result["error_report"]["invalid"] += 1
-                continue
-            
-            # GPA validation
-            try:
-                gpa = float(student.get('GPA', '0.0'))
-                if not (0.0 <= gpa <= 4.0):
-                    result["warnings"].append(f"Row {i+1}: GPA {gpa} outside valid range (0.0-4.0)")
-                    result["error_report"]["invalid"] += 1
-                    continue
-            except ValueError:
-                result["warnings"].append(f"Row {i+1}: GPA '{student.get('GPA', '')}' is not a valid number")
-                result["error_report"]["invalid"] += 1
-                continue
-            
-            # Major validation
-            major = student.get('Major', '').strip()
-            if not major:
-                result["warnings"].append(f"Row {i+1}: Major cannot be empty")
-                result["error_report"]["invalid"] += 1
-                continue
-            
-            # Credits validation (your code!)
-            try:
-                credits = int(student.get('Credits', '0'))
-                if credits < 0:  
-                    result["warnings"].append(f"Row {i+1}: Credits cannot be negative")
-                    result["error_report"]["invalid"] += 1
-                    continue
-            except ValueError:
-                result["warnings"].append(f"Row {i+1}: Credits '{student.get('Credits', '')}' is not a valid number")
-                result["error_report"]["invalid"] += 1
-                continue
-            
-            # If we get here, all validations passed!
-            cleaned_student = {
-                "Name": name,        # String
-                "Age": age,          # Integer
-                "GPA": gpa,          # Float
-                "Major": major,      # String
-                "Credits": credits,  # Integer
-            }
-            
-            result["clean_data"].append(cleaned_student)
-            result["error_report"]["valid"] += 1
-            
-        except Exception as e:
-            result["warnings"].append(f"Row {i+1}: Unexpected error - {e}")
-            result["error_report"]["invalid"] += 1
+    # The whole list is a single batch for the streaming validator below
+    for clean_batch in validate_and_clean_batches([raw_data], result["error_report"],
+                                                  result["warnings"], max_warnings):
+        result["clean_data"].extend(clean_batch)
     
+    note_hidden_warnings(finish_error_report(result["error_report"]), result["warnings"])
     return result
 
 
-def safe_statistics_calculator(clean_data: List[Dict]) -> Dict[str, Any]:
-    result = {
-        "gpa_by_major": {},           # Average GPA for each major
-        "student_count_by_major": {}, # How many students per major
-        "age_statistics": {},         # Age-related stats
-        "credit_statistics": {},      # Credit-related stats
-        "overall_stats": {},          # General statistics
-        "errors": []                  # Any calculation errors
-    }
+def note_hidden_warnings(report: Dict[str, Any], warnings: List[str]) -> None:
+    """Say how many invalid rows didn't get a warning of their own"""
+    if report["invalid"] > len(warnings):
+        hidden = report["invalid"] - len(warnings)
+        warnings.append(f"... {hidden} more invalid rows (see error_report['rules'])")
+
+
+def print_error_report(report: Dict[str, Any]) -> None:
+    """Show the per-rule counters and example rows from a validation run"""
+    print(f"\n📋 VALIDATION REPORT: {report['valid']} valid, {report['invalid']} invalid, {report['total']} total")
+    
+    for rule, count in sorted(report["rules"].items(), key=lambda item: -item[1]):
+        print(f"   ❌ {rule}: {count} rows")
+        for example in report["samples"].get(rule, []):
+            print(f"      • {example['message']}")
     
+    if report["quarantine_file"]:
+        print(f"   🗄️  {report['quarantined']} rejected rows saved to {report['quarantine_file']}")
+
+
+@profiled
+def safe_statistics_calculator(clean_data: List[Dict]) -> Dict[str, Any]:
     if not clean_data:
-        result["errors"].append("No data provided for statistics calculation")
-        return result
+        return finish_running_statistics(create_running_statistics())   # Reports "No data provided"
     
     print(f"📊 Calculating statistics for {len(clean_data)} students...")
     
-    # Calculate GPA statistics by major
+    # The streaming pipeline's counters, fed the whole list as one batch
     try:
-        # Step 1: Group students by major and collect their GPAs
-        majors_data = {}  # Will store: {"Computer Science": [3.8, 3.2], "Mathematics": [3.9]}
-        
-        for student in clean_data:
-            major = student.get("Major", "Unknown")
-            gpa = student.get("GPA", 0.0)
-            
-            # Create list for this major if it doesn't exist
-            if major not in majors_data:
-                majors_data[major] = []
-            
-            # Add this student's GPA to their major's list
-            majors_data[major].append(gpa)
-        
-        print(f"🎓 Found students in {len(majors_data)} different majors")
-        
-        # Step 2: Calculate statistics for each major
-        for major, gpa_list in majors_data.items():
-            if gpa_list:  # Make sure list isn't empty
-                average_gpa = sum(gpa_list) / len(gpa_list)
-                result["gpa_by_major"][major] = {
-                    "average_gpa": round(average_gpa, 2),
-                    "student_count": len(gpa_list),
-                    "highest_gpa": max(gpa_list),
-                    "lowest_gpa": min(gpa_list)
-                }
-                print(f"   📚 {major}: {average_gpa:.2f} average ({len(gpa_list)} students)")
-        
-        # Step 3: Count students by major
-        for major, gpa_list in majors_data.items():
-            result["student_count_by_major"][major] = len(gpa_list)
-        
+        running = create_running_statistics()
+        for _ in accumulate_statistics([clean_data], running):
+            pass
+        result = finish_running_statistics(running)
     except Exception as e:
-        result["errors"].append(f"Error calculating GPA by major: {e}")
+        result = finish_running_statistics(create_running_statistics())
+        result["errors"] = [f"Error calculating statistics: {e}"]
     
-    # Calculate age statistics
-    try:
-        # Extract all ages and filter out invalid ones
-        ages = [student.get("Age", 0) for student in clean_data]
-        ages = [age for age in ages if age > 0]  # Remove invalid ages
-        
-        if ages:
-            result["age_statistics"] = {
-                "average_age": round(sum(ages) / len(ages), 1),
-                "youngest": min(ages),
-                "oldest": max(ages),
-                "total_students": len(ages),
-                "age_range": max(ages) - min(ages)
-            }
-            print(f"👥 Age range: {min(ages)} to {max(ages)}, average: {result['age_statistics']['average_age']}")
-        
-    except Exception as e:
-        result["errors"].append(f"Error calculating age statistics: {e}")
+    print(f"🎓 Found students in {len(result['gpa_by_major'])} different majors")
+    for major, stats in result["gpa_by_major"].items():
+        print(f"   📚 {major}: {stats['average_gpa']:.2f} average ({stats['student_count']} students)")
     
-    # Calculate credit statistics
-    try:
-        credits = [student.get("Credits", 0) for student in clean_data]
-        credits = [c for c in credits if c >= 0]  # Remove invalid credits
-        
-        if credits:
-            result["credit_statistics"] = {
-                "average_credits": round(sum(credits) / len(credits), 1),
-                "min_credits": min(credits),
-                "max_credits": max(credits),
-                "total_credits": sum(credits),
-                "students_near_graduation": len([c for c in credits if c >= 100])  # Assuming 120 is graduation
-            }
-            print(f"📚 Credits: {min(credits)} to {max(credits)}, average: {result['credit_statistics']['average_credits']}")
-            print(f"🎓 {result['credit_statistics']['students_near_graduation']} students near graduation (100+ credits)")
-        
-    except Exception as e:
-        result["errors"].append(f"Error calculating credit statistics: {e}")
+    ages = result["age_statistics"]
+    if ages:
+        print(f"👥 Age range: {ages['youngest']} to {ages['oldest']}, average: {ages['average_age']}")
     
-    # Calculate overall statistics
-    try:
-        # Extract all GPAs for overall analysis
-        all_gpas = [student.get("GPA", 0.0) for student in clean_data]
-        all_gpas = [gpa for gpa in all_gpas if gpa > 0]  # Remove invalid GPAs
-        
-        if all_gpas:
-            result["overall_stats"] = {
-                "total_students": len(clean_data),
-                "overall_average_gpa": round(sum(all_gpas) / len(all_gpas), 2),
-                "highest_gpa": max(all_gpas),
-                "lowest_gpa": min(all_gpas),
-                "gpa_range": round(max(all_gpas) - min(all_gpas), 2),
-                "students_with_high_gpa": len([gpa for gpa in all_gpas if gpa >= 3.5]),  # A- or better
-                "students_with_honors": len([gpa for gpa in all_gpas if gpa >= 3.7]),    # Dean's list
-                "students_on_probation": len([gpa for gpa in all_gpas if gpa < 2.0]),   # Academic probation
-                "median_gpa": round(sorted(all_gpas)[len(all_gpas)//2], 2)              # Middle value
-            }
-            
-            print(f"🎯 Overall: {result['overall_stats']['overall_average_gpa']} average GPA")
-            print(f"🌟 {result['overall_stats']['students_with_high_gpa']} students with high GPA (3.5+)")
-            print(f"🏆 {result['overall_stats']['students_with_honors']} students with honors (3.7+)")
-            
-            if result['overall_stats']['students_on_probation'] > 0:
-                print(f"⚠️  {result['overall_stats']['students_on_probation']} students on academic probation (<2.0)")
+    credits = result["credit_statistics"]
+    if credits:
+        print(f"📚 Credits: {credits['min_credits']} to {credits['max_credits']}, average: {credits['average_credits']}")
+        print(f"🎓 {credits['students_near_graduation']} students near graduation (100+ credits)")
+    
+    overall = result["overall_stats"]
+    if overall:
+        print(f"🎯 Overall: {overall['overall_average_gpa']} average GPA")
+        print(f"🌟 {overall['students_with_high_gpa']} students with high GPA (3.5+)")
+        print(f"🏆 {overall['students_with_honors']} students with honors (3.7+)")
         
-    except Exception as e:
-        result["errors"].append(f"Error calculating overall statistics: {e}")
+        if overall['students_on_probation'] > 0:
+            print(f"⚠️  {overall['students_on_probation']} students on academic probation (<2.0)")
     
     # Summary report
+    print(f"\n📋 STATISTICS SUMMARY:")
+    print(f"   Total students analyzed: {len(clean_data)}")
+    print(f"   Majors represented: {len(result['gpa_by_major'])}")
+    print(f"   Calculation errors: {len(result['errors'])}")
+    
+    if result['errors']:
+        print(f"⚠️  Errors encountered: {result['errors']}")
+    else:
+        print("✅ All calculations completed successfully!")
+    
+    return result
+
+
+# =============================================================================
+# PUTTING IT TOGETHER: A STREAMING PIPELINE
+# =============================================================================
+# The functions above each take and return a full list. For big files the
+# pipeline below passes small batches from stage to stage instead, so only a
+# few batches are ever in memory. With overlap=True each stage runs in its own
+# thread with a bounded queue in between.
+
+_PIPELINE_DONE = object()
+
+
+def robust_batch_loader(csv_file: str, batch_size: int = 1000,
+                        errors: List[str] = None) -> Iterator[List[Dict]]:
+    """Streaming version of robust_data_loader: yield raw CSV rows batch_size at a time"""
     try:
-        print(f"\n📋 STATISTICS SUMMARY:")
-        print(f"   Total students analyzed: {len(clean_data)}")
-        print(f"   Majors represented: {len(result.get('gpa_by_major', {}))}")
-        print(f"   Calculation errors: {len(result['errors'])}")
-        
-        if result['errors']:
-            print(f"⚠️  Errors encountered: {result['errors']}")
-        else:
-            print("✅ All calculations completed successfully!")
-            
+        with open(csv_file, 'r', newline='') as file:
+            print("CSV file opened successfully.")
+            batch = []
+            for row in csv.DictReader(file):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+    except FileNotFoundError:
+        print(f"File not found: {csv_file}")
+        if errors is not None:
+            errors.append(f"CSV file not found: {csv_file}")
     except Exception as e:
-        result["errors"].append(f"Error generating summary: {e}")
-    
+        print(f"Error reading CSV: {e}")
+        if errors is not None:
+            errors.append(f"CSV error: {e}")
+
+
+def validate_and_clean_batches(batches: Iterator[List[Dict]], report: Dict[str, Any],
+                               warnings: List[str], max_warnings: int = 20) -> Iterator[List[Dict]]:
+    """Validate rows batch by batch, one error report shared across all batches (data_validator_and_cleaner is one batch)"""
+    def reject(rule, row_num, message, student):
+        if len(warnings) < max_warnings:
+            warnings.append(message)
+        record_validation_error(report, rule, row_num, message, student)
+
+    for batch in batches:
+        clean_batch = []
+        for student in batch:
+            report["total"] += 1
+            cleaned_student = clean_student_record(student, report["total"], reject)
+            if cleaned_student is not None:
+                clean_batch.append(cleaned_student)
+                report["valid"] += 1
+        yield clean_batch
+
+    flush_quarantine(report)
+
+
+def create_running_statistics() -> Dict[str, Any]:
+    """Counters that safe_statistics_calculator's numbers are built from, one batch at a time"""
+    return {
+        "majors": {},             # {"Mathematics": {"sum": 7.7, "count": 2, "max": 3.9, "min": 3.8}}
+        "age_sum": 0, "age_count": 0, "age_min": None, "age_max": None,
+        "credit_sum": 0, "credit_count": 0, "credit_min": None, "credit_max": None,
+        "near_graduation": 0,
+        "students": 0,
+        "gpa_sum": 0.0, "gpa_count": 0, "gpa_min": None, "gpa_max": None,
+        "high_gpa": 0, "honors": 0, "probation": 0,
+        "gpa_counts": {},         # {3.5: 812}, GPAs rounded to 2 places: at most 401 keys, for the median
+    }
+
+
+def _fold_min_max(running: Dict[str, Any], key: str, values: List) -> None:
+    """Add one batch's values to the running sum/count/min/max kept under key"""
+    if not values:
+        return
+    running[key + "_sum"] += sum(values)
+    running[key + "_count"] += len(values)
+    low, high = min(values), max(values)
+    running[key + "_min"] = low if running[key + "_min"] is None else min(running[key + "_min"], low)
+    running[key + "_max"] = high if running[key + "_max"] is None else max(running[key + "_max"], high)
+
+
+def accumulate_statistics(batches: Iterator[List[Dict]], running: Dict[str, Any]) -> Iterator[List[Dict]]:
+    """Fold each clean batch into the running counters, then pass the batch along"""
+    for batch in batches:
+        running["students"] += len(batch)
+
+        # Ages must be positive, credits non-negative, GPAs positive to count
+        gpas_by_major = {}
+        for student in batch:
+            gpas_by_major.setdefault(student.get("Major", "Unknown"), []).append(student.get("GPA", 0.0))
+        for major, gpa_list in gpas_by_major.items():
+            totals = running["majors"].setdefault(major, {"sum": 0.0, "count": 0,
+                                                          "max": gpa_list[0], "min": gpa_list[0]})
+            totals["sum"] += sum(gpa_list)
+            totals["count"] += len(gpa_list)
+            totals["max"] = max(totals["max"], max(gpa_list))
+            totals["min"] = min(totals["min"], min(gpa_list))
+
+        _fold_min_max(running, "age", [age for age in (s.get("Age", 0) for s in batch) if age > 0])
+
+        credits = [c for c in (s.get("Credits", 0) for s in batch) if c >= 0]
+        _fold_min_max(running, "credit", credits)
+        running["near_graduation"] += len([c for c in credits if c >= 100])
+
+        gpas = [gpa for gpa in (s.get("GPA", 0.0) for s in batch) if gpa > 0]
+        _fold_min_max(running, "gpa", gpas)
+        running["high_gpa"] += len([gpa for gpa in gpas if gpa >= 3.5])
+        running["honors"] += len([gpa for gpa in gpas if gpa >= 3.7])
+        running["probation"] += len([gpa for gpa in gpas if gpa < 2.0])
+        # Rounding can't move a GPA past its neighbours, so the middle rounded GPA is the rounded median
+        gpa_counts = running["gpa_counts"]
+        for gpa in gpas:
+            gpa = round(gpa, 2)
+            gpa_counts[gpa] = gpa_counts.get(gpa, 0) + 1
+        yield batch
+
+
+def finish_running_statistics(running: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn the running counters into the same result dict safe_statistics_calculator returns"""
+    result = {
+        "gpa_by_major": {},
+        "student_count_by_major": {},
+        "age_statistics": {},
+        "credit_statistics": {},
+        "overall_stats": {},
+        "errors": []
+    }
+
+    if not running["students"]:
+        result["errors"].append("No data provided for statistics calculation")
+        return result
+
+    for major, totals in running["majors"].items():
+        result["gpa_by_major"][major] = {
+            "average_gpa": round(totals["sum"] / totals["count"], 2),
+            "student_count": totals["count"],
+            "highest_gpa": totals["max"],
+            "lowest_gpa": totals["min"]
+        }
+        result["student_count_by_major"][major] = totals["count"]
+
+    if running["age_count"]:
+        result["age_statistics"] = {
+            "average_age": round(running["age_sum"] / running["age_count"], 1),
+            "youngest": running["age_min"],
+            "oldest": running["age_max"],
+            "total_students": running["age_count"],
+            "age_range": running["age_max"] - running["age_min"]
+        }
+
+    if running["credit_count"]:
+        result["credit_statistics"] = {
+            "average_credits": round(running["credit_sum"] / running["credit_count"], 1),
+            "min_credits": running["credit_min"],
+            "max_credits": running["credit_max"],
+            "total_credits": running["credit_sum"],
+            "students_near_graduation": running["near_graduation"]
+        }
+
+    gpa_counts = running["gpa_counts"]
+    if running["gpa_count"]:
+        lowest, highest = running["gpa_min"], running["gpa_max"]
+
+        # Median: walk the sorted distinct GPAs until we reach the middle position
+        middle, seen, median = running["gpa_count"] // 2, 0, highest
+        for gpa in sorted(gpa_counts):
+            seen += gpa_counts[gpa]
+            if seen > middle:
+                median = gpa
+                break
+
+        result["overall_stats"] = {
+            "total_students": running["students"],
+            "overall_average_gpa": round(running["gpa_sum"] / running["gpa_count"], 2),
+            "highest_gpa": highest,
+            "lowest_gpa": lowest,
+            "gpa_range": round(highest - lowest, 2),
+            "students_with_high_gpa": running["high_gpa"],    # A- or better
+            "students_with_honors": running["honors"],        # Dean's list
+            "students_on_probation": running["probation"],    # Academic probation
+            "median_gpa": round(median, 2)                    # Middle value
+        }
+
     return result
 
 
-print("\n🧪 Testing Framework:")
-print("Implement the functions above, then run:")
-print("comprehensive_data_pipeline('student_data.csv')")
+def _metered_input(batches: Iterator[List[Dict]], timing: Dict[str, Any]) -> Iterator[List[Dict]]:
+    """Hand batches to a stage while recording rows in and the time spent waiting upstream"""
+    batches = iter(batches)
+    while True:
+        started = time.perf_counter()
+        batch = next(batches, _PIPELINE_DONE)
+        timing["waiting"] += time.perf_counter() - started
+        if batch is _PIPELINE_DONE:
+            return
+        timing["rows_in"] += len(batch)
+        yield batch
+
+
+def _timed_stage(stage: Iterator[List[Dict]], timing: Dict[str, Any]) -> Iterator[List[Dict]]:
+    """Run a stage, counting only the time spent inside it (not upstream, not downstream)"""
+    busy = 0.0
+    started = time.perf_counter()
+    for batch in stage:
+        busy += time.perf_counter() - started
+        timing["rows_out"] += len(batch)
+        timing["batches"] += 1
+        yield batch
+        started = time.perf_counter()
+    busy += time.perf_counter() - started
+    timing["seconds"] = busy - timing["waiting"]
+
+
+def _queued(batches: Iterator[List[Dict]], max_batches: int, stop: threading.Event,
+            threads: List[threading.Thread]) -> Iterator[List[Dict]]:
+    """
+    Run the upstream stages in a worker thread; a bounded queue hands batches over.
+    Both ends give up once `stop` is set, which happens when any consumer stops early
+    (an error downstream, or close()), so no worker waits on a queue forever. The
+    worker is added to `threads` for the pipeline to join.
+    """
+    handoff = queue.Queue(maxsize=max_batches)
+
+    def hand_over(item):
+        while not stop.is_set():
+            try:
+                handoff.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass          # Check again whether anyone is still reading
+        return False
+
+    def worker():
+        try:
+            for batch in batches:
+                if not hand_over(batch):
+                    return
+        except Exception as e:
+            hand_over(e)
+        finally:
+            hand_over(_PIPELINE_DONE)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    threads.append(thread)
+    thread.start()
+    finished = False
+    try:
+        while not stop.is_set():
+            try:
+                item = handoff.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _PIPELINE_DONE:
+                finished = True
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        if not finished:
+            stop.set()        # Nobody reads the rest: tell every stage to wind down
+
+
+@profiled
+def comprehensive_data_pipeline(csv_file: str, batch_size: int = 1000, overlap: bool = False,
+                                queue_size: int = 4, quarantine_file: str = None,
+                                max_warnings: int = 20) -> Dict[str, Any]:
+    """
+    Load -> validate/clean -> statistics, streaming batches of rows between the stages.
+
+    Only a few batches are alive at once, so memory stays flat no matter how big the
+    file is. With overlap=True every stage runs in its own thread, connected by queues
+    that hold at most queue_size batches. The stages here are pure Python, so the GIL
+    keeps that from being faster today; it pays off once a stage waits on I/O.
+    """
+    print(f"\n🚀 Running data pipeline on {csv_file} (batches of {batch_size}, overlap={overlap})")
+    result = {
+        "statistics": {},
+        "error_report": create_error_report(quarantine_file=quarantine_file),
+        "warnings": [],
+        "errors": [],
+        "stages": {},             # {"load": {"seconds": 0.4, "rows_in": 0, "rows_out": 5000, "batches": 5}}
+    }
+    running = create_running_statistics()
+    stop, threads = threading.Event(), []   # Only used with overlap=True
+    started = time.perf_counter()
+
+    stages = [
+        ("load", lambda batches: robust_batch_loader(csv_file, batch_size, result["errors"])),
+        ("validate", lambda batches: validate_and_clean_batches(batches, result["error_report"],
+                                                                result["warnings"], max_warnings)),
+        ("statistics", lambda batches: accumulate_statistics(batches, running)),
+    ]
+
+    batches = iter(())
+    for name, make_stage in stages:
+        timing = {"seconds": 0.0, "waiting": 0.0, "rows_in": 0, "rows_out": 0, "batches": 0}
+        result["stages"][name] = timing
+        batches = _timed_stage(make_stage(_metered_input(batches, timing)), timing)
+        if overlap:
+            batches = _queued(batches, queue_size, stop, threads)
+
+    try:
+        for _ in batches:
+            pass              # The last stage already folded the batch into the running totals
+    except Exception as e:
+        print(f"❌ Pipeline failed: {e}")
+        result["errors"].append(f"Pipeline error: {e}")
+    finally:
+        # Stage threads still running (after an error) give up on their queues and end
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    result["statistics"] = finish_running_statistics(running)
+    report = finish_error_report(result["error_report"])
+    note_hidden_warnings(report, result["warnings"])
+
+    elapsed = time.perf_counter() - started
+    print(f"\n⏱️  PIPELINE STAGES ({elapsed:.3f}s wall clock):")
+    for name, timing in result["stages"].items():
+        print(f"   {name:<11} {timing['seconds']:8.3f}s  {timing['rows_in']:>9} in  "
+              f"{timing['rows_out']:>9} out  {timing['batches']:>6} batches")
+
+    overall = result["statistics"]["overall_stats"]
+    if overall:
+        print(f"🎯 {overall['total_students']} clean students, {overall['overall_average_gpa']} average GPA, "
+              f"median {overall['median_gpa']}")
+    if report["invalid"]:
+        print_error_report(report)
+    if result["errors"]:
+        print(f"⚠️  Errors encountered: {result['errors']}")
+
+    return result
+
+
+def main():
+    print("=== DAY 5: ERROR HANDLING AND DEBUGGING ===\n")
+
+    print("PART 1: Common Error Types You'll Encounter")
+    print("=" * 50)
+
+    demonstrate_common_errors()
+
+    print("PART 2: Professional Error Handling Patterns")
+    print("=" * 50)
+
+    # Demonstrate the robust functions
+    print("\n🛡️  Testing Robust Error Handling:")
+
+    # Test file reading
+    print("\n1. Testing safe file reading:")
+    content = safe_file_reader("nonexistent.txt")
+    print(f"   Result: {content}")
+
+    # Test CSV reading with validation
+    print("\n2. Testing CSV reading (will work if student_data.csv exists):")
+    students = safe_csv_reader("student_data.csv")
+    print(f"   Loaded {len(students)} students")
+
+    # Test safe calculations
+    print("\n3. Testing safe calculations:")
+    test_numbers = [3.8, 3.9, 3.2, "invalid", None, 4.0]
+    avg = safe_calculation(test_numbers, "average")
+    print(f"   Average of {test_numbers}: {avg}")
+
+    print("\n\nPART 3: Systematic Debugging Approaches")
+    print("=" * 45)
+
+    # Run debugging demonstrations
+    debug_problematic_function()
+    demonstrate_debugging_tools()
+
+    print("\n🧪 Testing Framework:")
+    comprehensive_data_pipeline('student_data.csv')
+
+    print("\n🎉 Day 5 Complete! You've mastered professional error handling!")
+    print("💡 Tomorrow: Working with libraries - expanding Python's capabilities!")
 
 
-print("\n🎉 Day 5 Complete! You've mastered professional error handling!")
-print("💡 Tomorrow: Working with libraries - expanding Python's capabilities!")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
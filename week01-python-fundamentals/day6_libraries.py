@@ -1,12 +1,7 @@
-print("=== DAY 6: WORKING WITH LIBRARIES ===\n")
-
 # =============================================================================
 # EXPLORING PYTHON'S STANDARD LIBRARY (8 minutes)
 # =============================================================================
 
-print("PART 1: Python's Built-in Powerhouse")
-print("=" * 40)
-
 # Standard library modules - already available, no installation needed
 import os
 import sys
@@ -16,6 +11,12 @@ import collections
 import urllib.request
 import pathlib
 
+# Shared helpers live one folder up
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from shared.pypi_client import (close_pypi_client, create_pypi_client,
+                                fetch_many_packages, write_local_index)
+from shared.word_count import count_words
+
 def explore_standard_library(): 
     print("🔧 System and OS Information:")
     print(f"   Python version: {sys.version}")
@@ -40,6 +41,10 @@ def explore_standard_library():
     text = "machine learning is amazing for data analysis"
     word_count = collections.Counter(text.split())
     print(f"   Word frequency: {dict(word_count)}")
+
+    # The same idea for files of any size: count_words shards them across processes
+    file_counts = count_words([os.path.abspath(__file__)], top_k=5)
+    print(f"   Top words in this script: {file_counts['top']} ({file_counts['total_words']:,} words)")
     
     # defaultdict - provides default values for missing keys
     student_grades = collections.defaultdict(list)
@@ -58,15 +63,11 @@ def explore_standard_library():
     print(f"   Example data path: {data_path}")
     print(f"   File extension: {data_path.suffix}")
 
-explore_standard_library()
 
 # =============================================================================
 # UNDERSTANDING IMPORTS AND MODULES (7 minutes)
 # =============================================================================
 
-print("\n\nPART 2: Mastering Import Systems")
-print("=" * 35)
-
 def demonstrate_import_patterns():
     print("🔍 Different Import Patterns:\n")
     
@@ -102,50 +103,55 @@ def demonstrate_import_patterns():
     print(f"   - Avoid 'import *' in production code")
     print(f"   - Group imports: standard library, third-party, local modules")
 
-demonstrate_import_patterns()
 
 # =============================================================================
 # WORKING WITH THIRD-PARTY LIBRARIES
 # =============================================================================
 
-print("\n\nPART 3: Third-Party Library Ecosystem")
-print("=" * 40)
-
-def demonstrate_requests_library(): #You might need to install request 1st using "pip install requests"
+def demonstrate_requests_library(packages=None, index=None): #You might need to install request 1st using "pip install requests"
+    """
+    Fetch package info from PyPI through the shared client: one pooled session, several
+    packages at once, and an on-disk cache that asks PyPI "has this changed?" (ETag /
+    Last-Modified) instead of downloading everything again. Without requests (or with
+    index="folder") it reads a local index built from the packages installed here.
+    """
     print("🌐 Working with External Libraries - Requests Example:\n")
+    packages = packages or ["pandas", "numpy", "requests"]
     
     try:
         import requests
         print("✅ Requests library is available!")
-        
-        # Example: Get information about Python packages
-        print("\n📦 Fetching Package Information from PyPI:")
-        
-        # PyPI API example - get info about pandas
-        try:
-            response = requests.get("https://pypi.org/pypi/pandas/json", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                info = data['info']
-                print(f"   Package: {info['name']}")
-                print(f"   Version: {info['version']}")
-                print(f"   Description: {info['summary'][:100]}...")
-                print(f"   Author: {info['author']}")
-            else:
-                print(f"   API request failed with status: {response.status_code}")
-                
-        except requests.exceptions.RequestException as e:
-            print(f"   ⚠️  Network request failed: {e}")
-            print("   (This is normal if you're offline)")
-        
     except ImportError:
         print("❌ Requests library not installed")
         print("\n🔧 To install requests, run in terminal:")
         print("   pip install requests")
-        print("\n💡 Then restart this script to see it in action!")
+        print("\n💡 Meanwhile, here is the same client reading a local index instead:")
+        if index is None:
+            index = os.path.join(pathlib.Path.home(), ".cache", "ml_journey_pypi_index")
+            written = write_local_index(index, packages)
+            if written:
+                print(f"   Added {len(written)} installed packages to the local index in {index}")
+    
+    print("\n📦 Fetching Package Information from PyPI:")
+    client = create_pypi_client(index=index)
+    try:
+        for name, info in fetch_many_packages(client, packages).items():
+            if info["error"]:
+                print(f"   ⚠️  {name}: {info['error']}")
+                if info["source"] == "network":
+                    print("   (This is normal if you're offline)")
+                continue
+            print(f"   Package: {info['name']}  (from {info['source']})")
+            print(f"   Version: {info['version']}")
+            print(f"   Description: {info['summary'][:100]}...")
+            print(f"   Author: {info['author']}")
+    finally:
+        close_pypi_client(client)
+    
+    stats = client["stats"]
+    print(f"\n   📊 {stats['requests']} requests, {stats['not_modified']} not modified, "
+          f"{stats['fresh_cache']} answered from cache, {stats['errors']} errors")
 
-# Try to demonstrate requests (may fail if not installed)
-demonstrate_requests_library()
 
 def explore_data_science_libraries():
     # Dictionary of important libraries and their purposes
@@ -208,51 +214,163 @@ def explore_data_science_libraries():
 # TODAY'S PROJECT: LIBRARY EXPLORATION TOOL (Complete this!)
 # =============================================================================
 
-print("🎯 TODAY'S PROJECT: Library Information Tool")
-print("=" * 50)
+import importlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Import-free probing, metadata versions and their caches
+from shared.environment import (build_environment_report, deep_check_library,
+                                library_versions, measure_import_cost, measure_import_costs,
+                                probe_library)
+
+
+def _prefetch_library(library_name, warm_import=False):
+    """Everything the explorer menus need about one library, worked out ahead of time"""
+    probe = probe_library(library_name)
+    info = {"probe": probe}
+    if probe["importable"]:
+        info["import_cost"] = measure_import_cost(library_name)
+        if warm_import:
+            try:
+                info["module"] = importlib.import_module(library_name)   # Later imports are then instant
+            except Exception:
+                pass   # get_library_info reports import errors itself
+    return info
+
+
+def start_library_prefetch(library_list, max_workers=4, warm_import=False):
+    """
+    Start working out probes, versions and import costs for library_list in background
+    threads. warm_import=True also imports each library there, so get_library_info can
+    show its docs and attributes without waiting - opt-in, since it runs heavy library
+    imports on worker threads. Returns a prefetch dict for the functions below.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="library-prefetch")
+    return {
+        "executor": executor,
+        # Fills the on-disk version cache in one go (one write, not one per library)
+        "versions": executor.submit(library_versions, list(library_list)),
+        "libraries": {library: executor.submit(_prefetch_library, library, warm_import)
+                      for library in library_list},
+    }
+
+
+def _prefetched(future):
+    if not future.done() and not future.running() and future.cancel():
+        return None   # Still queued: quicker for the caller to do it directly
+    try:
+        return future.result()   # Finished, or about to be
+    except Exception:
+        return None
+
+
+def prefetched_library(prefetch, library_name):
+    """The prefetched info for a library, or None if it was never asked for or has not started"""
+    if prefetch is None or library_name not in prefetch["libraries"]:
+        return None
+    return _prefetched(prefetch["libraries"][library_name])
+
+
+def prefetched_version(prefetch, library_name):
+    """A library's version from the prefetch, else from the version cache (or package metadata)"""
+    versions = _prefetched(prefetch["versions"]) if prefetch is not None else None
+    if versions is None or library_name not in versions:
+        versions = library_versions([library_name])
+    return versions[library_name]
+
+
+def stop_library_prefetch(prefetch):
+    """Drop whatever has not started yet; running lookups finish in the background"""
+    prefetch["executor"].shutdown(wait=False, cancel_futures=True)
+
+
+def check_library_availability(library_list, deep=False, max_workers=None, prefetch=None):
+    """
+    Check which libraries are available for import.
 
-def check_library_availability(library_list):
-    """Check which libraries are available for import"""
+    By default each library is only located on disk (importlib.util.find_spec), which
+    takes microseconds. With deep=True each library is really imported, each one in its
+    own subprocess, several at a time, so import errors inside the package show up too.
+    Libraries in `prefetch` (see start_library_prefetch) are answered from it.
+    """
     result = {}
-    
-    print(f"🔍 Checking {len(library_list)} libraries...")
-    
-    for library_num, library in enumerate(library_list, 1):
+
+    print(f"🔍 Checking {len(library_list)} libraries{' (deep import check)' if deep else ''}...")
+
+    if deep:
+        # Threads only wait on the child processes, so the imports run in parallel
+        workers = max_workers or max(1, min(len(library_list), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            checks = list(pool.map(deep_check_library, library_list))
+    else:
+        checks = []
+        for library in library_list:
+            cached = prefetched_library(prefetch, library)
+            checks.append(cached["probe"] if cached else probe_library(library))
+
+    for library_num, (library, check) in enumerate(zip(library_list, checks), 1):
         print(f"Checking {library_num}/{len(library_list)}: {library}")
-        
-        try:
-            __import__(library)
-            result[library] = {"status": "Available", "importable": True}
-        except ImportError:
-            result[library] = {"status": "Not installed", "importable": False}
-        except Exception as e:
-            result[library] = {"status": f"Error: {e}", "importable": False}
-    
+        result[library] = check
+
     available = sum(1 for lib in result.values() if lib["importable"])
     total = len(library_list)
     print(f"\n✅ Check complete: {available}/{total} libraries available")
-    
+
     return result
 
 # check_library_availability(libraries)
 
 
-
-def get_library_info(library_name):
-    """Get detailed information about a library"""
+def get_library_info(library_name, import_cost=False, prefetch=None):
+    """
+    Get detailed information about a library.
+    import_cost=True also measures a cold import of it in a fresh process
+    (time, memory and modules it adds); `prefetch` may already have done that.
+    """
     result = {}
+    cost = None
+    cached = prefetched_library(prefetch, library_name)
+    if import_cost and not (cached and not cached["probe"]["importable"]):
+        cost = cached.get("import_cost") if cached else None
+        cost = cost or measure_import_cost(library_name)
+    
+    # Prefetched but not imported yet: answer from the probe and the package metadata,
+    # rather than making the user wait for the import here
+    lib = (cached.get("module") or sys.modules.get(library_name)) if cached else None
+    if cached and lib is None:
+        probe = cached["probe"]
+        if probe["importable"]:
+            version = prefetched_version(prefetch, library_name)
+            result = {
+                "library_name": library_name,
+                "status": "Available",
+                "importable": True,
+                "version": version or "Version not available",
+                "location": probe["location"],
+                "documentation_preview": "Not imported (start_library_prefetch(warm_import=True) "
+                                         "imports libraries in the background)",
+            }
+            print(f"✅ {library_name}: {result['version']}")
+        else:
+            result = {
+                "library_name": library_name,
+                "status": probe["status"],
+                "importable": False,
+                "error": "Library not found or not importable"
+            }
+            print(f"❌ {library_name}: {probe['status']}")
+        if cost is not None:
+            result["import_cost"] = cost
+        return result
     
     try:
-        # Import and store the library
-        lib = __import__(library_name)
+        # Import and store the library (already in memory if it was imported before)
+        lib = lib or __import__(library_name)
     
-        try:
-            version = lib.__version__
-        except AttributeError:
-            try:
-                version = lib.VERSION  # Some libraries use this instead
-            except AttributeError:
-                version = "Version not available"
+        # Package metadata first, the module's own attributes only if there is none
+        version = prefetched_version(prefetch, library_name)
+        if version in (None, "Built-in"):
+            version = getattr(lib, '__version__', getattr(lib, 'VERSION', version or "Version not available"))
         
         # Get library documentation
         doc = lib.__doc__ if lib.__doc__ else "No documentation available"
@@ -288,6 +406,8 @@ def get_library_info(library_name):
             "has_version": hasattr(lib, '__version__'),
             "is_package": hasattr(lib, '__path__')
         }
+        if cost is not None:
+            result["import_cost"] = cost
         
         print(f"✅ {library_name}: {version}")
         
@@ -312,6 +432,36 @@ def get_library_info(library_name):
     return result
 
 
+def _format_bytes(size):
+    if size is None:
+        return "n/a"
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def profile_library_imports(library_list, max_workers=None):
+    """
+    Measure how expensive each library is to import: every library in its own fresh
+    Python process, several at a time. Prints a table, slowest first, and returns the costs.
+    """
+    print(f"⏱️  Measuring cold imports of {len(library_list)} libraries...")
+    costs = measure_import_costs(library_list, max_workers=max_workers)
+
+    print(f"\n{'Library':<15} {'Import time':>12} {'Memory added':>13} {'Modules':>8}")
+    print("-" * 51)
+    ranked = sorted(costs.values(), key=lambda cost: cost.get("seconds", -1), reverse=True)
+    for cost in ranked:
+        if cost["ok"]:
+            print(f"{cost['library']:<15} {cost['seconds'] * 1000:>9.1f} ms "
+                  f"{_format_bytes(cost['rss_bytes']):>13} {cost['modules']:>8}")
+        else:
+            print(f"{cost['library']:<15} ❌ {cost['error']}")
+
+    return costs
+
 
 def demonstrate_library_usage(library_name):
     try:
@@ -378,60 +528,53 @@ def demonstrate_library_usage(library_name):
     
 
 
-
-def create_environment_report():
+def create_environment_report(libraries_to_check=None, as_json=False, refresh=False):
+    """
+    Print which libraries (and versions) this Python has. Nothing is imported, and the
+    report is cached per interpreter: it is only rebuilt for distributions that changed
+    since the last run. as_json=True prints just the JSON, which is what
+    `python day6_libraries.py --json` (or `python -m shared.environment --json`) does.
+    """
+    report = build_environment_report(libraries_to_check, refresh=refresh)
     
     result = {
-        "Total modules checked": 0,
-        "Available": 0,
-        "Missing": 0
+        "Total modules checked": report["total"],
+        "Available": report["available"],
+        "Missing": report["missing"],
+        "Report": report
     }
 
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return result
+
     print("🐍 PYTHON ENVIRONMENT REPORT")
     print("="*50)
 
-    import sys
-    from pathlib import Path
-    import os
-
-    print(f"Python Version: {sys.version.split()[0]}")
-    print(f"Python Path: {sys.executable}")
-    print(f"Operating System: {os.name}")
-    print(f"Platform: {sys.platform}")
+    print(f"Python Version: {report['python_version']}")
+    print(f"Python Path: {report['executable']}")
+    print(f"Operating System: {report['os']}")
+    print(f"Platform: {report['platform']}")
 
     print("\n📦 INSTALLED LIBRARIES:")
     
-    # List of libraries to check
-    libraries_to_check = [
-        'os', 'sys', 'json', 'datetime', 'random',
-        'numpy', 'pandas', 'matplotlib', 'requests'
-    ]
-
-    # Check each library - MUCH SIMPLER!
-    for library_name in libraries_to_check:
-        try:
-            lib = __import__(library_name)
-            version = getattr(lib, '__version__', 'Built-in')
-            print(f"   ✅ {library_name}: {version}")
-            result["Available"] += 1
-        except ImportError:
+    for library_name, info in report["libraries"].items():
+        if info["available"]:
+            print(f"   ✅ {library_name}: {info['version'] or 'Version not available'}")
+        else:
             print(f"   ❌ {library_name}: Not installed")
-            result["Missing"] += 1
-        
-        # Count every library we check (success or failure)
-        result["Total modules checked"] += 1
 
     # Print summary
     print(f"\n📊 SUMMARY:")
     print(f"   Total modules checked: {result['Total modules checked']}")
     print(f"   Available: {result['Available']}")
     print(f"   Missing: {result['Missing']}")
+    if report["from_cache"]:
+        print(f"   (from cache, generated {report['generated_at']})")
     
     return result
 
 
-
-
 def interactive_library_explorer():
     """
     Create an interactive tool for exploring Python libraries.
@@ -495,7 +638,7 @@ def interactive_library_explorer():
             break
 
 
-def handle_multiple_library_check():
+def handle_multiple_library_check(prefetch=None):
     """Handle checking multiple libraries"""
     print("📋 LIBRARY AVAILABILITY CHECKER")
     print("=" * 35)
@@ -512,7 +655,7 @@ def handle_multiple_library_check():
     print(f"\n🔍 Checking {len(library_list)} libraries...\n")
     
     # Use our existing function
-    results = check_library_availability(library_list)
+    results = check_library_availability(library_list, prefetch=prefetch)
     
     # Display summary
     available = sum(1 for lib in results.values() if lib.get("importable", False))
@@ -520,7 +663,7 @@ def handle_multiple_library_check():
     print(f"\n📊 Summary: {available}/{total} libraries are available")
 
 
-def handle_single_library_info():
+def handle_single_library_info(prefetch=None):
     """Handle getting detailed info about a single library"""
     print("🔍 DETAILED LIBRARY INFORMATION")
     print("=" * 35)
@@ -534,7 +677,7 @@ def handle_single_library_info():
     print(f"\n📚 Getting information about '{library_name}'...\n")
     
     # Use our existing function
-    info = get_library_info(library_name)
+    info = get_library_info(library_name, import_cost=True, prefetch=prefetch)
     
     # Display detailed info
     print(f"📖 DETAILED REPORT FOR '{library_name.upper()}':")
@@ -545,6 +688,12 @@ def handle_single_library_info():
             print(f"🔧 Public Functions (first 5): {', '.join(value[:5])}")
         elif key == "documentation_preview":
             print(f"📄 Documentation: {value}")
+        elif key == "import_cost":
+            if value["ok"]:
+                print(f"⏱️  Cold Import: {value['seconds'] * 1000:.1f} ms, "
+                      f"{_format_bytes(value['rss_bytes'])}, {value['modules']} modules")
+            else:
+                print(f"⏱️  Cold Import: ❌ {value['error']}")
         else:
             print(f"   {key.replace('_', ' ').title()}: {value}")
 
@@ -576,21 +725,22 @@ def handle_environment_report():
     create_environment_report()
 
 
+LIBRARY_SUGGESTIONS = {
+    "📅 Date & Time": ["datetime", "time"],
+    "🎲 Random & Math": ["random", "math", "statistics"],
+    "💻 System & OS": ["os", "sys", "pathlib"],
+    "🌐 Web & APIs": ["requests", "urllib", "json"],
+    "📊 Data Science": ["numpy", "pandas", "matplotlib"],
+    "🔧 Utilities": ["collections", "itertools", "functools"]
+}
+
+
 def quick_library_suggestions():
     """Provide some quick suggestions for libraries to explore"""
     print("\n💡 SUGGESTED LIBRARIES TO EXPLORE:")
     print("=" * 35)
     
-    suggestions = {
-        "📅 Date & Time": ["datetime", "time"],
-        "🎲 Random & Math": ["random", "math", "statistics"],
-        "💻 System & OS": ["os", "sys", "pathlib"],
-        "🌐 Web & APIs": ["requests", "urllib", "json"],
-        "📊 Data Science": ["numpy", "pandas", "matplotlib"],
-        "🔧 Utilities": ["collections", "itertools", "functools"]
-    }
-    
-    for category, libs in suggestions.items():
+    for category, libs in LIBRARY_SUGGESTIONS.items():
         print(f"{category}: {', '.join(libs)}")
 
 
@@ -604,55 +754,61 @@ def interactive_library_explorer_enhanced():
     print("=" * 40)
     print("Your comprehensive Python library exploration tool!")
     
+    # Look up the suggested libraries in the background while the user reads the menu
+    prefetch = start_library_prefetch([lib for libs in LIBRARY_SUGGESTIONS.values() for lib in libs])
+    
     # Show suggestions on startup
     quick_library_suggestions()
     
-    while True:
-        print("\n🎯 Main Menu:")
-        print("=" * 15)
-        print("1. 📋 Check multiple libraries")
-        print("2. 🔍 Get detailed library info") 
-        print("3. 🎮 See library demonstration")
-        print("4. 📊 Generate environment report")
-        print("5. 💡 Show library suggestions")
-        print("6. 🚪 Exit")
-        print()
-        
-        try:
-            choice = input("Enter your choice (1-6): ").strip()
+    try:
+        while True:
+            print("\n🎯 Main Menu:")
+            print("=" * 15)
+            print("1. 📋 Check multiple libraries")
+            print("2. 🔍 Get detailed library info") 
+            print("3. 🎮 See library demonstration")
+            print("4. 📊 Generate environment report")
+            print("5. 💡 Show library suggestions")
+            print("6. 🚪 Exit")
             print()
+        
+            try:
+                choice = input("Enter your choice (1-6): ").strip()
+                print()
             
-            if choice == "1":
-                handle_multiple_library_check()
-            elif choice == "2":
-                handle_single_library_info()
-            elif choice == "3":
-                handle_library_demonstration()
-            elif choice == "4":
-                handle_environment_report()
-            elif choice == "5":
-                quick_library_suggestions()
-            elif choice == "6":
-                print("👋 Thanks for exploring Python libraries!")
-                print("Keep coding and keep exploring! 🚀")
+                if choice == "1":
+                    handle_multiple_library_check(prefetch)
+                elif choice == "2":
+                    handle_single_library_info(prefetch)
+                elif choice == "3":
+                    handle_library_demonstration()
+                elif choice == "4":
+                    handle_environment_report()
+                elif choice == "5":
+                    quick_library_suggestions()
+                elif choice == "6":
+                    print("👋 Thanks for exploring Python libraries!")
+                    print("Keep coding and keep exploring! 🚀")
+                    break
+                else:
+                    print("❌ Invalid choice. Please enter 1-6.")
+                    continue
+                
+            except KeyboardInterrupt:
+                print("\n\n👋 Goodbye! Happy coding! 🚀")
                 break
-            else:
-                print("❌ Invalid choice. Please enter 1-6.")
+            except Exception as e:
+                print(f"❌ An error occurred: {e}")
                 continue
-                
-        except KeyboardInterrupt:
-            print("\n\n👋 Goodbye! Happy coding! 🚀")
-            break
-        except Exception as e:
-            print(f"❌ An error occurred: {e}")
-            continue
         
-        # Continue prompt
-        print("\n" + "-" * 40)
-        continue_choice = input("Press Enter to continue or 'q' to quit: ").strip().lower()
-        if continue_choice == 'q':
-            print("👋 Thanks for using Library Explorer!")
-            break
+            # Continue prompt
+            print("\n" + "-" * 40)
+            continue_choice = input("Press Enter to continue or 'q' to quit: ").strip().lower()
+            if continue_choice == 'q':
+                print("👋 Thanks for using Library Explorer!")
+                break
+    finally:
+        stop_library_prefetch(prefetch)
 
 
 # Main function to run everything
@@ -675,14 +831,6 @@ def run_library_explorer():
         interactive_library_explorer()
 
 
-# To run the complete tool:
-if __name__ == "__main__":
-    run_library_explorer()
-
-
-# Test your functions here
-print("\n🧪 Testing Your Library Explorer:")
-
 # Example usage (implement these functions above):
 # standard_libs = ['os', 'sys', 'datetime', 'random', 'json', 'csv']
 # data_science_libs = ['numpy', 'pandas', 'matplotlib', 'requests', 'sklearn']
@@ -696,9 +844,6 @@ print("\n🧪 Testing Your Library Explorer:")
 # BONUS: VIRTUAL ENVIRONMENTS AND BEST PRACTICES
 # =============================================================================
 
-print("\n💡 Professional Development Practices:")
-print("=" * 45)
-
 def explain_virtual_environments():
     """
     Explain virtual environments and why they're important.
@@ -737,7 +882,6 @@ def explain_virtual_environments():
     print("   ├── README.md              # Project documentation")
     print("   └── .gitignore             # Git ignore file")
 
-explain_virtual_environments()
 
 def package_management_best_practices():
     print(f"\n📦 Package Management Best Practices:\n")
@@ -768,8 +912,51 @@ def package_management_best_practices():
     for command, description in commands:
         print(f"   {command:<35} # {description}")
 
-package_management_best_practices()
 
-print(f"\n🎉 Day 6 Complete! You've entered the Python ecosystem!")
-print("💡 You now understand how to leverage the power of libraries!")
-print("🚀 Tomorrow: NumPy - the mathematical foundation of data science!")
\ No newline at end of file
+def main():
+    print("=== DAY 6: WORKING WITH LIBRARIES ===\n")
+
+    print("PART 1: Python's Built-in Powerhouse")
+    print("=" * 40)
+
+    explore_standard_library()
+
+    print("\n\nPART 2: Mastering Import Systems")
+    print("=" * 35)
+
+    demonstrate_import_patterns()
+
+    print("\n\nPART 3: Third-Party Library Ecosystem")
+    print("=" * 40)
+
+    # Try to demonstrate requests (may fail if not installed)
+    demonstrate_requests_library()
+
+    print("🎯 TODAY'S PROJECT: Library Information Tool")
+    print("=" * 50)
+
+    # To run the complete tool:
+    run_library_explorer()
+
+    # Test your functions here
+    print("\n🧪 Testing Your Library Explorer:")
+    profile_library_imports(['json', 'datetime', 'collections', 'numpy', 'pandas', 'matplotlib', 'requests'])
+
+    print("\n💡 Professional Development Practices:")
+    print("=" * 45)
+
+    explain_virtual_environments()
+
+    package_management_best_practices()
+
+    print(f"\n🎉 Day 6 Complete! You've entered the Python ecosystem!")
+    print("💡 You now understand how to leverage the power of libraries!")
+    print("🚀 Tomorrow: NumPy - the mathematical foundation of data science!")
+
+
+if __name__ == "__main__":
+    # `python day6_libraries.py --json` prints only the environment report, for scripts
+    if "--json" in sys.argv[1:]:
+        create_environment_report(as_json=True, refresh="--refresh" in sys.argv[1:])
+    else:
+        main()
@@ -18,24 +18,43 @@ Key Advantages:
 Think of NumPy as upgrading from a bicycle to a rocket ship! 🚀
 """
 
-print("=== DAY 7: NUMPY FUNDAMENTALS ===\n")
+import os
+import sys
 
-# First, let's install and import NumPy
+# Shared helpers live one folder up (run with ML_PROFILE=1 to turn profiling on)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from shared.benchmark import (benchmark_case, benchmark_registry, print_benchmark_table, run_benchmarks,
+                              save_benchmark_report)
+from shared.lazy_imports import lazy_import
+from shared.profiling import profiled
+
+# NumPy only really loads the first time it is used, so importing this file stays fast.
+# The NumPy-based helpers come in here too: without NumPy they can't be imported either
 try:
-    import numpy as np
-    print("✅ NumPy is ready!")
-    print(f"📦 NumPy version: {np.__version__}")
+    np = lazy_import("numpy")
+    from shared.cohort import generate_cohort
+    from shared.dtype_policy import (compact_array, memory_report, print_memory_report, score_add, score_mean,
+                                     score_std, score_sum)
+    from shared.expressions import evaluate_expression
+    from shared.parallel_reduce import reduce_scores, resolve_threads
+    from shared.score_stats import band_scores, describe_score_chunks, describe_scores, order_statistics
+    from shared.scoring import component_weights, weighted_scores
 except ImportError:
-    print("❌ NumPy not installed. Run: pip install numpy")
-    print("💡 For this lesson, we'll show examples assuming NumPy is available")
+    pass   # np stays undefined: the functions below catch the NameError and explain
+
+
+def check_numpy():
+    if "np" in globals():
+        print("✅ NumPy is ready!")
+        print(f"📦 NumPy version: {np.__version__}")
+    else:
+        print("❌ NumPy not installed. Run: pip install numpy")
+        print("💡 For this lesson, we'll show examples assuming NumPy is available")
 
 # =============================================================================
 # PART 2: ARRAYS VS LISTS - THE GAME CHANGER
 # =============================================================================
 
-print("\nPART 1: Arrays vs Lists - Why NumPy is Revolutionary")
-print("=" * 55)
-
 def compare_lists_vs_arrays():
     
     print("🐍 Traditional Python Lists:")
@@ -58,17 +77,17 @@ def compare_lists_vs_arrays():
     print(f"\n🚀 NumPy Arrays - The Data Science Way:")
     
     try:
-        # NumPy arrays - the modern way
-        grades_array = np.array([85, 90, 78, 92, 88, 76, 94, 89])
+        # NumPy arrays - the modern way, stored compactly: grades 0-100 fit in one byte (uint8)
+        grades_array = compact_array([85, 90, 78, 92, 88, 76, 94, 89])
         print(f"   Original grades: {grades_array}")
         
-        # Add 5 to ALL grades in ONE operation!
-        bonus_grades_array = grades_array + 5
+        # Add 5 to ALL grades in ONE operation! (worked out in a wider type, so 254 + 5 can't wrap to 3)
+        bonus_grades_array = score_add(grades_array, 5)
         print(f"   After +5 bonus: {bonus_grades_array}")
         
-        # Calculate statistics instantly
-        average = np.mean(grades_array)
-        std_dev = np.std(grades_array)
+        # Calculate statistics instantly, accumulating in float64
+        average = score_mean(grades_array)
+        std_dev = score_std(grades_array)
         max_grade = np.max(grades_array)
         min_grade = np.min(grades_array)
         
@@ -77,6 +96,10 @@ def compare_lists_vs_arrays():
         print(f"   Highest grade: {max_grade}")
         print(f"   Lowest grade: {min_grade}")
         
+        memory = memory_report({"grades": grades_array})
+        print(f"   Memory: {memory['bytes']} bytes as {grades_array.dtype} "
+              f"instead of {memory['default_bytes']} as int64")
+        
         print(f"\n💡 Key Differences:")
         print(f"   Lists: grades_list + 5 → ERROR! Can't add number to list")
         print(f"   Arrays: grades_array + 5 → Works perfectly!")
@@ -86,15 +109,115 @@ def compare_lists_vs_arrays():
     except NameError:
         print("   (NumPy not available - install with: pip install numpy)")
 
-compare_lists_vs_arrays()
+
+# The same list vs array comparisons as benchmark cases (see demonstrate_numpy_speed).
+# Each setup builds the grades once, outside the timed part.
+
+def _grades_array(size):
+    return (np.random.default_rng(47).integers(60, 100, size, dtype=np.uint8),)
+
+
+def _grades_list(size):
+    return (_grades_array(size)[0].tolist(),)
+
+
+@benchmark_case("add_bonus", "list", setup=_grades_list)
+def add_bonus_list(grades_list):
+    bonus_grades_list = []
+    for grade in grades_list:
+        bonus_grades_list.append(grade + 5)
+    return bonus_grades_list
+
+
+@benchmark_case("add_bonus", "numpy", setup=_grades_array)
+def add_bonus_array(grades_array):
+    return grades_array + 5
+
+
+@benchmark_case("average", "list", setup=_grades_list)
+def average_list(grades_list):
+    return sum(grades_list) / len(grades_list)
+
+
+@benchmark_case("average", "numpy", setup=_grades_array)
+def average_array(grades_array):
+    return np.mean(grades_array)
+
+
+@benchmark_case("double_plus_one", "list", setup=lambda size: (list(range(size)),))
+def double_plus_one_list(python_list):
+    return [x * 2 + 1 for x in python_list]
+
+
+@benchmark_case("double_plus_one", "numpy", setup=lambda size: (np.arange(size),))
+def double_plus_one_array(numpy_array):
+    return numpy_array * 2 + 1
+
+
+# The statistics block of analyze_class_performance, before and after describe_scores
+
+def _final_scores(size):
+    return (np.random.default_rng(47).uniform(50, 100, size).astype(np.float32),)
+
+
+@benchmark_case("class_statistics", "separate_calls", setup=_final_scores)
+def class_statistics_separate(final_score):
+    return (np.mean(final_score), np.median(final_score), np.std(final_score), np.min(final_score),
+            np.max(final_score), np.percentile(final_score, 25), np.percentile(final_score, 75))
+
+
+@benchmark_case("class_statistics", "describe_scores", setup=_final_scores)
+def class_statistics_describe(final_score):
+    return describe_scores(final_score, percentiles=(25, 75))
+
+
+# The grade classification of analyze_class_performance: a mask per band vs one banding pass
+
+GRADE_BOUNDARIES = [65, 70, 75, 80, 90]
+
+
+@benchmark_case("grade_bands", "masks", setup=_final_scores)
+def grade_bands_masks(final_score):
+    return (np.sum(final_score >= 90), np.sum((final_score >= 80) & (final_score < 90)),
+            np.sum((final_score >= 70) & (final_score < 80)), np.sum(final_score < 70),
+            np.sum((final_score >= 65) & (final_score < 70)), np.sum((final_score >= 75) & (final_score < 80)))
+
+
+@benchmark_case("grade_bands", "band_scores", setup=_final_scores)
+def grade_bands_single_pass(final_score):
+    return band_scores(final_score, GRADE_BOUNDARIES)["counts"]
+
+
+# A multi-step score transform: one temporary array per step vs block-wise through scratch buffers
+
+SCORE_TRANSFORM = "round(sqrt(x) * 10) / 10"
+
+
+@benchmark_case("score_transform", "temporaries", setup=_grades_array)
+def score_transform_temporaries(grades_array):
+    # float64 like the fused path (np.sqrt on uint8 alone would compute in float16)
+    return np.round(np.sqrt(grades_array.astype(np.float64)) * 10) / 10
+
+
+@benchmark_case("score_transform", "fused_blocks", setup=_grades_array)
+def score_transform_fused(grades_array):
+    return evaluate_expression(SCORE_TRANSFORM, x=grades_array)
+
+
+# Thread scaling of the reductions (sum, squared deviations, min/max, argmin/argmax, band
+# counts): `python day7_numpy_fundamentals.py --scaling`. demonstrate_numpy_speed skips it
+
+SCALING_GROUP = "threaded_reduction"
+
+for _threads in (1, 2, 4, 8):
+    benchmark_case(SCALING_GROUP, f"{_threads}_thread{'s' if _threads > 1 else ''}", setup=_final_scores)(
+        lambda final_score, threads=_threads: reduce_scores(final_score, GRADE_BOUNDARIES, threads=threads))
+
 
 # =============================================================================
 # PART 3: CREATING NUMPY ARRAYS
 # =============================================================================
 
-print("\n\nPART 2: Creating NumPy Arrays - Your Data Science Toolkit")
-print("=" * 60)
-
 def demonstrate_array_creation():
     
     try:
@@ -154,15 +277,11 @@ def demonstrate_array_creation():
     except NameError:
         print("NumPy not available. Install with: pip install numpy")
 
-demonstrate_array_creation()
 
 # =============================================================================
 # PART 4: ARRAY OPERATIONS - THE MAGIC OF VECTORIZATION
 # =============================================================================
 
-print("\n\nPART 3: Array Operations - Where NumPy Shines")
-print("=" * 50)
-
 def demonstrate_array_operations():
     
     try:
@@ -192,6 +311,11 @@ def demonstrate_array_operations():
         print(f"   Natural log: {log_scores}")
         print(f"   Rounded to 10s: {rounded_scores}")
         
+        # Each step above makes a full temporary array. A chain evaluated block by block
+        # through reused buffers reads the scores once and writes the result once
+        fused_scores = evaluate_expression("round(x / 10) * 10", x=test_scores)
+        print(f"   Rounded to 10s, fused: {fused_scores}")
+        
         # 3. Comparison operations (create boolean arrays)
         print(f"\n3. Comparison Operations (Boolean Arrays):")
         passing_scores = test_scores >= 80
@@ -230,15 +354,11 @@ def demonstrate_array_operations():
     except NameError:
         print("NumPy not available. Install with: pip install numpy")
 
-demonstrate_array_operations()
 
 # =============================================================================
 # PART 5: INDEXING AND SLICING - DATA EXTRACTION MASTERY
 # =============================================================================
 
-print("\n\nPART 4: Array Indexing and Slicing")
-print("=" * 40)
-
 def demonstrate_indexing_slicing():
     
     try:
@@ -284,94 +404,175 @@ def demonstrate_indexing_slicing():
     except NameError:
         print("NumPy not available. Install with: pip install numpy")
 
-demonstrate_indexing_slicing()
 
 # =============================================================================
 # STUDENT PERFORMANCE ANALYZER 
 # =============================================================================
 
-print("\n\n🎯 COMPLETE STUDENT PERFORMANCE ANALYZER")
-print("=" * 50)
-
-def create_sample_data():
-    
+@profiled
+def create_sample_data(num_students=8, num_tests=2, num_assignments=3, seed=47, weights=None):
+    """
+    Scores for a class of num_students. Much bigger cohorts (or ones written to disk by
+    several processes) come straight from shared.cohort.generate_cohort, which this uses.
+    weights: one per test then assignment (default: tests and assignments count half each).
+    """
     try:
-        import numpy as np
-        
-        # Number of students
-        num_students = 8
-        student_ids = np.arange(1, num_students + 1)
+        student_ids = compact_array(np.arange(1, num_students + 1))
         
-        # Generate realistic score data
-        np.random.seed(47)  # For consistent results
+        # Generate realistic score data: a seeded Generator per chunk of students, uint8 scores
+        cohort = generate_cohort(num_students, num_tests, num_assignments, seed=seed)
         
-        # Test scores (2 tests per student)
-        test_scores = np.random.randint(50, 100, (num_students, 2))
+        # Test scores (50-99) and assignment scores (60-89), one row per student
+        test_scores = cohort["test_scores"]
+        assignment_scores = cohort["assignment_scores"]
         
-        # Assignment scores (3 assignments per student)  
-        assignment_scores = np.random.randint(60, 90, (num_students, 3))
+        # Calculate averages in float64, then keep them as float32
+        avg_test_score = score_mean(test_scores, axis=1)
+        avg_assign_scores = score_mean(assignment_scores, axis=1)
         
-        # Calculate averages
-        avg_test_score = np.mean(test_scores, axis=1)
-        avg_assign_scores = np.mean(assignment_scores, axis=1)
-        final_score = (avg_test_score + avg_assign_scores) / 2
+        # Final score: weighted sum of every test and assignment
+        if weights is None:
+            weights = component_weights(num_tests, num_assignments)
+        final_score = weighted_scores(np.concatenate([test_scores, assignment_scores], axis=1), weights)
         
         return {
             "student_ids": student_ids,
             "test_scores": test_scores,
             "assignment_scores": assignment_scores,
-            "avg_test_score": avg_test_score,
-            "avg_assign_scores": avg_assign_scores,
-            "final_score": final_score
+            "avg_test_score": compact_array(avg_test_score),
+            "avg_assign_scores": compact_array(avg_assign_scores),
+            "final_score": final_score,
+            "weights": np.asarray(weights, dtype=np.float64),   # For re-scoring chunks out of core
         }
         
     except NameError:
         print("NumPy not available for data generation")
         return None
 
-def analyze_class_performance(data):
-   
+ANALYSIS_CHUNK_STUDENTS = 1_000_000   # Students per chunk when the scores are read out of core
+
+
+def _class_report(data, threads=1):
+    """The numbers analyze_class_performance prints, with every score in memory"""
+    final_score = data["final_score"]
+    if threads > 1:
+        # Every reduction runs on a thread pool; only the percentiles' partition stays on one core
+        totals = reduce_scores(final_score, GRADE_BOUNDARIES, threads=threads)
+        return {
+            "summary": {"count": totals["count"], "mean": totals["mean"], "std": totals["std"],
+                        **order_statistics(final_score, percentiles=(25, 75))},
+            "band_counts": totals["band_counts"],
+            "avg_test_performance": reduce_scores(data["avg_test_score"], threads=threads)["mean"],
+            "avg_assignment_performance": reduce_scores(data["avg_assign_scores"], threads=threads)["mean"],
+            "best": (totals["argmax"], totals["max"]),
+            "worst": (totals["argmin"], totals["min"]),
+        }
+    
+    best_student_idx = int(np.argmax(final_score))
+    worst_student_idx = int(np.argmin(final_score))
+    return {
+        # Basic statistics: one partition for all order statistics, one pass for mean/std
+        "summary": describe_scores(final_score, percentiles=(25, 75)),
+        # One pass puts every student in a band: <65, 65-70, 70-75, 75-80, 80-90, ≥90
+        "band_counts": band_scores(final_score, GRADE_BOUNDARIES)["counts"],
+        "avg_test_performance": score_mean(data["avg_test_score"]),
+        "avg_assignment_performance": score_mean(data["avg_assign_scores"]),
+        "best": (best_student_idx, final_score[best_student_idx]),
+        "worst": (worst_student_idx, final_score[worst_student_idx]),
+    }
+
+
+def _class_report_in_chunks(data, chunk_size, approximate=False):
+    """
+    The same numbers, reading chunk_size students at a time: final scores are worked out per
+    chunk from the score matrices (with data["weights"], as create_sample_data does), counts
+    and moments are merged, and percentiles come from describe_score_chunks. Memory stays at
+    a few chunks whatever the number of students.
+    """
+    test_scores, assignment_scores = data["test_scores"], data["assignment_scores"]
+    num_students = len(test_scores)
+    weights = data.get("weights")
+    if weights is None:
+        weights = component_weights(test_scores.shape[1], assignment_scores.shape[1])
+    report = {"band_counts": np.zeros(len(GRADE_BOUNDARIES) + 1, dtype=np.int64), "test_total": 0,
+              "assignment_total": 0, "best": (0, -np.inf), "worst": (0, np.inf)}
+
+    def final_score_chunks():
+        for start in range(0, num_students, chunk_size):
+            if "final_score" in data:
+                yield np.asarray(data["final_score"][start:start + chunk_size])
+            else:
+                stop = start + chunk_size
+                yield weighted_scores(np.concatenate([test_scores[start:stop], assignment_scores[start:stop]], axis=1),
+                                      weights)
+
+    def add_chunk(offset, final_score):
+        # Everything besides the order statistics, from the first read of each chunk
+        report["band_counts"] += band_scores(final_score, GRADE_BOUNDARIES)["counts"]
+        report["test_total"] += score_sum(test_scores[offset:offset + final_score.size])
+        report["assignment_total"] += score_sum(assignment_scores[offset:offset + final_score.size])
+        best, worst = int(np.argmax(final_score)), int(np.argmin(final_score))
+        if final_score[best] > report["best"][1]:
+            report["best"] = (offset + best, final_score[best])
+        if final_score[worst] < report["worst"][1]:
+            report["worst"] = (offset + worst, final_score[worst])
+
+    report["summary"] = describe_score_chunks(final_score_chunks, percentiles=(25, 75),
+                                              approximate=approximate, on_chunk=add_chunk)
+    # Every student has the same number of tests (and of assignments): mean of averages = overall mean
+    report["avg_test_performance"] = report.pop("test_total") / test_scores.size
+    report["avg_assignment_performance"] = report.pop("assignment_total") / assignment_scores.size
+    return report
+
+
+@profiled
+def analyze_class_performance(data, chunk_size=None, approximate=False, threads=None):
+    """
+    Report on a class's scores. Memory-mapped scores (say from shared.cohort.load_cohort, no
+    final_score needed; data["weights"] if not the default component_weights) or an explicit
+    chunk_size are analysed out of core, chunk_size students at a time; there approximate=True
+    takes the median and percentiles from a quantile sketch, reading the scores once instead
+    of a few times. In memory, threads > 1 (default: ML_THREADS) splits the reductions across
+    a thread pool.
+    """
     if data is None:
         print("No data available for analysis")
         return
     
     try:
-        final_score = data["final_score"]
-        test_scores = data["test_scores"]
-        assignment_scores = data["assignment_scores"]
+        on_disk = any(isinstance(data.get(key), np.memmap) for key in ("final_score", "test_scores"))
+        if chunk_size is None and on_disk:
+            chunk_size = ANALYSIS_CHUNK_STUDENTS
+        if chunk_size:
+            report = _class_report_in_chunks(data, chunk_size, approximate)
+        else:
+            report = _class_report(data, resolve_threads(threads))
+        summary = report["summary"]
         
         print("📊 CLASS PERFORMANCE ANALYSIS")
         print("=" * 40)
         
-        # Basic statistics
-        mean_scores = np.mean(final_score)
-        median_score = np.median(final_score)
-        std_score = np.std(final_score)
-        
         print(f"🎯 Final Scores Statistics:")
-        print(f"   Mean: {mean_scores:.2f}")
-        print(f"   Median: {median_score:.2f}")
-        print(f"   Standard Deviation: {std_score:.2f}")
-        print(f"   Min: {np.min(final_score):.2f}, Max: {np.max(final_score):.2f}")
-        print(f"   25th percentile: {np.percentile(final_score, 25):.2f}")
-        print(f"   75th percentile: {np.percentile(final_score, 75):.2f}")
-        
-        # Grade classification using our boolean indexing skills
+        print(f"   Mean: {summary['mean']:.2f}")
+        print(f"   Median: {summary['median']:.2f}")
+        print(f"   Standard Deviation: {summary['std']:.2f}")
+        print(f"   Min: {summary['min']:.2f}, Max: {summary['max']:.2f}")
+        print(f"   25th percentile: {summary['percentiles'][25]:.2f}")
+        print(f"   75th percentile: {summary['percentiles'][75]:.2f}")
+        
+        # Grade classification: bands <65, 65-70, 70-75, 75-80, 80-90, ≥90
         print(f"\n🏆 Grade Classification:")
-        excellent_90_scores = final_score >= 90
-        good_scores = (final_score >= 80) & (final_score < 90)
-        satisfactory_scores = (final_score >= 70) & (final_score < 80)
-        needs_improvement_scores = final_score < 70
+        band_counts = report["band_counts"]
         
-        print(f"   Students with Excellent Score (≥90): {np.sum(excellent_90_scores)}")
-        print(f"   Students with Good Score (80-89): {np.sum(good_scores)}")
-        print(f"   Students with Satisfactory Scores (70-79): {np.sum(satisfactory_scores)}")
-        print(f"   Students need improvement (<70): {np.sum(needs_improvement_scores)}")
+        print(f"   Students with Excellent Score (≥90): {band_counts[5]}")
+        print(f"   Students with Good Score (80-89): {band_counts[4]}")
+        print(f"   Students with Satisfactory Scores (70-79): {band_counts[2] + band_counts[3]}")
+        print(f"   Students need improvement (<70): {band_counts[0] + band_counts[1]}")
         
         # Performance comparison
         print(f"\n📝 Test vs Assignment Performance:")
-        avg_test_performance = np.mean(data["avg_test_score"])
-        avg_assignment_performance = np.mean(data["avg_assign_scores"])
+        avg_test_performance = report["avg_test_performance"]
+        avg_assignment_performance = report["avg_assignment_performance"]
         
         print(f"   Average test performance: {avg_test_performance:.2f}")
         print(f"   Average assignment performance: {avg_assignment_performance:.2f}")
@@ -383,67 +584,108 @@ def analyze_class_performance(data):
         
         # Individual student analysis
         print(f"\n👥 Individual Student Analysis:")
-        best_student_idx = np.argmax(final_score)
-        worst_student_idx = np.argmin(final_score)
+        (best_student_idx, best_score), (worst_student_idx, worst_score) = report["best"], report["worst"]
+        student_ids = data.get("student_ids")
+        best_id = student_ids[best_student_idx] if student_ids is not None else best_student_idx + 1
+        worst_id = student_ids[worst_student_idx] if student_ids is not None else worst_student_idx + 1
         
-        print(f"   🏆 Top performer: Student {data['student_ids'][best_student_idx]} ({final_score[best_student_idx]:.2f})")
-        print(f"   📈 Needs support: Student {data['student_ids'][worst_student_idx]} ({final_score[worst_student_idx]:.2f})")
+        print(f"   🏆 Top performer: Student {best_id} ({best_score:.2f})")
+        print(f"   📈 Needs support: Student {worst_id} ({worst_score:.2f})")
         
         # Students close to next grade level
-        close_to_passing = (final_score >= 65) & (final_score < 70)
-        close_to_good = (final_score >= 75) & (final_score < 80)
+        close_to_passing = band_counts[1]
+        close_to_good = band_counts[3]
         
-        if np.sum(close_to_passing) > 0:
-            print(f"   🎯 Students close to passing: {np.sum(close_to_passing)}")
-        if np.sum(close_to_good) > 0:
-            print(f"   🎯 Students close to good grade: {np.sum(close_to_good)}")
+        if close_to_passing > 0:
+            print(f"   🎯 Students close to passing: {close_to_passing}")
+        if close_to_good > 0:
+            print(f"   🎯 Students close to good grade: {close_to_good}")
         
     except Exception as e:
         print(f"Error in analysis: {e}")
 
-def demonstrate_numpy_speed():
-    
+@profiled
+def demonstrate_numpy_speed(sizes=(1_000, 10_000, 100_000), max_seconds=0.5, json_file=None):
+    """
+    Lists vs NumPy arrays, timed with the benchmark harness: warmup, repeated runs until
+    the 95% confidence interval is tight, tracemalloc peaks. main() uses a few small sizes;
+    `python day7_numpy_fundamentals.py --benchmark` sweeps 1e3 to 1e8.
+    """
     try:
-        import time
-        
         print(f"\n⚡ Speed Comparison: Python Lists vs NumPy Arrays")
         print("=" * 55)
-        
-        # Create large datasets
-        size = 100000
-        python_list = list(range(size))
-        numpy_array = np.arange(size)
-        
-        print(f"🧪 Testing with {size:,} numbers...")
-        
-        # Time Python list operation
-        start_time = time.time()
-        python_result = [x * 2 + 1 for x in python_list]
-        python_time = time.time() - start_time
-        
-        # Time NumPy operation  
-        start_time = time.time()
-        numpy_result = numpy_array * 2 + 1
-        numpy_time = time.time() - start_time
-        
-        print(f"\n📊 Results:")
-        print(f"   Python list time: {python_time:.4f} seconds")
-        print(f"   NumPy array time: {numpy_time:.4f} seconds")
-        print(f"   🚀 NumPy is {python_time/numpy_time:.1f}x faster!")
-        
-        # Memory comparison
-        import sys
-        python_memory = sys.getsizeof(python_list)
-        numpy_memory = numpy_array.nbytes
-        
-        print(f"\n💾 Memory Usage:")
-        print(f"   Python list: {python_memory:,} bytes")
-        print(f"   NumPy array: {numpy_memory:,} bytes")
-        print(f"   💡 NumPy uses {python_memory/numpy_memory:.1f}x less memory!")
-        
+        print(f"🧪 Testing with {', '.join(f'{size:,}' for size in sizes)} numbers...")
+
+        groups = [group for group in benchmark_registry if group != SCALING_GROUP]
+        report = run_benchmarks(groups, sizes=list(sizes), max_seconds=max_seconds, verbose=False)
+        print_benchmark_table(report)
+
+        # Headline numbers from the largest size that both variants finished
+        timed = {(row["variant"], row["size"]): row for row in report["results"]
+                 if row["group"] == "double_plus_one" and "mean_ns" in row}
+        size = max((size for variant, size in timed if ("numpy", size) in timed and ("list", size) in timed),
+                   default=None)
+        if size is None:
+            print(f"\n⚠️  No size finished for both lists and arrays (the table above shows which were skipped)")
+        else:
+            python_row, numpy_row = timed[("list", size)], timed[("numpy", size)]
+
+            print(f"\n📊 Results ({size:,} numbers, x * 2 + 1):")
+            print(f"   Python list time: {python_row['mean_ns'] / 1e9:.6f} seconds")
+            print(f"   NumPy array time: {numpy_row['mean_ns'] / 1e9:.6f} seconds")
+            print(f"   🚀 NumPy is {python_row['mean_ns'] / numpy_row['mean_ns']:.1f}x faster!")
+
+            # Memory comparison: everything allocated to build the data, not just the list's pointers
+            print(f"\n💾 Memory Usage:")
+            print(f"   Python list: {python_row['setup_bytes']:,} bytes")
+            print(f"   NumPy array: {numpy_row['setup_bytes']:,} bytes")
+            print(f"   💡 NumPy uses {python_row['setup_bytes'] / numpy_row['setup_bytes']:.1f}x less memory!")
+
+        if json_file:
+            save_benchmark_report(report, json_file)
+        return report
+
     except NameError:
         print("Install NumPy to see the speed demonstration!")
 
+def demonstrate_thread_scaling(sizes=(1_000_000, 10_000_000, 100_000_000), max_seconds=2.0, json_file=None):
+    """The grade reductions of analyze_class_performance on 1, 2, 4 and 8 threads"""
+    try:
+        print(f"\n🧵 Thread Scaling: chunked reductions on {os.cpu_count()} CPU(s)")
+        print("=" * 55)
+        report = run_benchmarks([SCALING_GROUP], sizes=list(sizes), max_seconds=max_seconds, verbose=False)
+        print_benchmark_table(report)
+        if json_file:
+            save_benchmark_report(report, json_file)
+        return report
+
+    except NameError:
+        print("Install NumPy to see the thread scaling benchmark!")
+
+
+
+def demonstrate_cohort_scoring(num_cohorts=4, students_per_cohort=1_000, seed=47):
+    """Several sections scored at once, each with its own test/assignment weighting"""
+    try:
+        print("🏫 Scoring several sections at once (cohorts × students × components):")
+        cohort = generate_cohort(num_cohorts * students_per_cohort, seed=seed)
+        scores = np.concatenate([cohort["test_scores"], cohort["assignment_scores"]], axis=1)
+        scores = scores.reshape(num_cohorts, students_per_cohort, -1)
+        
+        # Each section weighs tests differently: 50%, 60%, 70%, ... of the final score
+        test_shares = [min(0.5 + 0.1 * section, 1.0) for section in range(num_cohorts)]
+        weights = np.stack([component_weights(test_share=share) for share in test_shares])
+        final_scores = weighted_scores(scores, weights)   # One matmul per chunk of sections
+        
+        for section, share in enumerate(test_shares):
+            print(f"   Section {section + 1} (tests {share:.0%}): mean {score_mean(final_scores[section]):.2f}, "
+                  f"top {final_scores[section].max():.2f}")
+        return final_scores
+    
+    except NameError:
+        print("NumPy not available for cohort scoring")
+
+
 # =============================================================================
 # RUN THE COMPLETE ANALYSIS
 # =============================================================================
@@ -459,17 +701,64 @@ def run_complete_numpy_demo():
     
     if student_data:
         print("✅ Data generated successfully!")
+        print_memory_report(memory_report(student_data))
         
         print(f"\n2. Analyzing performance...")
         analyze_class_performance(student_data)
         
-        print(f"\n3. Demonstrating NumPy speed advantages...")
+        print(f"\n3. Scoring whole cohorts with per-section weights...")
+        demonstrate_cohort_scoring()
+        
+        print(f"\n4. Demonstrating NumPy speed advantages...")
         demonstrate_numpy_speed()
     
     print(f"\n🎉 NumPy demonstration complete!")
     print("💡 You now have the mathematical foundation for data science!")
 
-# Run the complete demonstration
-run_complete_numpy_demo()
 
-print(f"\n🎉 Day 7 Complete!")
+def main():
+    print("=== DAY 7: NUMPY FUNDAMENTALS ===\n")
+
+    # First, let's check NumPy is installed
+    check_numpy()
+
+    print("\nPART 1: Arrays vs Lists - Why NumPy is Revolutionary")
+    print("=" * 55)
+
+    compare_lists_vs_arrays()
+
+    print("\n\nPART 2: Creating NumPy Arrays - Your Data Science Toolkit")
+    print("=" * 60)
+
+    demonstrate_array_creation()
+
+    print("\n\nPART 3: Array Operations - Where NumPy Shines")
+    print("=" * 50)
+
+    demonstrate_array_operations()
+
+    print("\n\nPART 4: Array Indexing and Slicing")
+    print("=" * 40)
+
+    demonstrate_indexing_slicing()
+
+    print("\n\n🎯 COMPLETE STUDENT PERFORMANCE ANALYZER")
+    print("=" * 50)
+
+    # Run the complete demonstration
+    run_complete_numpy_demo()
+
+    print(f"\n🎉 Day 7 Complete!")
+
+
+if __name__ == "__main__":
+    # `python day7_numpy_fundamentals.py --benchmark [--json report.json]` runs the full size sweep,
+    # `--scaling [--json report.json]` the thread scaling benchmark
+    json_file = sys.argv[sys.argv.index("--json") + 1] if "--json" in sys.argv[1:] else None
+    if "--benchmark" in sys.argv[1:]:
+        demonstrate_numpy_speed(sizes=(1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000),
+                                max_seconds=5.0, json_file=json_file)
+    elif "--scaling" in sys.argv[1:]:
+        demonstrate_thread_scaling(json_file=json_file)
+    else:
+        main()